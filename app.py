@@ -1,7 +1,17 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import os
+import time
+import uuid
 from mojo_validator.engine import ValidatorEngine
+from mojo_validator.config_loader import get_registry
+from mojo_validator.delta import DeltaIndex
+from mojo_validator.result_cache import ResultCache, content_key
+from mojo_validator.issue_index import IssueIndex
+from mojo_validator.export import CSV_MIME, XLSX_MIME, ExportCache
+from mojo_validator.jobs import ValidationJob
+from mojo_validator import metrics
 import io
 import base64
 from pathlib import Path
@@ -59,26 +69,79 @@ st.markdown("""
 
 # Initialize Engine
 CONFIG_DIR = os.path.join(os.getcwd(), "configs")
-os.makedirs(".tmp", exist_ok=True)
-engine = ValidatorEngine(CONFIG_DIR)
+
+@st.cache_resource
+def get_engine():
+    """One engine per process, shared by every session and rerun."""
+    # Process-wide registry: configs are parsed once and YAML edits are picked
+    # up without restarting the app
+    engine = ValidatorEngine(CONFIG_DIR, config_loader=get_registry(CONFIG_DIR))
+    # Re-upload snapshots of every session, capped at MOJO_DELTA_CACHE_MB (default 128)
+    engine.deltas = DeltaIndex(max_bytes=int(os.environ.get("MOJO_DELTA_CACHE_MB", 128)) * 1024 * 1024)
+    return engine
+
+@st.cache_resource
+def get_result_cache():
+    """Validation results shared across sessions, capped at MOJO_RESULT_CACHE_MB (default 512)."""
+    return ResultCache(max_bytes=int(os.environ.get("MOJO_RESULT_CACHE_MB", 512)) * 1024 * 1024)
+
+@st.cache_resource
+def start_metrics_server():
+    """Serve OpenMetrics at :MOJO_METRICS_PORT/metrics, once per process (off when unset)."""
+    port = os.environ.get("MOJO_METRICS_PORT")
+    return metrics.serve(int(port), host=os.environ.get("MOJO_METRICS_HOST", "127.0.0.1")) if port else None
+
+start_metrics_server()
+engine = get_engine()
+result_cache = get_result_cache()
+
+# Row groups shown per page in the Issues Report
+ISSUE_PAGE_SIZES = [10, 25, 50, 100]
+
+# Data Preview paging and row filters
+PREVIEW_PAGE_SIZES = [50, 100, 500, 1000]
+PREVIEW_FILTERS = ["All rows", "Rows with issues", "Changed cells only"]
+# While a validation runs in the background: seconds between progress
+# refreshes, and partial issues shown in the live table
+JOB_POLL_SECONDS = 0.5
+LIVE_ISSUE_ROWS = 50
 
 # --- Session State Management ---
 if 'processed_file' not in st.session_state:
     st.session_state.processed_file = None
+    st.session_state.upload_key = None  # (upload id, platform override) last validated
     st.session_state.raw_df = None
-    st.session_state.verified_df = None
-    st.session_state.issues = []
-    st.session_state.handled = {}  # issue_id -> status
-    st.session_state.deleted_rows = set()
+    st.session_state.fixes = None  # FixOverlay of edits on top of raw_df
+    # IssueIndex: issues by row/severity plus handled state and deleted rows,
+    # updated incrementally by the action handlers
+    st.session_state.issue_index = None
+    st.session_state.exports = ExportCache()
     st.session_state.platform = "Unknown"
     st.session_state.severity_filter = "All"
+    # Background ValidationJob for the upload being analyzed, keyed like
+    # upload_key, plus the ResultCache key its result is stored under
+    st.session_state.job = None
+    st.session_state.job_key = None
+    st.session_state.job_cache_key = None
+    # Scopes this session's re-upload snapshots in the shared engine
+    st.session_state.delta_session = uuid.uuid4().hex
 
 def reset_state():
-    for key in ['raw_df', 'verified_df', 'issues', 'handled', 'deleted_rows', 'platform']:
-        if key == 'handled': st.session_state[key] = {}
-        elif key == 'deleted_rows': st.session_state[key] = set()
-        elif key == 'issues': st.session_state[key] = []
-        else: st.session_state[key] = None
+    st.session_state.issue_page = 1
+    st.session_state.exports = ExportCache()
+    for key in ['raw_df', 'fixes', 'issue_index', 'platform']:
+        st.session_state[key] = None
+
+def load_validation(result, fixes, raw_df, file_name, upload_key):
+    """Make a finished validation the one the dashboard shows."""
+    st.session_state.raw_df = raw_df
+    st.session_state.fixes = fixes
+    st.session_state.issue_index = IssueIndex(result.issues)
+    st.session_state.platform = result.platform
+    st.session_state.processed_file = file_name
+    st.session_state.upload_key = upload_key
+    st.session_state.job = None
+    st.session_state.job_key = None
 
 # --- Action Handlers ---
 def handle_fix(issue):
@@ -87,27 +150,24 @@ def handle_fix(issue):
         # Handle smart truncation suggestions (quoted text)
         if issue.suggested_fix.startswith('"') and issue.suggested_fix.endswith('"'):
             fixed_value = issue.suggested_fix[1:-1]  # Remove quotes
-            st.session_state.verified_df.at[issue.row_idx, issue.column] = fixed_value
+            st.session_state.fixes.set(issue.row_idx, issue.column, fixed_value)
         elif "Change to one of" in issue.suggested_fix:
             # Extract first suggested value
             suggested_values = issue.suggested_fix.split('[')[1].split(']')[0]
             first_value = suggested_values.split(',')[0].strip().strip("'\"")
-            st.session_state.verified_df.at[issue.row_idx, issue.column] = first_value
+            st.session_state.fixes.set(issue.row_idx, issue.column, first_value)
     
-    st.session_state.handled[issue.issue_id] = "fixed"
+    st.session_state.issue_index.mark(issue.issue_id, "fixed")
 
 def handle_ignore(issue):
-    st.session_state.handled[issue.issue_id] = "ignored"
+    st.session_state.issue_index.mark(issue.issue_id, "ignored")
 
 def handle_remove_row(row_idx):
-    st.session_state.deleted_rows.add(row_idx)
-    for issue in st.session_state.issues:
-        if issue.row_idx == row_idx:
-            st.session_state.handled[issue.issue_id] = "removed"
+    st.session_state.issue_index.remove_row(row_idx)
 
 def handle_override(issue, new_value):
-    st.session_state.verified_df.at[issue.row_idx, issue.column] = new_value
-    st.session_state.handled[issue.issue_id] = "overridden"
+    st.session_state.fixes.set(issue.row_idx, issue.column, new_value)
+    st.session_state.issue_index.mark(issue.issue_id, "overridden")
 
 def get_download_link(df, filename, file_format="csv"):
     """Generate download link for dataframe."""
@@ -153,8 +213,10 @@ with st.sidebar:
     
     st.divider()
     
+    index = st.session_state.issue_index
+    
     # Severity Filter
-    if st.session_state.issues:
+    if index:
         st.subheader("🔍 Filter Issues")
         severity_options = ["All", "BLOCKER", "WARNING"]
         st.session_state.severity_filter = st.radio(
@@ -166,10 +228,10 @@ with st.sidebar:
         st.divider()
     
     # Stats
-    if st.session_state.issues:
+    if index:
         st.subheader("📊 Quick Stats")
-        blockers = sum(1 for i in st.session_state.issues if i.severity == "BLOCKER")
-        warnings = sum(1 for i in st.session_state.issues if i.severity == "WARNING")
+        blockers = index.severity_counts["BLOCKER"]
+        warnings = index.severity_counts["WARNING"]
         
         st.metric("🔴 Blockers", blockers)
         st.metric("⚠️ Warnings", warnings)
@@ -346,42 +408,81 @@ with main_tabs[0]:
     )
     
     if uploaded_file:
-        if st.session_state.processed_file != uploaded_file.name:
-            with st.spinner("🔍 Analyzing file..."):
+        # Only a new upload or a different platform override reaches the engine;
+        # button clicks rerun the script but leave this key unchanged
+        upload_key = (getattr(uploaded_file, "file_id", uploaded_file.name), override_val)
+        if st.session_state.upload_key != upload_key:
+            if st.session_state.job_key != upload_key:
                 reset_state()
-                tmp_path = os.path.join(".tmp", uploaded_file.name)
-                with open(tmp_path, "wb") as f:
-                    f.write(uploaded_file.getbuffer())
-                
-                result, verified_df = engine.validate_file(tmp_path, platform_override=override_val)
-                st.session_state.raw_df = pd.read_csv(tmp_path) if uploaded_file.name.endswith('.csv') else pd.read_excel(tmp_path)
-                st.session_state.verified_df = st.session_state.raw_df.copy()
-                st.session_state.issues = result.issues
-                st.session_state.platform = result.platform
-                st.session_state.processed_file = uploaded_file.name
+                content = uploaded_file.getvalue()
+                engine.config_loader.refresh()
+                cache_key = content_key(content, override_val, engine.config_loader.generation)
+                # Identical bytes validated in any session are reused as-is
+                cached = result_cache.get(cache_key)
+                if cached is not None:
+                    load_validation(*cached, uploaded_file.name, upload_key)
+                    st.rerun()
+                # Otherwise parse the upload straight from memory on a worker
+                # thread, so this script keeps rendering progress meanwhile.
+                # Re-uploads of the same file name in this session only recheck changed rows
+                st.session_state.job = ValidationJob(
+                    engine.validate_bytes, content, uploaded_file.name, platform_override=override_val,
+                    delta_key=(st.session_state.delta_session, uploaded_file.name)
+                ).start()
+                st.session_state.job_key = upload_key
+                st.session_state.job_cache_key = cache_key
+            
+            job = st.session_state.job
+            if job.done:
+                if job.error is not None:
+                    # Forget the failed job so the next run (e.g. a re-upload
+                    # of the same file) validates again instead of showing this
+                    st.session_state.job = None
+                    st.session_state.job_key = None
+                    st.session_state.job_cache_key = None
+                    st.error(f"❌ Validation failed: {job.error}")
+                    st.stop()
+                result, fixes, raw_df = job.result()
+                result_cache.put(st.session_state.job_cache_key, result, fixes)
+                load_validation(result, fixes, raw_df, uploaded_file.name, upload_key)
                 st.rerun()
+            
+            # Still running: show live progress and the issues found so far
+            stage = job.stage.replace("_", " ")
+            partial = job.snapshot()
+            st.progress(
+                job.fraction,
+                text=f"🔍 Analyzing file... {stage}: {job.rows_processed}/{job.total_rows} rows, "
+                     f"{len(partial)} issues so far",
+            )
+            if partial:
+                st.dataframe(
+                    pd.DataFrame([
+                        {"Row": i.row_idx + 1, "Severity": i.severity, "Column": i.column, "Message": i.message}
+                        for i in partial[:LIVE_ISSUE_ROWS]
+                    ]),
+                    use_container_width=True,
+                    hide_index=True,
+                )
+            time.sleep(JOB_POLL_SECONDS)
+            st.rerun()
         
         # --- Calculate Metrics ---
-        pending_issues = [
-            i for i in st.session_state.issues 
-            if i.issue_id not in st.session_state.handled 
-            and i.row_idx not in st.session_state.deleted_rows
-        ]
-        
-        # Apply severity filter
-        if st.session_state.severity_filter != "All":
-            pending_issues = [i for i in pending_issues if i.severity == st.session_state.severity_filter]
+        # All counts come straight from the index; nothing rescans the issues
+        index = st.session_state.issue_index
+        severity = None if st.session_state.severity_filter == "All" else st.session_state.severity_filter
+        pending_count = index.pending_count(severity)
+        pending_row_count = index.pending_row_count(severity)
         
         total_rows = len(st.session_state.raw_df)
-        active_rows_count = total_rows - len(st.session_state.deleted_rows)
-        rows_with_pending = set(i.row_idx for i in pending_issues)
-        clean_active_rows = active_rows_count - len(rows_with_pending)
+        active_rows_count = total_rows - len(index.deleted_rows)
+        clean_active_rows = active_rows_count - pending_row_count
         
         # --- Display Metrics ---
         col1, col2, col3, col4 = st.columns(4)
         col1.metric("📄 Total Rows", total_rows)
         col2.metric("✅ Clean Ads", clean_active_rows, delta=f"{int(clean_active_rows/total_rows*100)}%")
-        col3.metric("⚠️ Issues", len(pending_issues))
+        col3.metric("⚠️ Issues", pending_count)
         col4.metric("🎯 Platform", st.session_state.platform)
         
         st.divider()
@@ -391,28 +492,33 @@ with main_tabs[0]:
         
         # SUB TAB 1: Issues Report
         with sub_tabs[0]:
-            if pending_issues:
-                st.markdown(f"### Found {len(pending_issues)} issues in {len(rows_with_pending)} ads")
+            if pending_count:
+                st.markdown(f"### Found {pending_count} issues in {pending_row_count} ads")
                 
                 # Progress bar
-                progress = len(st.session_state.handled) / max(len(st.session_state.issues), 1)
-                st.progress(progress, text=f"Progress: {len(st.session_state.handled)}/{len(st.session_state.issues)} issues handled")
+                progress = index.handled_count / max(len(index), 1)
+                st.progress(progress, text=f"Progress: {index.handled_count}/{len(index)} issues handled")
                 
-                # Group issues by row
-                from collections import defaultdict
-                grouped_issues = defaultdict(list)
-                for issue in pending_issues:
-                    grouped_issues[issue.row_idx].append(issue)
+                # Page through the index's row buckets, so a rerun only renders
+                # one page of widgets whatever the issue count
+                page_col, size_col = st.columns([3, 1])
+                with size_col:
+                    page_size = st.selectbox("Rows per page", ISSUE_PAGE_SIZES, index=1, key="issue_page_size")
+                page_count = max(1, -(-pending_row_count // page_size))
+                if st.session_state.get("issue_page", 1) > page_count:
+                    st.session_state.issue_page = page_count
+                with page_col:
+                    page = st.number_input("Page", min_value=1, max_value=page_count, step=1, key="issue_page")
+                    st.caption(f"Page {page} of {page_count} ({pending_row_count} ads)")
                 
                 # Display issues
-                for row_idx in sorted(grouped_issues.keys()):
-                    issues_for_row = grouped_issues[row_idx]
+                for row_idx in index.pending_rows(severity, (page - 1) * page_size, page * page_size):
+                    issues_for_row = index.pending_in_row(row_idx, severity)
                     
                     with st.expander(f"**Row {row_idx + 1}** - {len(issues_for_row)} issue(s)", expanded=True):
-                        # Show row data
-                        st.markdown("**Current Row Data:**")
-                        row_data = st.session_state.verified_df.iloc[row_idx].to_dict()
-                        st.json(row_data, expanded=False)
+                        # Row data is only serialized when asked for
+                        if st.checkbox("Show current row data", key=f"rowjson_{row_idx}"):
+                            st.json(st.session_state.fixes.row(row_idx), expanded=False)
                         
                         st.divider()
                         
@@ -459,50 +565,78 @@ with main_tabs[0]:
             st.subheader("Verified Data Preview")
             
             # Filter options
+            preview_filter = st.radio("Show", PREVIEW_FILTERS, horizontal=True, key="preview_filter")
             show_deleted = st.checkbox("Show deleted rows", value=False)
+            page_size = st.selectbox("Rows per page", PREVIEW_PAGE_SIZES, index=1, key="preview_page_size")
             
-            if show_deleted:
-                display_df = st.session_state.verified_df
+            if preview_filter == "Changed cells only":
+                # One line per changed cell; O(changes), independent of the sheet size
+                preview_df = st.session_state.fixes.diff()
+                total = len(preview_df)
             else:
-                display_df = st.session_state.verified_df.drop(list(st.session_state.deleted_rows))
+                # Select rows with a boolean mask over the base frame (no copy) and
+                # only materialize the visible page
+                only_rows = index.pending_rows() if preview_filter == "Rows with issues" else None
+                drop_rows = None if show_deleted else index.deleted_rows
+                positions = np.flatnonzero(st.session_state.fixes.keep_mask(drop_rows, only_rows))
+                total = len(positions)
             
-            st.dataframe(display_df, use_container_width=True, height=400)
+            page_count = max(1, -(-total // page_size))
+            if st.session_state.get("preview_page", 1) > page_count:
+                st.session_state.preview_page = page_count
+            page = st.number_input("Page", min_value=1, max_value=page_count, step=1, key="preview_page")
+            start, stop = (page - 1) * page_size, page * page_size
             
-            st.info(f"📊 Showing {len(display_df)} rows (deleted: {len(st.session_state.deleted_rows)})")
+            if preview_filter == "Changed cells only":
+                st.dataframe(preview_df.iloc[start:stop], use_container_width=True, height=400)
+                st.info(f"✏️ {total} cells changed")
+            else:
+                labels = st.session_state.raw_df.index[positions[start:stop]]
+                st.dataframe(st.session_state.fixes.window(labels), use_container_width=True, height=400)
+                st.info(f"📊 Showing rows {min(start + 1, total)}-{min(stop, total)} of {total} "
+                        f"(deleted: {len(index.deleted_rows)})")
         
         # SUB TAB 3: Download
         with sub_tabs[2]:
             st.subheader("📥 Download Results")
             
-            # Prepare final dataframe (exclude deleted rows)
-            final_df = st.session_state.verified_df.drop(list(st.session_state.deleted_rows))
+            # Exports are built only on request and reused until the data changes:
+            # fixes.version moves on every edit, deleted rows only ever grow
+            deleted_rows = st.session_state.issue_index.deleted_rows
+            data_version = (st.session_state.fixes.version, len(deleted_rows))
+            exports = st.session_state.exports
             
             col_a, col_b = st.columns(2)
             
             with col_a:
                 st.markdown("**📄 Download as CSV**")
-                csv = final_df.to_csv(index=False)
-                st.download_button(
-                    label="Download CSV",
-                    data=csv,
-                    file_name=f"validated_{st.session_state.processed_file.replace('.xlsx', '.csv')}",
-                    mime="text/csv",
-                    use_container_width=True
-                )
+                csv = exports.get('csv', data_version)
+                if csv is None and st.button("Prepare CSV", use_container_width=True):
+                    with st.spinner("Building CSV..."):
+                        csv = exports.build('csv', data_version, st.session_state.fixes, deleted_rows)
+                if csv is not None:
+                    st.download_button(
+                        label="Download CSV",
+                        data=csv,
+                        file_name=f"validated_{st.session_state.processed_file.replace('.xlsx', '.csv')}",
+                        mime=CSV_MIME,
+                        use_container_width=True
+                    )
             
             with col_b:
                 st.markdown("**📊 Download as Excel**")
-                output = io.BytesIO()
-                with pd.ExcelWriter(output, engine='openpyxl') as writer:
-                    final_df.to_excel(writer, index=False, sheet_name='Validated Ads')
-                
-                st.download_button(
-                    label="Download Excel",
-                    data=output.getvalue(),
-                    file_name=f"validated_{st.session_state.processed_file}",
-                    mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                    use_container_width=True
-                )
+                xlsx = exports.get('xlsx', data_version)
+                if xlsx is None and st.button("Prepare Excel", use_container_width=True):
+                    with st.spinner("Building Excel workbook..."):
+                        xlsx = exports.build('xlsx', data_version, st.session_state.fixes, deleted_rows)
+                if xlsx is not None:
+                    st.download_button(
+                        label="Download Excel",
+                        data=xlsx,
+                        file_name=f"validated_{st.session_state.processed_file}",
+                        mime=XLSX_MIME,
+                        use_container_width=True
+                    )
             
             st.divider()
             
@@ -512,9 +646,9 @@ with main_tabs[0]:
             - **Platform Detected**: {st.session_state.platform}
             - **Total Rows**: {total_rows}
             - **Clean Rows**: {clean_active_rows}
-            - **Issues Found**: {len(st.session_state.issues)}
-            - **Issues Resolved**: {len(st.session_state.handled)}
-            - **Rows Deleted**: {len(st.session_state.deleted_rows)}
+            - **Issues Found**: {len(index)}
+            - **Issues Resolved**: {index.handled_count}
+            - **Rows Deleted**: {len(st.session_state.issue_index.deleted_rows)}
             """
             st.markdown(summary_text)
 
@@ -0,0 +1,51 @@
+"""
+Mojo Validator: bulk ad file validation and fixing.
+
+Importing the package is cheap. The public classes below are resolved on
+first access, and modules import pandas and numpy inside the functions that
+use them, so they are only loaded once a code path actually touches a
+DataFrame.
+"""
+
+__version__ = "2.0.0"
+
+# Public name -> defining module, imported on first attribute access
+_EXPORTS = {
+    'ValidatorEngine': 'engine',
+    'SUPPORTED_PLATFORMS': 'engine',
+    'ConfigLoader': 'config_loader',
+    'ConfigRegistry': 'config_loader',
+    'get_registry': 'config_loader',
+    'FixOverlay': 'fix_overlay',
+    'Issue': 'models',
+    'SummaryStats': 'models',
+    'ValidationResult': 'models',
+    'ValidationProfile': 'models',
+    'ValidatorPool': 'worker_pool',
+    'ResultCache': 'result_cache',
+    'ValidationJob': 'jobs',
+    'ValidationProgress': 'models',
+    'ValidationHook': 'hooks',
+    'StageTimings': 'hooks',
+    'Pipeline': 'pipeline',
+    'Stage': 'pipeline',
+    'ValidationContext': 'pipeline',
+    'QuickScanResult': 'models',
+    'DeltaIndex': 'delta',
+}
+
+__all__ = ['__version__', *_EXPORTS]
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        import importlib
+        module = importlib.import_module(f".{_EXPORTS[name]}", __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_EXPORTS))
@@ -0,0 +1,352 @@
+"""
+mojo-validate: command-line batch validator.
+
+Validates many bulk files concurrently on a process pool. While the workers
+validate, the next file is read from disk on a background thread so I/O and
+validation overlap. For every input file it writes a JSONL issue stream (and,
+with --auto-fix, the fixed file), then an aggregate summary.json.
+
+Usage:
+    python -m mojo_validator.cli samples/*.csv "exports/**/*.xlsx" -o out/ -j 4
+
+Exit codes:
+    0  no blockers found
+    1  at least one file has blocker issues (see --fail-on)
+    2  at least one file could not be read or validated
+"""
+
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from . import metrics
+from .pipeline import TIERS
+from .profiling import PROFILE_ENV
+from .worker_pool import ValidatorPool, get_worker_engine
+
+SUPPORTED_EXTENSIONS = ('.csv', '.xls', '.xlsx')
+
+EXIT_OK = 0
+EXIT_BLOCKERS = 1
+EXIT_ERROR = 2
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="mojo-validate",
+        description="Validate bulk ad files (CSV/Excel) against platform configs.",
+    )
+    parser.add_argument("paths", nargs="+", help="Files, directories or glob patterns (quote globs to expand recursively with **)")
+    parser.add_argument("-c", "--config-dir", default="configs", help="Directory holding the platform YAML configs (default: configs)")
+    parser.add_argument("-p", "--platform", default=None, help="Platform override, skips auto-detection (e.g. \"Google Ads\")")
+    parser.add_argument("-o", "--output-dir", default="validation_output", help="Where issue streams, fixed files and summary.json are written")
+    parser.add_argument("-j", "--workers", type=int, default=os.cpu_count() or 1, help="Number of worker processes (default: CPU count)")
+    parser.add_argument("--auto-fix", action="store_true", help="Apply auto_apply fixes and write <name>.fixed.<ext>")
+    parser.add_argument("--tier", choices=TIERS, default=None,
+                        help="Validation depth: fast (blockers only), standard (adds text warnings) or deep "
+                             "(adds pattern and duplicate detection). Default: the platform config's tier, else deep")
+    parser.add_argument("--max-issues", type=int, default=None,
+                        help="Stop validating a file after this many issues (its summary is marked partial)")
+    parser.add_argument("--stop-on-first-blocker", action="store_true",
+                        help="Stop validating a file at its first blocker")
+    parser.add_argument("--deadline", type=float, default=None,
+                        help="Per-file time budget in seconds; validation stops there and reports what it covered")
+    parser.add_argument("--fail-on", choices=["blocker", "warning", "never"], default="blocker",
+                        help="Issue severity that makes the exit code non-zero (default: blocker)")
+    parser.add_argument("--profile-rules", action="store_true",
+                        help="Record per-rule timings and hit counts in summary.json")
+    parser.add_argument("--profile", action="store_true",
+                        help=f"Run each file under cProfile/tracemalloc and write <name>.prof and "
+                             f"<name>.memory.json to the output dir (also enabled by ${PROFILE_ENV})")
+    parser.add_argument("--metrics-file", default=None,
+                        help="Write throughput, latency and cache metrics for the run to this file (OpenMetrics text)")
+    parser.add_argument("-q", "--quiet", action="store_true", help="Only print the final summary line")
+    return parser
+
+
+def expand_paths(patterns: List[str]) -> List[str]:
+    """Expand files, directories and glob patterns into a de-duplicated list of supported files."""
+    files: List[str] = []
+    seen = set()
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            matches = sorted(
+                os.path.join(pattern, name) for name in os.listdir(pattern)
+                if name.lower().endswith(SUPPORTED_EXTENSIONS)
+            )
+        elif glob.has_magic(pattern):
+            matches = sorted(glob.glob(pattern, recursive=True))
+        else:
+            matches = [pattern]
+
+        for path in matches:
+            if os.path.isdir(path) or not path.lower().endswith(SUPPORTED_EXTENSIONS):
+                continue
+            key = os.path.abspath(path)
+            if key not in seen:
+                seen.add(key)
+                files.append(path)
+    return files
+
+
+def output_stems(paths: List[str]) -> Dict[str, str]:
+    """Give every input file a unique output name stem (file name, de-duplicated)."""
+    stems: Dict[str, str] = {}
+    used = set()
+    for path in paths:
+        base = os.path.splitext(os.path.basename(path))[0]
+        stem, n = base, 1
+        while stem in used:
+            n += 1
+            stem = f"{base}_{n}"
+        used.add(stem)
+        stems[path] = stem
+    return stems
+
+
+def _read_file(path: str) -> Tuple[str, Optional[bytes], Optional[str]]:
+    try:
+        with open(path, 'rb') as f:
+            return path, f.read(), None
+    except OSError as e:
+        return path, None, str(e)
+
+
+def _jsonable(value: Any) -> Any:
+    """Make a cell value JSON-safe (NaN -> null, numpy scalars -> Python)."""
+    if value is None or isinstance(value, (str, bool, int)):
+        return value
+    if hasattr(value, 'item'):
+        value = value.item()
+    if isinstance(value, float):
+        return None if value != value else value
+    return str(value)
+
+
+def _validate_one(path: str, data: bytes, stem: str, options: Dict[str, Any]) -> Dict[str, Any]:
+    """Validate one file and write its outputs. Runs inside a worker process."""
+    started = time.perf_counter()
+    summary: Dict[str, Any] = {'file': path, 'error': None}
+    if options.get('metrics'):
+        metrics.enable()
+    try:
+        engine = get_worker_engine(options['config_dir'])
+        result, fixes, raw_df = engine.validate_bytes(
+            data, path, platform_override=options['platform'], auto_fix=options['auto_fix'],
+            profile_rules=options.get('profile_rules', False),
+            tier=options.get('tier'),
+            max_issues=options.get('max_issues'),
+            stop_on_first_blocker=options.get('stop_on_first_blocker', False),
+            deadline=options.get('deadline'),
+            # Profiles go next to this file's other outputs ("" = off)
+            profile_path=os.path.join(options['output_dir'], stem) if options.get('profile') else "",
+        )
+
+        output_dir = options['output_dir']
+        issues_path = os.path.join(output_dir, f"{stem}.issues.jsonl")
+        with open(issues_path, 'w', encoding='utf-8') as f:
+            for issue in result.issues:
+                record = issue.model_dump()
+                record['original_value'] = _jsonable(record['original_value'])
+                record['file'] = path
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        summary['issues_file'] = issues_path
+
+        if options['auto_fix']:
+            ext = os.path.splitext(path)[1].lower()
+            fixed_path = os.path.join(output_dir, f"{stem}.fixed{'.csv' if ext == '.csv' else '.xlsx'}")
+            fixed_df = fixes.to_frame()
+            if ext == '.csv':
+                fixed_df.to_csv(fixed_path, index=False)
+            else:
+                fixed_df.to_excel(fixed_path, index=False)
+            summary['fixed_file'] = fixed_path
+            summary['cells_fixed'] = len(fixes)
+
+        summary.update({
+            'platform': result.platform,
+            'tier': result.tier,
+            'total_rows': result.summary.total_rows,
+            'rows_with_issues': result.summary.rows_with_issues,
+            'total_issues': result.summary.total_issues,
+            'blockers': result.summary.severity_counts.get('BLOCKER', 0),
+            'warnings': result.summary.severity_counts.get('WARNING', 0),
+        })
+        if result.partial:
+            summary.update({
+                'partial': True,
+                'rows_validated': result.rows_validated,
+                'stop_reason': result.stop_reason,
+            })
+        if result.profile is not None:
+            summary['rule_profile'] = [stat.model_dump() for stat in result.profile.slowest(None)]
+    except Exception as e:
+        summary['error'] = f"{type(e).__name__}: {e}"
+    summary['seconds'] = round(time.perf_counter() - started, 4)
+    if options.get('metrics'):
+        # This file's samples, merged into the parent's registry by main()
+        summary['metrics'] = metrics.REGISTRY.drain()
+    return summary
+
+
+def run_batch(paths: List[str], options: Dict[str, Any], workers: int = 1,
+              pool: Optional[ValidatorPool] = None) -> List[Dict[str, Any]]:
+    """
+    Validate files concurrently, prefetching the next file while workers are busy.
+
+    At most ``workers + 1`` files are held in memory at a time, so arbitrarily
+    long file lists can be streamed through. A file whose task fails (e.g. a
+    worker crash) is recorded as a failed file and the batch carries on; if
+    the crash broke the pool, a fresh pool validates the remaining files.
+
+    Args:
+        pool: Optional already-running ValidatorPool to reuse across batches;
+            otherwise one is started (and shut down) for this batch when workers > 1
+
+    Returns:
+        Per-file summaries, in input order
+    """
+    stems = output_stems(paths)
+    order = {path: i for i, path in enumerate(paths)}
+    results: List[Dict[str, Any]] = []
+    path_iter: Iterator[str] = iter(paths)
+
+    def schedule_read(reader: ThreadPoolExecutor) -> Optional[Future]:
+        path = next(path_iter, None)
+        return reader.submit(_read_file, path) if path is not None else None
+
+    owns_pool = pool is None and workers > 1
+    if owns_pool:
+        pool = ValidatorPool(options['config_dir'], workers=workers)
+    if pool is not None:
+        workers = pool.workers
+    try:
+        with ThreadPoolExecutor(max_workers=1) as reader:
+            next_read = schedule_read(reader)
+            # future -> (path, pool it was submitted to)
+            pending: Dict[Future, Tuple[str, ValidatorPool]] = {}
+            while next_read is not None or pending:
+                while next_read is not None and len(pending) <= workers:
+                    path, data, error = next_read.result()
+                    # Start reading the following file before handing this one off
+                    next_read = schedule_read(reader)
+                    if error is not None:
+                        results.append({'file': path, 'error': f"OSError: {error}", 'seconds': 0.0})
+                        _report(results[-1], options)
+                        continue
+                    if pool is None:
+                        results.append(_validate_one(path, data, stems[path], options))
+                        _report(results[-1], options)
+                        continue
+                    pending[pool.submit(_validate_one, path, data, stems[path], options)] = (path, pool)
+                if pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    broken = False
+                    for future in done:
+                        path, submitted_to = pending.pop(future)
+                        try:
+                            results.append(future.result())
+                        except Exception as e:
+                            results.append({'file': path, 'error': f"{type(e).__name__}: {e}", 'seconds': 0.0})
+                            broken = broken or (isinstance(e, BrokenProcessPool) and submitted_to is pool)
+                        _report(results[-1], options)
+                    if broken:
+                        # Files still in flight on the dead pool fail the same way
+                        # as they complete; the remaining files go to a fresh pool
+                        if owns_pool:
+                            pool.shutdown(wait=False)
+                        pool = ValidatorPool(options['config_dir'], workers=workers)
+                        owns_pool = True
+    finally:
+        if owns_pool:
+            pool.shutdown()
+
+    results.sort(key=lambda r: order[r['file']])
+    return results
+
+
+def _report(summary: Dict[str, Any], options: Dict[str, Any]):
+    if options.get('quiet'):
+        return
+    if summary['error']:
+        print(f"✗ {summary['file']}: {summary['error']}")
+    else:
+        print(f"{'✗' if summary['blockers'] else '✓'} {summary['file']}: {summary['platform']} | "
+              f"{summary['total_rows']} rows | {summary['blockers']} blockers, {summary['warnings']} warnings "
+              f"({summary['seconds']:.2f}s)")
+
+
+def aggregate(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Roll per-file summaries up into batch totals."""
+    ok = [r for r in results if not r['error']]
+    return {
+        'files': len(results),
+        'failed_files': len(results) - len(ok),
+        'total_rows': sum(r['total_rows'] for r in ok),
+        'total_issues': sum(r['total_issues'] for r in ok),
+        'blockers': sum(r['blockers'] for r in ok),
+        'warnings': sum(r['warnings'] for r in ok),
+        'files_with_blockers': sum(1 for r in ok if r['blockers']),
+    }
+
+
+def exit_code(totals: Dict[str, Any], fail_on: str) -> int:
+    if totals['failed_files']:
+        return EXIT_ERROR
+    if fail_on == 'blocker' and totals['blockers']:
+        return EXIT_BLOCKERS
+    if fail_on == 'warning' and (totals['blockers'] or totals['warnings']):
+        return EXIT_BLOCKERS
+    return EXIT_OK
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+
+    paths = expand_paths(args.paths)
+    if not paths:
+        print("No CSV or Excel files matched.", file=sys.stderr)
+        return EXIT_ERROR
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    options = {
+        'config_dir': os.path.abspath(args.config_dir),
+        'platform': args.platform,
+        'auto_fix': args.auto_fix,
+        'tier': args.tier,
+        'max_issues': args.max_issues,
+        'stop_on_first_blocker': args.stop_on_first_blocker,
+        'deadline': args.deadline,
+        'output_dir': args.output_dir,
+        'quiet': args.quiet,
+        'profile_rules': args.profile_rules,
+        'profile': args.profile or bool(os.environ.get(PROFILE_ENV)),
+        'metrics': args.metrics_file is not None,
+    }
+
+    started = time.perf_counter()
+    results = run_batch(paths, options, workers=max(1, min(args.workers, len(paths))))
+    totals = aggregate(results)
+    totals['seconds'] = round(time.perf_counter() - started, 4)
+    for result in results:
+        metrics.REGISTRY.merge(result.pop('metrics', {}))
+    if args.metrics_file:
+        metrics.REGISTRY.write(args.metrics_file)
+
+    summary_path = os.path.join(args.output_dir, "summary.json")
+    with open(summary_path, 'w', encoding='utf-8') as f:
+        json.dump({'totals': totals, 'files': results}, f, indent=2, ensure_ascii=False)
+
+    print(f"{totals['files']} files, {totals['total_rows']} rows: {totals['blockers']} blockers, "
+          f"{totals['warnings']} warnings, {totals['failed_files']} failed ({totals['seconds']:.2f}s) -> {summary_path}")
+    return exit_code(totals, args.fail_on)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
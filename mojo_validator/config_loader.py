@@ -1,36 +1,305 @@
-import yaml
+import glob
+import hashlib
 import os
-from typing import Dict, Any
+import pickle
+import tempfile
+import threading
+import time
+from typing import Dict, Any, Optional
+from . import __version__, metrics
+
+# Part of every cache key, so configs compiled by another release of the
+# engine are never reused
+ENGINE_VERSION = __version__
+
+
+def default_cache_dir() -> str:
+    """$MOJO_VALIDATOR_CACHE_DIR, else $XDG_CACHE_HOME/mojo_validator (~/.cache/mojo_validator)."""
+    if os.environ.get("MOJO_VALIDATOR_CACHE_DIR"):
+        return os.environ["MOJO_VALIDATOR_CACHE_DIR"]
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "mojo_validator")
+
+
+def _private_dir(path: str) -> bool:
+    """
+    Whether path is (or can be created as) a directory only we can write to.
+
+    Cache files are unpickled, so a directory someone else owns or can write
+    to (e.g. a shared path in MOJO_VALIDATOR_CACHE_DIR) must never be read.
+    """
+    try:
+        os.makedirs(path, mode=0o700, exist_ok=True)
+        stat = os.stat(path)
+    except OSError:
+        return False
+    if not hasattr(os, "getuid"):
+        return True
+    return stat.st_uid == os.getuid() and not stat.st_mode & 0o022
+
 
 class ConfigLoader:
-    def __init__(self, config_dir: str):
+    """
+    Loads platform YAML configs, optionally with an on-disk cache of parsed configs.
+
+    The cache is opt-in (the CLI and worker pool turn it on). Parsed configs
+    are pickled into cache_dir under a key made of the YAML content hash and
+    ENGINE_VERSION, so editing a YAML (or upgrading the engine) invalidates
+    its entry automatically. A small manifest of file mtimes/sizes lets
+    unchanged YAMLs skip even the read-and-hash step. A cache_dir that isn't
+    private to the current user is ignored.
+
+    Args:
+        config_dir: Directory holding the platform YAML configs
+        cache_dir: Where compiled configs are kept; giving one enables the cache
+        use_cache: Enable the cache in default_cache_dir() when no cache_dir is given
+    """
+
+    def __init__(self, config_dir: str, cache_dir: Optional[str] = None, use_cache: bool = False):
         self.config_dir = config_dir
         self.configs: Dict[str, Any] = {}
+        if cache_dir is None and use_cache:
+            cache_dir = default_cache_dir()
+        self.cache_dir = cache_dir if cache_dir is not None and _private_dir(cache_dir) else None
+        # platform name (the YAML's `platform:` key) -> config file path
+        self.platform_index: Optional[Dict[str, str]] = None
+        # platform name -> file each loaded config came from
+        self.sources: Dict[str, str] = {}
+        self._manifest: Optional[Dict[str, Any]] = None
+        self._manifest_dirty = False
 
     def load_platform_config(self, platform_name: str) -> Dict[str, Any]:
         """Loads configuration for a specific platform."""
+        file_path = self.find_config_file(platform_name)
+        if not file_path:
+            raise FileNotFoundError(f"Configuration for platform '{platform_name}' not found in {self.config_dir}")
+
+        config = self._read_config(file_path)
+        self._save_manifest()
+        self.configs[platform_name] = config
+        self.sources[platform_name] = file_path
+        return config
+
+    def find_config_file(self, platform_name: str) -> Optional[str]:
+        """Path of the YAML for a platform, or None if there is none."""
         # Check for exact name, snake_case, or platform key match
         possible_names = [
             platform_name.lower().replace(" ", "_"),
             platform_name.lower().split(" ")[0], # e.g. "linkedin" from "LinkedIn Ads"
         ]
-        
-        file_path = None
+
         for name in possible_names:
             p = os.path.join(self.config_dir, f"{name}.yaml")
             if os.path.exists(p):
-                file_path = p
-                break
-        
-        if not file_path:
-            raise FileNotFoundError(f"Configuration for platform '{platform_name}' not found in {self.config_dir}")
-            
-        with open(file_path, 'r') as f:
-            config = yaml.safe_load(f)
-            self.configs[platform_name] = config
-            return config
+                return p
+
+        # Fall back to the `platform:` key declared inside each YAML
+        if self.platform_index is None:
+            self._build_index()
+        return self.platform_index.get(platform_name)
 
     def get_config(self, platform_name: str) -> Dict[str, Any]:
         if platform_name not in self.configs:
             return self.load_platform_config(platform_name)
         return self.configs[platform_name]
+
+    def preload_all(self) -> Dict[str, str]:
+        """
+        Load every YAML in config_dir in one pass and build the platform index.
+
+        When several files declare the same platform, the one the filename
+        lookup in load_platform_config would pick wins.
+
+        Returns:
+            Mapping of platform name -> config file path
+        """
+        loaded = self._build_index()
+        for platform, file_path in self.platform_index.items():
+            if platform not in self.configs:
+                self.configs[platform] = loaded[platform]
+                self.sources[platform] = file_path
+        self._save_manifest()
+        return dict(self.platform_index)
+
+    def _build_index(self) -> Dict[str, Dict[str, Any]]:
+        """Read every YAML, set platform_index and return platform -> config."""
+        index: Dict[str, str] = {}
+        loaded: Dict[str, Dict[str, Any]] = {}
+        for file_path in sorted(glob.glob(os.path.join(self.config_dir, "*.yaml"))):
+            config = self._read_config(file_path)
+            stem = os.path.splitext(os.path.basename(file_path))[0]
+            platform = (config or {}).get('platform') or stem
+            preferred = stem == platform.lower().replace(" ", "_")
+            if platform not in index or preferred:
+                index[platform] = file_path
+                loaded[platform] = config
+        self.platform_index = index
+        return loaded
+
+    def _read_config(self, file_path: str) -> Dict[str, Any]:
+        """Parse one YAML, going through the compiled cache when enabled."""
+        if self.cache_dir is None:
+            import yaml
+            with open(file_path, 'r') as f:
+                return yaml.safe_load(f)
+
+        manifest = self._load_manifest()
+        key = os.path.abspath(file_path)
+        stat = os.stat(file_path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+
+        entry = manifest.get(key)
+        if entry is not None and entry['signature'] == signature:
+            config = self._load_compiled(entry['digest'])
+            if config is not None:
+                metrics.record_cache("config", True)
+                return config
+
+        with open(file_path, 'rb') as f:
+            source = f.read()
+        digest = hashlib.sha256(ENGINE_VERSION.encode() + b"\0" + source).hexdigest()
+        config = self._load_compiled(digest)
+        metrics.record_cache("config", config is not None)
+        if config is None:
+            # PyYAML is only imported on a cache miss
+            import yaml
+            config = yaml.safe_load(source)
+            self._write_atomic(os.path.join(self.cache_dir, f"{digest}.pickle"),
+                               {'engine_version': ENGINE_VERSION, 'config': config})
+        manifest[key] = {'signature': signature, 'digest': digest}
+        self._manifest_dirty = True
+        return config
+
+    def _load_compiled(self, digest: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(os.path.join(self.cache_dir, f"{digest}.pickle"), 'rb') as f:
+                entry = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return None
+        if entry.get('engine_version') != ENGINE_VERSION:
+            return None
+        return entry['config']
+
+    def _load_manifest(self) -> Dict[str, Any]:
+        if self._manifest is None:
+            try:
+                with open(os.path.join(self.cache_dir, "manifest.pickle"), 'rb') as f:
+                    self._manifest = pickle.load(f)
+            except (OSError, EOFError, pickle.UnpicklingError):
+                self._manifest = {}
+        return self._manifest
+
+    def _save_manifest(self):
+        if not self._manifest_dirty:
+            return
+        self._write_atomic(os.path.join(self.cache_dir, "manifest.pickle"), self._manifest)
+        self._manifest_dirty = False
+
+    def _write_atomic(self, path: str, payload: Any):
+        """Write a cache file via rename so concurrent processes never see half a file."""
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, path)
+        except OSError:
+            # A read-only or full cache dir only costs speed, never correctness
+            pass
+
+
+class ConfigRegistry(ConfigLoader):
+    """
+    Hot-reloading ConfigLoader for long-running processes (the Streamlit app).
+
+    At most every poll_interval seconds, get_config() stats the YAMLs in
+    config_dir. If any changed, the affected platforms are re-read (through
+    the compiled cache, so unchanged files are never reparsed) into a new
+    configs dict that then replaces the old one in a single assignment.
+    Validations already running keep the config dict they started with.
+
+    Use get_registry() to share one registry per config dir across the process.
+
+    Args:
+        config_dir: Directory holding the platform YAML configs
+        poll_interval: Minimum seconds between stat polls (0 = every call)
+    """
+
+    def __init__(self, config_dir: str, poll_interval: float = 2.0, **kwargs: Any):
+        super().__init__(config_dir, **kwargs)
+        self.poll_interval = poll_interval
+        # Bumped on every swap, handy for invalidating anything derived from configs
+        self.generation = 0
+        self._lock = threading.Lock()
+        self._stats = self._scan()
+        self._checked = time.monotonic()
+
+    def get_config(self, platform_name: str) -> Dict[str, Any]:
+        self.refresh()
+        return super().get_config(platform_name)
+
+    def refresh(self, force: bool = False) -> bool:
+        """
+        Reload configs whose YAML changed since the last poll.
+
+        Args:
+            force: Poll now even if poll_interval hasn't elapsed
+
+        Returns:
+            True if a new set of configs was swapped in
+        """
+        if not force and time.monotonic() - self._checked < self.poll_interval:
+            return False
+
+        with self._lock:
+            self._checked = time.monotonic()
+            stats = self._scan()
+            if stats == self._stats:
+                return False
+            changed = {path for path in stats.keys() | self._stats.keys() if stats.get(path) != self._stats.get(path)}
+
+            # New or renamed files can change which file a platform resolves to
+            self.platform_index = None
+            configs: Dict[str, Any] = {}
+            sources: Dict[str, str] = {}
+            for platform, config in list(self.configs.items()):
+                source = self.sources.get(platform)
+                if source is None or os.path.abspath(source) not in changed:
+                    # Unchanged (or injected in code): keep the same object
+                    configs[platform] = config
+                    if source is not None:
+                        sources[platform] = source
+                    continue
+                file_path = self.find_config_file(platform)
+                if file_path:
+                    configs[platform] = self._read_config(file_path)
+                    sources[platform] = file_path
+            self._save_manifest()
+
+            self.configs, self.sources = configs, sources
+            self._stats = stats
+            self.generation += 1
+            return True
+
+    def _scan(self) -> Dict[str, Any]:
+        """(mtime, size) of every YAML in config_dir."""
+        stats = {}
+        with os.scandir(self.config_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(".yaml"):
+                    stat = entry.stat()
+                    stats[os.path.abspath(entry.path)] = (stat.st_mtime_ns, stat.st_size)
+        return stats
+
+
+_REGISTRIES: Dict[str, ConfigRegistry] = {}
+_REGISTRIES_LOCK = threading.Lock()
+
+
+def get_registry(config_dir: str, poll_interval: float = 2.0) -> ConfigRegistry:
+    """Process-wide ConfigRegistry for config_dir (created on first use)."""
+    key = os.path.abspath(config_dir)
+    with _REGISTRIES_LOCK:
+        if key not in _REGISTRIES:
+            _REGISTRIES[key] = ConfigRegistry(key, poll_interval=poll_interval)
+        return _REGISTRIES[key]
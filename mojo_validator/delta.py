@@ -0,0 +1,272 @@
+"""
+Delta validation between successive uploads of the same file.
+
+Users typically fix a handful of rows and upload the whole sheet again.
+Validating with a delta_key (the file name, an upload or feed ID) keeps a
+snapshot of that file's last complete validation on the engine: a content
+hash per row, the row-rule issues and row-only pattern findings per distinct
+row content, and the dataset PatternStats. The next validation with the
+same key:
+
+- hashes its rows and runs the row rules only on rows whose content isn't
+  in the snapshot; unchanged rows get their previous issues, renumbered to
+  their new position
+- updates the PatternStats by removing the rows that went away and adding
+  the new ones, and re-runs only the pattern checks that compare a row
+  against those statistics
+- runs fixes, duplicate detection and the summary as usual
+
+Rows are matched by content rather than position, so inserted, deleted and
+reordered rows are carried over too, and sharing a key between different
+files only costs speed, never correctness. A snapshot is ignored when the
+platform, config, warning tier or column layout differs, and only complete
+(non-partial) runs replace it. Snapshots hold whole frames, so the index is
+capped by estimated bytes like ResultCache.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Dict, Hashable, List, Optional, Tuple
+
+from .models import Issue
+from .result_cache import _ISSUE_BYTES
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+# Default budget for all of an engine's snapshots together (least recently
+# validated files are dropped first)
+DEFAULT_MAX_BYTES = 128 * 1024 * 1024
+
+
+def row_hashes(df: "pd.DataFrame") -> "np.ndarray":
+    """64-bit content hash of every row of df (the index is not hashed)."""
+    import pandas as pd
+    return pd.util.hash_pandas_object(df, index=False).to_numpy()
+
+
+def _multiset_difference(old: "np.ndarray", new: "np.ndarray") -> Tuple["np.ndarray", "np.ndarray"]:
+    """
+    Positions of the rows of old whose content is gone from new, and of the
+    rows of new whose content is new, counting repeated contents.
+    """
+    import numpy as np
+    import pandas as pd
+    old_s, new_s = pd.Series(old), pd.Series(new)
+    # The first k rows with a content present k times in the other frame match up
+    old_rank = old_s.groupby(old_s).cumcount().to_numpy()
+    new_rank = new_s.groupby(new_s).cumcount().to_numpy()
+    in_new = new_s.value_counts().reindex(old, fill_value=0).to_numpy()
+    in_old = old_s.value_counts().reindex(new, fill_value=0).to_numpy()
+    return np.flatnonzero(old_rank >= in_new), np.flatnonzero(new_rank >= in_old)
+
+
+def _moved_issue(issue: Issue, idx) -> Issue:
+    """issue as raised on row idx."""
+    if issue.row_idx == idx:
+        return issue
+    return issue.model_copy(update={'issue_id': f"{idx}_{issue.column}_{issue.kind}", 'row_idx': idx})
+
+
+def _moved_findings(findings: List[Dict], idx) -> List[Dict]:
+    """Pattern detector findings of one row, as found on row idx."""
+    if not findings or findings[0]['row_idx'] == idx:
+        return findings
+    return [dict(finding, row_idx=idx) for finding in findings]
+
+
+class RowSnapshot:
+    """One file as of its last complete validation."""
+
+    def __init__(self, fingerprint: Tuple, config: Dict[str, Any], frame, hashes,
+                 row_issues: Dict[int, List[Issue]], pattern_rows: Dict[int, Tuple],
+                 pattern_stats=None):
+        """
+        Args:
+            fingerprint: Platform, warning tier and column layout validated with
+            config: The platform config (compared by identity, so a reload
+                invalidates the snapshot)
+            frame: The validated frame
+            hashes: row_hashes(frame)
+            row_issues: Row hash -> row-rule issues of a row with that content
+            pattern_rows: Row hash -> (url/text, intra-row) pattern findings;
+                empty unless the deep tier ran
+            pattern_stats: PatternStats of frame, or None if the deep tier didn't run
+        """
+        self.fingerprint = fingerprint
+        self.config = config
+        self.frame = frame
+        self.hashes = hashes
+        self.row_issues = row_issues
+        self.pattern_rows = pattern_rows
+        self.pattern_stats = pattern_stats
+
+
+def estimate_size(snapshot: RowSnapshot) -> int:
+    """Approximate memory held by a snapshot, in bytes."""
+    frame_bytes = int(snapshot.frame.memory_usage(index=True, deep=True).sum())
+    issues = sum(len(found) for found in snapshot.row_issues.values())
+    findings = sum(len(head) + len(intra_row) for head, intra_row in snapshot.pattern_rows.values())
+    return frame_bytes + snapshot.hashes.nbytes + (issues + findings) * _ISSUE_BYTES
+
+
+class DeltaIndex:
+    """
+    Thread-safe LRU of RowSnapshots by file key, with a total byte budget.
+
+    Args:
+        max_bytes: Drop least recently validated files beyond this estimated size
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        # key -> (snapshot, estimated bytes)
+        self._snapshots: "OrderedDict[Hashable, Tuple[RowSnapshot, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[RowSnapshot]:
+        with self._lock:
+            entry = self._snapshots.get(key)
+            if entry is None:
+                return None
+            self._snapshots.move_to_end(key)
+            return entry[0]
+
+    def put(self, key: Hashable, snapshot: RowSnapshot, nbytes: Optional[int] = None):
+        """Store a file's snapshot, dropping older ones to stay within max_bytes."""
+        nbytes = estimate_size(snapshot) if nbytes is None else nbytes
+        with self._lock:
+            self._pop(key)
+            if nbytes > self.max_bytes:
+                # Too large to keep; the file's next upload is validated in full
+                return
+            self._snapshots[key] = (snapshot, nbytes)
+            self.total_bytes += nbytes
+            while self.total_bytes > self.max_bytes:
+                _, (_, evicted) = self._snapshots.popitem(last=False)
+                self.total_bytes -= evicted
+
+    def _pop(self, key: Hashable):
+        entry = self._snapshots.pop(key, None)
+        if entry is not None:
+            self.total_bytes -= entry[1]
+
+    def discard(self, key: Hashable):
+        with self._lock:
+            self._pop(key)
+
+    def clear(self):
+        with self._lock:
+            self._snapshots.clear()
+            self.total_bytes = 0
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._snapshots
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._snapshots)
+
+
+class DeltaRun:
+    """Delta state of one validation run (ValidationContext.delta)."""
+
+    def __init__(self, index: DeltaIndex, key: Hashable):
+        self.index = index
+        self.key = key
+        self.previous: Optional[RowSnapshot] = None
+        self.hashes = None
+        self.row_issues: Dict[int, List[Issue]] = {}
+        self.pattern_rows: Dict[int, Tuple] = {}
+        self.pattern_stats = None
+        # Rows the row rules ran on (every row without a usable snapshot)
+        self.rows_revalidated = 0
+
+    @staticmethod
+    def _fingerprint(ctx) -> Tuple:
+        df = ctx.df
+        return (ctx.platform, ctx.runs_tier("standard"), tuple(df.columns), tuple(str(t) for t in df.dtypes))
+
+    def validate_rows(self, ctx, stop=None):
+        """
+        Row stage: run the row rules on new and changed rows only, and carry
+        over the issues of the others, appending to ctx.issues in row order.
+
+        Args:
+            stop: Optional limit check, called with the rows done after each row
+        """
+        import numpy as np
+        df = ctx.df
+        self.hashes = hashes = row_hashes(df)
+        previous = self.index.get(self.key)
+        if previous is not None and (previous.config is not ctx.config
+                                     or previous.fingerprint != self._fingerprint(ctx)):
+            previous = None
+        self.previous = previous
+        known = previous.row_issues if previous is not None else {}
+
+        changed = ~np.isin(hashes, np.fromiter(known, dtype=hashes.dtype, count=len(known)))
+        self.rows_revalidated = int(changed.sum())
+        fresh: Dict[Any, List[Issue]] = {}
+        if self.rows_revalidated:
+            for issue in ctx.engine._validate_rows(df[changed], ctx.config, None, ctx.profiler,
+                                                   warnings=ctx.runs_tier("standard")):
+                fresh.setdefault(issue.row_idx, []).append(issue)
+
+        issues, row_issues = ctx.issues, self.row_issues
+        total = len(df)
+        row_run = ctx.run if ctx.run is not None and ctx.run.row_interval else None
+        for n, (idx, h, is_changed) in enumerate(zip(df.index, hashes.tolist(), changed.tolist()), 1):
+            if is_changed:
+                found = fresh.get(idx, [])
+                row_issues.setdefault(h, found)
+            else:
+                row_issues[h] = known[h]
+                found = [_moved_issue(issue, idx) for issue in known[h]]
+            issues.extend(found)
+            if row_run is not None and (n % row_run.row_interval == 0 or n == total):
+                row_run.rows(n, total, issues)
+            if stop is not None and stop(n):
+                break
+
+    def detect_patterns(self, ctx, should_stop=None) -> List[Dict]:
+        """Pattern stage: update the previous statistics and reuse row-only findings."""
+        from .pattern_detector import PatternStats, detect_pattern_mismatches
+        df = ctx.df
+        if self.hashes is None:
+            # The row stage was replaced (e.g. sharded over a pool); no delta
+            return detect_pattern_mismatches(df, ctx.platform, ctx.profiler, should_stop)
+
+        hashes = self.hashes.tolist()
+        previous = self.previous
+        row_local: Dict[Any, Tuple] = {}
+        if previous is not None and previous.pattern_stats is not None:
+            stats = previous.pattern_stats.copy()
+            removed, added = _multiset_difference(previous.hashes, self.hashes)
+            if len(removed):
+                stats.remove(previous.frame.iloc[removed])
+            if len(added):
+                stats.add(df.iloc[added])
+            for idx, h in zip(df.index, hashes):
+                findings = previous.pattern_rows.get(h)
+                if findings is not None:
+                    row_local[idx] = (_moved_findings(findings[0], idx), _moved_findings(findings[1], idx))
+        else:
+            stats = PatternStats.from_frame(df)
+
+        output = detect_pattern_mismatches(df, ctx.platform, ctx.profiler, should_stop, stats, row_local)
+        self.pattern_stats = stats
+        self.pattern_rows = {h: row_local[idx] for idx, h in zip(df.index, hashes) if idx in row_local}
+        return output
+
+    def save(self, ctx):
+        """Keep this run as the file's snapshot for its next upload."""
+        if self.hashes is None:
+            return
+        self.index.put(self.key, RowSnapshot(
+            self._fingerprint(ctx), ctx.config, ctx.df, self.hashes,
+            self.row_issues, self.pattern_rows, self.pattern_stats,
+        ))
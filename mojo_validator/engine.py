@@ -1,19 +1,114 @@
-import pandas as pd
-from typing import List, Optional, Tuple, Dict, Any
-from .models import Issue, ValidationResult, SummaryStats
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Callable, Hashable, Iterable, List, Optional, Tuple, Dict, Any, Union, BinaryIO
+from .models import Issue, ValidationResult, SummaryStats, ValidationProgress, QuickScanResult
 from .config_loader import ConfigLoader
+from .delta import DeltaIndex, DeltaRun
+from .fix_overlay import FixOverlay
+from .hooks import HookRunner, ProgressHook, ValidationHook, make_runner
+from .rule_profile import RuleProfiler
+from .profiling import env_profile_path, profile_run
+from . import metrics
+from .pipeline import Pipeline, ValidationContext, default_pipeline
+from .truncation import smart_truncate, smart_truncate_many
 from .validation_utils import ValidationUtils, ImageVideoValidator
-from .pattern_detector import detect_pattern_mismatches
 import re
+from contextlib import nullcontext
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+# Platforms known to header detection, in tie-break order
+SUPPORTED_PLATFORMS = (
+    "Google Ads",
+    "Google Display Ads",
+    "Google Video Ads",
+    "Meta Ads",
+    "Meta Video Ads",
+    "Meta Stories & Reels Ads",
+    "LinkedIn Ads",
+    "LinkedIn Video Ads",
+    "Generic",
+)
+
+# Rows between progress_callback updates during the row loop
+PROGRESS_INTERVAL = 250
+
+ProgressCallback = Callable[[ValidationProgress], None]
 
 
 class ValidatorEngine:
-    def __init__(self, config_dir: str):
-        self.config_loader = ConfigLoader(config_dir)
+    """
+    Validates bulk upload sheets against the platform configs.
+
+    validate_file(), validate_bytes() and validate_dataframe() take the same
+    keyword-only run options:
+
+        progress_callback: Optional callable receiving ValidationProgress updates
+            (stage changes, and every PROGRESS_INTERVAL rows of the row loop)
+        hooks: Extra hooks for this call only, on top of the engine's
+        profile_rules: If True, attach per-rule timings and hit counts as result.profile
+        profile_path: Run under cProfile/tracemalloc and write <profile_path>.prof and
+            .memory.json (see profiling.py). Defaults from $MOJO_VALIDATOR_PROFILE; "" disables
+        pipeline: Stages to run instead of self.pipeline (see pipeline.py)
+        tier: "fast" (blockers only), "standard" (adds text warnings) or "deep"
+            (adds pattern and duplicate detection); default from the platform
+            config's ``tier`` key, else "deep"
+        max_issues: Stop once this many issues are found; the result keeps that many
+        stop_on_first_blocker: Stop as soon as a row (or stage) finds a blocker
+        deadline: Wall-clock budget in seconds, checked after every row and
+            between stages
+        delta_key: Identity of the file (e.g. its name); rows unchanged since the
+            last validation with the same key keep their issues instead of
+            being rechecked (see delta.py)
+    """
+
+    def __init__(self, config_dir: str, config_loader: Optional[ConfigLoader] = None):
+        """
+        Args:
+            config_dir: Directory holding the platform YAML configs
+            config_loader: Optional loader to share, e.g. a hot-reloading
+                ConfigRegistry from config_loader.get_registry()
+        """
+        self.config_loader = config_loader or ConfigLoader(config_dir)
         self.validation_utils = ValidationUtils()
         self.image_video_validator = ImageVideoValidator()
+        # Hooks receiving stage/progress events from every validation (see hooks.py)
+        self.hooks: List[ValidationHook] = []
+        # Stages every validation runs unless a call passes its own pipeline
+        self.pipeline: Pipeline = default_pipeline()
+        # Last validation of each file validated with a delta_key (see delta.py)
+        self.deltas = DeltaIndex()
+
+    def add_hook(self, hook: ValidationHook) -> ValidationHook:
+        """Register a hook for every validation run by this engine."""
+        self.hooks.append(hook)
+        return hook
+
+    def remove_hook(self, hook: ValidationHook):
+        self.hooks.remove(hook)
 
-    def validate_file(self, file_path: str, platform_override: Optional[str] = None, auto_fix: bool = False) -> Tuple[ValidationResult, pd.DataFrame]:
+    def warm_up(self) -> List[str]:
+        """
+        Load every supported platform config up front so the first validation
+        doesn't pay for YAML parsing. Used by long-lived workers.
+        
+        Returns:
+            Names of the platforms whose config was loaded
+        """
+        self.config_loader.preload_all()
+        loaded = []
+        for platform in SUPPORTED_PLATFORMS:
+            try:
+                self.config_loader.get_config(platform)
+            except FileNotFoundError:
+                continue
+            loaded.append(platform)
+        return loaded
+
+    def validate_file(self, file_path: str, platform_override: Optional[str] = None, auto_fix: bool = False,
+                      **options: Any) -> Tuple[ValidationResult, pd.DataFrame]:
         """
         Core pipeline to validate and fix a file.
         
@@ -21,36 +116,174 @@ class ValidatorEngine:
             file_path: Path to CSV or Excel file
             platform_override: Optional platform name to skip detection
             auto_fix: If True, automatically apply fixes (default: False for safety)
+            **options: Run options (see the class docstring)
         """
-        # Process ingestion
-        ext = file_path.split('.')[-1].lower()
-        if ext == 'csv':
-            df = pd.read_csv(file_path)
-        elif ext in ['xls', 'xlsx']:
-            df = pd.read_excel(file_path)
-        else:
-            raise ValueError(f"Unsupported file extension: {ext}")
-
-        # Detect platform if not overridden
-        platform = platform_override or self._detect_platform(df)
-        config = self.config_loader.get_config(platform)
+        ctx = self._run(file_path, source=file_path, filename=file_path,
+                        platform_override=platform_override, auto_fix=auto_fix, **options)
+        return ctx.result, ctx.fixes.to_frame()
 
-        issues = []
-        verified_df = df.copy()
+    def validate_bytes(self, buffer: Union[bytes, bytearray, memoryview, BinaryIO], filename: str,
+                       platform_override: Optional[str] = None, auto_fix: bool = False,
+                       **options: Any) -> Tuple[ValidationResult, FixOverlay, pd.DataFrame]:
+        """
+        Validate an uploaded file held in memory, without writing it to disk.
+        
+        Args:
+            buffer: Raw file contents (bytes or a binary file-like object)
+            filename: Original filename, used to pick the CSV or Excel parser
+            platform_override: Optional platform name to skip detection
+            auto_fix: If True, automatically apply fixes (default: False for safety)
+            **options: Run options (see the class docstring)
+            
+        Returns:
+            Tuple of (result, fixes, raw_df) where raw_df is the parsed upload and
+            fixes is a FixOverlay holding any auto-fixes on top of it
+        """
+        ctx = self._run(filename, source=buffer, filename=filename,
+                        platform_override=platform_override, auto_fix=auto_fix, **options)
+        return ctx.result, ctx.fixes, ctx.df
 
-        # Validation Loop
-        for idx, row in df.iterrows():
-            row_issues = self._validate_row(idx, row, config)
-            issues.extend(row_issues)
+    def validate_dataframe(self, df: pd.DataFrame, platform_override: Optional[str] = None,
+                           auto_fix: bool = False,
+                           **options: Any) -> Tuple[ValidationResult, FixOverlay, pd.DataFrame]:
+        """
+        Validate an already parsed DataFrame.
+        
+        Args:
+            df: Parsed bulk sheet (left unmodified)
+            platform_override: Optional platform name to skip detection
+            auto_fix: If True, automatically apply fixes (default: False for safety)
+            **options: Run options (see the class docstring)
             
-            # Apply Fixes to verified_df (only if auto_fix is True)
-            if auto_fix:
-                self._apply_fixes(idx, verified_df, row_issues, config)
+        Returns:
+            Tuple of (result, fixes, raw_df) where raw_df is ``df`` itself and
+            fixes is a FixOverlay holding any auto-fixes on top of it
+        """
+        ctx = self._run("dataframe", df=df, platform_override=platform_override, auto_fix=auto_fix, **options)
+        return ctx.result, ctx.fixes, df
+
+    def quick_scan(self, df: pd.DataFrame, sample_rows: Optional[int] = None, platform_override: Optional[str] = None,
+                   tier: Optional[str] = None, confidence: float = 0.95, seed: int = 0) -> QuickScanResult:
+        """
+        Estimate issue rates from a stratified random sample of df's rows.
+        
+        Much faster than a full validation on large files: only sample_rows
+        rows go through the row rules, and the result reports the estimated
+        share of rows hit per rule and column with confidence intervals,
+        plus example issues (see sampling.py).
         
-        # Pattern Mismatch Detection (high confidence data entry errors)
-        pattern_issues = detect_pattern_mismatches(df, platform)
+        Args:
+            df: Parsed bulk sheet (left unmodified)
+            sample_rows: Rows to validate (default: sampling.DEFAULT_SAMPLE_ROWS; the
+                whole file if it is smaller)
+            platform_override: Optional platform name to skip detection
+            tier: "fast" or "standard" row rules; default from the platform config
+            confidence: Confidence level of the intervals
+            seed: Random seed, so repeated scans of a file agree
+        """
+        from .sampling import quick_scan
+        return quick_scan(self, df, sample_rows, platform_override, tier, confidence, seed)
+
+    def _run(self, profile_name: str, *, df: Optional[pd.DataFrame] = None,
+             source: Union[str, bytes, BinaryIO, None] = None, filename: Optional[str] = None,
+             platform_override: Optional[str] = None, auto_fix: bool = False,
+             progress_callback: Optional[ProgressCallback] = None,
+             hooks: Iterable[ValidationHook] = (),
+             profile_rules: bool = False,
+             profile_path: Optional[str] = None,
+             pipeline: Optional[Pipeline] = None,
+             tier: Optional[str] = None,
+             max_issues: Optional[int] = None,
+             stop_on_first_blocker: bool = False,
+             deadline: Optional[float] = None,
+             delta_key: Optional[Hashable] = None) -> ValidationContext:
+        """
+        Build the context for one validate_* call and run it, under the
+        profiler if asked. The keyword options are the run options described
+        in the class docstring, plus the ValidationContext inputs.
+
+        Args:
+            profile_name: Names the $MOJO_VALIDATOR_PROFILE output (see env_profile_path)
+        """
+        if profile_path is None:
+            profile_path = env_profile_path(profile_name)
+        with profile_run(profile_path) if profile_path else nullcontext() as session:
+            if session is not None:
+                hooks = [*hooks, session.memory]
+            ctx = ValidationContext(self, df=df, source=source, filename=filename,
+                                    platform_override=platform_override, auto_fix=auto_fix,
+                                    run=self._hook_runner(hooks, progress_callback), tier=tier,
+                                    max_issues=max_issues, stop_on_first_blocker=stop_on_first_blocker,
+                                    deadline=deadline, delta=self._delta_run(delta_key))
+            return self._validate(ctx, profile_rules, pipeline)
+
+    def _hook_runner(self, hooks: Iterable[ValidationHook],
+                     progress_callback: Optional[ProgressCallback]) -> Optional[HookRunner]:
+        """Runner for the engine's and this call's hooks; None if there are none."""
+        hooks = [*self.hooks, *hooks]
+        if metrics.REGISTRY.enabled:
+            hooks.append(metrics.STAGE_HOOK)
+        if progress_callback is not None:
+            hooks.append(ProgressHook(progress_callback, PROGRESS_INTERVAL))
+        return make_runner(hooks)
+
+    def _delta_run(self, delta_key: Optional[Hashable]) -> Optional[DeltaRun]:
+        return DeltaRun(self.deltas, delta_key) if delta_key is not None else None
+
+    def _validate(self, ctx: ValidationContext, profile_rules: bool = False,
+                  pipeline: Optional[Pipeline] = None) -> ValidationContext:
+        """Run the pipeline over ctx; ctx.result and ctx.fixes hold the outcome."""
+        if profile_rules:
+            ctx.profiler = RuleProfiler()
+        (pipeline or self.pipeline).run(ctx)
+        if ctx.delta is not None and not ctx.result.partial:
+            ctx.delta.save(ctx)
+        if ctx.fixes is None:
+            # Fixes are recorded sparsely; the merged frame is only built on export
+            ctx.fixes = FixOverlay(ctx.df)
+        seconds = sum(t for stage, t in ctx.timings.items() if stage != "reading")
+        metrics.record_validation(ctx.platform, ctx.total_rows, ctx.result.issues, seconds)
+        return ctx
+
+    def _validate_rows(self, df: pd.DataFrame, config: Dict[str, Any],
+                       run: Optional[HookRunner] = None,
+                       profiler: Optional[RuleProfiler] = None,
+                       warnings: bool = True,
+                       issues: Optional[List[Issue]] = None,
+                       stop: Optional[Callable[[int], bool]] = None) -> List[Issue]:
+        """
+        Run the per-row validators over every row of df (or of a row shard).
         
-        # Convert pattern issues to Issue objects
+        Args:
+            warnings: If False, only the blocker checks run (the "fast" tier)
+            issues: List to append the issues to (default: a new one)
+            stop: Optional check called with the rows done after each row;
+                the loop ends when it returns True
+        """
+        issues = [] if issues is None else issues
+        total = len(df)
+
+        # Truncation suggestions for all overlength values, batched per column
+        if profiler is not None:
+            profiler.start(None, issues)
+        truncations = self._precompute_truncations(df, config, warnings)
+        if profiler is not None:
+            profiler.lap("truncation_suggestions", issues)
+
+        # Validation Loop
+        row_run = run if run is not None and run.row_interval else None
+        for n, (idx, row) in enumerate(df.iterrows(), 1):
+            row_issues = self._validate_row(idx, row, config, truncations, profiler, warnings)
+            issues.extend(row_issues)
+            if row_run is not None and (n % row_run.row_interval == 0 or n == total):
+                row_run.rows(n, total, issues)
+            if stop is not None and stop(n):
+                break
+        return issues
+
+    def _pattern_issues(self, pattern_issues: List[Dict[str, Any]]) -> List[Issue]:
+        """Convert pattern detector findings to Issue objects."""
+        issues = []
         for p_issue in pattern_issues:
             issue_id = f"pattern_{p_issue['row_idx']}_{p_issue['column']}"
             issue = Issue(
@@ -63,17 +296,51 @@ class ValidatorEngine:
                 original_value=p_issue['current_value']
             )
             issues.append(issue)
+        return issues
 
-        # Generate Summary
-        summary = self._generate_summary(df, issues)
+    def _duplicate_issues(self, df: pd.DataFrame, config: Dict[str, Any]) -> List[Issue]:
+        """
+        Flag rows whose validated columns repeat an earlier row exactly.
         
-        result = ValidationResult(
-            platform=platform,
-            issues=issues,
-            summary=summary
-        )
+        Rows are compared on the columns the platform config validates (all
+        columns when it validates none); each repeat is a WARNING on the
+        first of them, pointing at the row it duplicates.
+        """
+        columns = [v['column'] for v in config.get('validators', []) if v['column'] in df.columns]
+        columns = list(dict.fromkeys(columns)) or list(df.columns)
+        if not columns or not df.duplicated(subset=columns).any():
+            return []
+
+        issues = []
+        col = columns[0]
+        first_rows: Dict[int, Any] = {}
+        groups = df.groupby(columns, dropna=False, sort=False).ngroup()
+        for idx, group in zip(df.index, groups):
+            first = first_rows.setdefault(group, idx)
+            if first == idx:
+                continue
+            row_label = first + 1 if isinstance(first, int) else first
+            issues.append(Issue(
+                issue_id=f"{idx}_{col}_duplicate",
+                row_idx=idx,
+                column=col,
+                severity="WARNING",
+                message=f"Duplicate of row {row_label} (same values in all {len(columns)} checked columns)",
+                original_value=df.at[idx, col],
+                suggested_fix="Remove this row or change its copy"
+            ))
+        return issues
 
-        return result, verified_df
+    def _read_frame(self, source: Union[str, BinaryIO], filename: str) -> pd.DataFrame:
+        """Parse a CSV or Excel source, choosing the reader from the filename extension."""
+        import pandas as pd
+        ext = filename.split('.')[-1].lower()
+        if ext == 'csv':
+            return pd.read_csv(source)
+        elif ext in ['xls', 'xlsx']:
+            return pd.read_excel(source)
+        else:
+            raise ValueError(f"Unsupported file extension: {ext}")
 
     def _detect_platform(self, df: pd.DataFrame) -> str:
         """
@@ -84,17 +351,7 @@ class ValidatorEngine:
         headers = set(df.columns)
         
         # Scoring system - now includes specific ad types
-        scores = {
-            "Google Ads": 0,
-            "Google Display Ads": 0,
-            "Google Video Ads": 0,
-            "Meta Ads": 0,
-            "Meta Video Ads": 0,
-            "Meta Stories & Reels Ads": 0,
-            "LinkedIn Ads": 0,
-            "LinkedIn Video Ads": 0,
-            "Generic": 0
-        }
+        scores = {platform: 0 for platform in SUPPORTED_PLATFORMS}
         
         # Google Ads - Search (RSA)
         if "Ad Group" in headers:
@@ -170,12 +427,26 @@ class ValidatorEngine:
         
         return winner
 
-    def _validate_row(self, idx: int, row: pd.Series, config: Dict[str, Any]) -> List[Issue]:
-        """Enhanced row validation with advanced checks."""
+    def _validate_row(self, idx: int, row: pd.Series, config: Dict[str, Any],
+                      truncations: Optional[Dict[str, Dict[int, str]]] = None,
+                      profiler: Optional[RuleProfiler] = None,
+                      warnings: bool = True) -> List[Issue]:
+        """
+        Enhanced row validation with advanced checks.
+        
+        Args:
+            truncations: Optional precomputed suggestions from _precompute_truncations
+            profiler: Optional RuleProfiler; each rule below reports a lap to it
+            warnings: If False, skip the WARNING-only checks
+        """
+        import pandas as pd
         row_issues = []
+        truncations = truncations or {}
         
         for validator in config.get('validators', []):
             col = validator['column']
+            if profiler is not None:
+                profiler.start(col, row_issues)
             
             # Check if column exists
             if col not in row:
@@ -188,6 +459,8 @@ class ValidatorEngine:
                         message=f"Missing required column: {col}",
                         original_value=None
                     ))
+                    if profiler is not None:
+                        profiler.lap("required", row_issues)
                 continue
 
             val = row[col]
@@ -203,6 +476,8 @@ class ValidatorEngine:
                         message=validator.get('message', f"Value in {col} cannot be empty"),
                         original_value=val
                     ))
+                    if profiler is not None:
+                        profiler.lap("required", row_issues)
                     continue  # Skip further validation for this field
                 else:
                     continue  # Skip optional null fields
@@ -220,7 +495,11 @@ class ValidatorEngine:
                     message=validator.get('message', f"Value in {col} cannot be empty"),
                     original_value=val
                 ))
+                if profiler is not None:
+                    profiler.lap("required", row_issues)
                 continue
+            if profiler is not None and validator.get('required', False):
+                profiler.lap("required", row_issues)
             
             # Type-specific validation
             val_type = validator.get('type', 'string')
@@ -237,8 +516,11 @@ class ValidatorEngine:
                         message=error_msg,
                         original_value=val
                     ))
-                
-                # Check URL length
+                if profiler is not None:
+                    profiler.lap("url", row_issues)
+            
+            # Check URL length
+            if val_type == 'url' and val_str and warnings:
                 max_url_len = validator.get('max_length', 2048)
                 is_valid, error_msg = self.validation_utils.check_url_length(val_str, max_url_len)
                 if not is_valid:
@@ -250,6 +532,8 @@ class ValidatorEngine:
                         message=error_msg,
                         original_value=val
                     ))
+                if profiler is not None:
+                    profiler.lap("url_length", row_issues)
             
             # Number Validation
             if val_type in ['number', 'float', 'integer']:
@@ -265,6 +549,8 @@ class ValidatorEngine:
                         message=error_msg,
                         original_value=val
                     ))
+                if profiler is not None:
+                    profiler.lap("number", row_issues)
 
             # Value list check
             if 'values' in validator and val not in validator['values']:
@@ -282,6 +568,8 @@ class ValidatorEngine:
                         original_value=val,
                         suggested_fix=f"Change to one of {validator['values']}"
                     ))
+            if profiler is not None and 'values' in validator:
+                profiler.lap("values", row_issues)
 
             # Length check
             if 'max_length' in validator and isinstance(val, str):
@@ -291,7 +579,9 @@ class ValidatorEngine:
                 
                 if val_len > max_len:
                     # Generate intelligent truncation suggestion
-                    truncated = self._smart_truncate(val_str, max_len)
+                    truncated = truncations.get(col, {}).get(idx)
+                    if truncated is None:
+                        truncated = self._smart_truncate(val_str, max_len)
                     
                     row_issues.append(Issue(
                         issue_id=f"{idx}_{col}_len",
@@ -302,9 +592,11 @@ class ValidatorEngine:
                         original_value=val,
                         suggested_fix=f'"{truncated}"'
                     ))
-                elif val_len > recommended_max:
+                elif val_len > recommended_max and warnings:
                     # Warning for exceeding recommended length
-                    truncated_recommended = self._smart_truncate(val_str, recommended_max)
+                    truncated_recommended = truncations.get(col, {}).get(idx)
+                    if truncated_recommended is None:
+                        truncated_recommended = self._smart_truncate(val_str, recommended_max)
                     
                     row_issues.append(Issue(
                         issue_id=f"{idx}_{col}_len_warn",
@@ -315,6 +607,8 @@ class ValidatorEngine:
                         original_value=val,
                         suggested_fix=f'"{truncated_recommended}"'
                     ))
+                if profiler is not None:
+                    profiler.lap("length", row_issues)
             
             # Regex check
             if 'regex' in validator and isinstance(val, str):
@@ -327,9 +621,11 @@ class ValidatorEngine:
                         message=validator.get('message', f"Value does not match required format"),
                         original_value=val
                     ))
+                if profiler is not None:
+                    profiler.lap("regex", row_issues)
             
             # Advanced validations (only for text fields)
-            if isinstance(val, str) and val_str:
+            if isinstance(val, str) and val_str and warnings:
                 # Capitalization check
                 is_valid, warning = self.validation_utils.check_excessive_capitalization(val_str)
                 if not is_valid:
@@ -341,6 +637,8 @@ class ValidatorEngine:
                         message=warning,
                         original_value=val
                     ))
+                if profiler is not None:
+                    profiler.lap("capitalization", row_issues)
                 
                 # Special characters check
                 prohibited = validator.get('prohibited_chars', [])
@@ -355,6 +653,8 @@ class ValidatorEngine:
                             message=warning,
                             original_value=val
                         ))
+                    if profiler is not None:
+                        profiler.lap("special_chars", row_issues)
                 
                 # Character encoding check
                 is_valid, warning = self.validation_utils.validate_character_encoding(val_str)
@@ -367,6 +667,8 @@ class ValidatorEngine:
                         message=warning,
                         original_value=val
                     ))
+                if profiler is not None:
+                    profiler.lap("encoding", row_issues)
                 
                 # Emoji check
                 is_valid, warning = self.validation_utils.check_emoji_usage(val_str)
@@ -379,9 +681,11 @@ class ValidatorEngine:
                         message=warning,
                         original_value=val
                     ))
+                if profiler is not None:
+                    profiler.lap("emoji", row_issues)
             
             # Image/Video format validation
-            if 'Image' in col and val_str:
+            if 'Image' in col and val_str and warnings:
                 is_valid, error = self.image_video_validator.validate_image_format(val_str)
                 if not is_valid:
                     row_issues.append(Issue(
@@ -392,8 +696,10 @@ class ValidatorEngine:
                         message=error,
                         original_value=val
                     ))
+                if profiler is not None:
+                    profiler.lap("image_format", row_issues)
             
-            if 'Video' in col and val_str:
+            if 'Video' in col and val_str and warnings:
                 is_valid, error = self.image_video_validator.validate_video_format(val_str)
                 if not is_valid:
                     row_issues.append(Issue(
@@ -404,85 +710,117 @@ class ValidatorEngine:
                         message=error,
                         original_value=val
                     ))
+                if profiler is not None:
+                    profiler.lap("video_format", row_issues)
 
         return row_issues
 
-    def _apply_fixes(self, idx: int, df: pd.DataFrame, issues: List[Issue], config: Dict[str, Any]):
+    def _apply_fixes(self, fixes: FixOverlay, issues: List[Issue], config: Dict[str, Any]):
         """
         Applies deterministic fixes based on config.
-        Now respects auto_apply flag to prevent unwanted changes.
+        Fixes are collected per column and written to the overlay in bulk;
+        the auto_apply flag of the first fix configured for a column decides
+        whether that column is touched at all.
         """
+        import pandas as pd
+        fix_rules: Dict[str, List[Dict[str, Any]]] = {}
+        for fix in config.get('fixes', []):
+            fix_rules.setdefault(fix['target_column'], []).append(fix)
+
+        truncations: Dict[str, Dict[int, str]] = {}
+        value_fixes: Dict[str, Dict[int, Any]] = {}
         for issue in issues:
             if not issue.suggested_fix:
                 continue
 
-            # Check if this fix type should auto-apply
-            auto_apply = False
-            for fix in config.get('fixes', []):
-                if fix['target_column'] == issue.column:
-                    auto_apply = fix.get('auto_apply', False)
-                    break
-            
-            if not auto_apply:
+            rules = fix_rules.get(issue.column)
+            if not rules or not rules[0].get('auto_apply', False):
                 # Don't auto-apply, just mark the issue
                 continue
 
-            # Apply the fix
             if issue.suggested_fix.startswith('"') and issue.suggested_fix.endswith('"'):
                 # Truncated text suggestion (remove quotes)
-                df.at[idx, issue.column] = issue.suggested_fix[1:-1]
-            
+                truncations.setdefault(issue.column, {})[issue.row_idx] = issue.suggested_fix[1:-1]
             elif "Change to one of" in issue.suggested_fix:
-                # Value mapping fix logic
-                for fix in config.get('fixes', []):
-                    if fix['target_column'] == issue.column:
-                        if fix['rule'] == "map_values":
-                            mapping = fix.get('mapping', {})
-                            orig = str(issue.original_value).lower()
-                            for key, replacement in mapping.items():
-                                if key.lower() == orig:
-                                    df.at[idx, issue.column] = replacement
-                                    break
-                        elif fix['rule'] == "lowercase_to_uppercase":
-                            df.at[idx, issue.column] = str(df.at[idx, issue.column]).upper()
+                value_fixes.setdefault(issue.column, {})[issue.row_idx] = issue.original_value
+
+        # Value mapping fix logic, one vectorized pass per rule and column
+        for column, originals in value_fixes.items():
+            originals = pd.Series(originals, dtype=object)
+            for fix in fix_rules[column]:
+                if fix['rule'] == "map_values":
+                    lookup = {}
+                    for key, replacement in fix.get('mapping', {}).items():
+                        lookup.setdefault(key.lower(), replacement)
+                    lowered = originals.map(str).str.lower()
+                    matched = lowered[lowered.isin(list(lookup))]
+                    fixes.set_many(column, matched.map(lookup).to_dict())
+                elif fix['rule'] == "lowercase_to_uppercase":
+                    current = fixes.current(column, originals.index)
+                    fixes.set_many(column, current.map(str).str.upper().to_dict())
+
+        # Truncations are written last so they win over value fixes, as before
+        for column, values in truncations.items():
+            fixes.set_many(column, values)
 
     def _smart_truncate(self, text: str, max_length: int) -> str:
         """
         Intelligently truncate text to max_length, trying to preserve whole words.
-        Adds ellipsis (...) if truncated.
-        
-        Args:
-            text: Original text
-            max_length: Maximum character length
-            
-        Returns:
-            Truncated text with ellipsis if needed
+        Adds ellipsis (...) if truncated. Memoized, see truncation.smart_truncate.
         """
-        if len(text) <= max_length:
-            return text
-        
-        # Reserve 3 characters for ellipsis
-        target_length = max_length - 3
-        
-        if target_length < 10:
-            # If too short for smart truncation, just hard truncate
-            return text[:max_length]
+        return smart_truncate(text, max_length)
+
+    def _precompute_truncations(self, df: pd.DataFrame, config: Dict[str, Any],
+                                warnings: bool = True) -> Dict[str, Dict[int, str]]:
+        """
+        Batch the truncation suggestions for every overlength value up front.
         
-        # Truncate to target length
-        truncated = text[:target_length]
+        Each text column is scanned once; values over max_length get a suggestion
+        at max_length, values only over recommended_max get one at recommended_max
+        (mirroring the length check in _validate_row).
         
-        # Try to truncate at last complete word
-        last_space = truncated.rfind(' ')
-        if last_space > target_length * 0.7:  # Only if we don't lose more than 30%
-            truncated = truncated[:last_space]
+        Args:
+            warnings: If False, skip the recommended_max suggestions, which only
+                the warning check uses (the "fast" tier)
         
-        # Add ellipsis
-        return truncated.rstrip() + "..."
+        Returns:
+            Dict of column -> {row_idx: truncated text}
+        """
+        truncations: Dict[str, Dict[int, str]] = {}
+        for validator in config.get('validators', []):
+            col = validator['column']
+            if 'max_length' not in validator or col not in df.columns:
+                continue
+            
+            values = df[col]
+            values = values[values.map(lambda v: isinstance(v, str))]
+            if values.empty:
+                continue
+            stripped = values.str.strip()
+            lengths = stripped.str.len()
+            max_len = validator['max_length']
+            recommended_max = validator.get('recommended_max', max_len)
+            
+            suggestions = smart_truncate_many(stripped, max_len).to_dict()
+            if warnings and recommended_max < max_len:
+                within_max = stripped[lengths <= max_len]
+                suggestions.update(smart_truncate_many(within_max, recommended_max).to_dict())
+            if suggestions:
+                truncations.setdefault(col, {}).update(suggestions)
+        return truncations
 
-    def _generate_summary(self, df: pd.DataFrame, issues: List[Issue]) -> SummaryStats:
-        """Generate validation summary statistics."""
+    def _generate_summary(self, df: pd.DataFrame, issues: List[Issue],
+                          rows_validated: Optional[int] = None) -> SummaryStats:
+        """
+        Generate validation summary statistics.
+        
+        Args:
+            rows_validated: Rows actually checked, if a limit stopped the run
+                early; only those can count as clean
+        """
         total_rows = len(df)
         rows_with_issues = len(set(i.row_idx for i in issues))
+        checked_rows = total_rows if rows_validated is None else rows_validated
         
         severity_counts = {"BLOCKER": 0, "WARNING": 0}
         for i in issues:
@@ -490,8 +828,9 @@ class ValidatorEngine:
 
         return SummaryStats(
             total_rows=total_rows,
-            clean_rows=total_rows - rows_with_issues,
+            clean_rows=max(checked_rows - rows_with_issues, 0),
             rows_with_issues=rows_with_issues,
             total_issues=len(issues),
             severity_counts=severity_counts
         )
+
@@ -0,0 +1,102 @@
+"""
+Export of the fixed sheet (CSV / Excel), built on demand and cached.
+
+Exports are only generated when the user asks for one, and kept until the
+data changes: ExportCache is keyed by a data version (see
+FixOverlay.version), so clicking around the dashboard never rebuilds a file.
+Excel files are written with openpyxl's write-only mode, which streams rows
+to the workbook instead of holding a cell object per value, and the rows are
+merged with the fixes a chunk at a time rather than as one merged frame.
+"""
+
+from __future__ import annotations
+
+import io
+from typing import Any, Dict, Hashable, Iterable, Optional, Tuple
+
+from . import metrics
+from .fix_overlay import FixOverlay
+
+# Rows merged (base + fixes) and written per step of an Excel export
+XLSX_CHUNK_ROWS = 2000
+
+CSV_MIME = "text/csv"
+XLSX_MIME = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+
+def _cell(value: Any) -> Any:
+    """Excel-safe cell value: missing values become empty cells."""
+    if value is None:
+        return None
+    try:
+        if value != value:  # NaN / NaT
+            return None
+    except (TypeError, ValueError):
+        return value
+    if hasattr(value, 'item') and not isinstance(value, (str, bytes)):
+        # numpy scalar -> Python scalar
+        return value.item()
+    return value
+
+
+def to_csv_bytes(fixes: FixOverlay, drop_rows: Optional[Iterable[Hashable]] = None) -> bytes:
+    """Merged sheet (base + fixes, minus drop_rows) as UTF-8 CSV."""
+    return fixes.to_frame(drop_rows=drop_rows).to_csv(index=False).encode('utf-8')
+
+
+def to_xlsx_bytes(fixes: FixOverlay, drop_rows: Optional[Iterable[Hashable]] = None,
+                  sheet_name: str = 'Validated Ads') -> bytes:
+    """
+    Merged sheet (base + fixes, minus drop_rows) as an .xlsx workbook.
+
+    Rows are merged and written XLSX_CHUNK_ROWS at a time, so only one chunk
+    of the sheet is copied at once.
+    """
+    import numpy as np
+    from openpyxl import Workbook
+
+    columns = fixes.columns()
+    positions = np.flatnonzero(fixes.keep_mask(drop_rows))
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet(title=sheet_name)
+    sheet.append([str(column) for column in columns])
+    for start in range(0, len(positions), XLSX_CHUNK_ROWS):
+        chunk = fixes.window_at(positions[start:start + XLSX_CHUNK_ROWS])
+        for row in chunk.itertuples(index=False, name=None):
+            sheet.append([_cell(value) for value in row])
+
+    output = io.BytesIO()
+    workbook.save(output)
+    return output.getvalue()
+
+
+class ExportCache:
+    """
+    Last generated export per format, reused while the data version is unchanged.
+
+    The version is any hashable that changes whenever the exported data does,
+    e.g. (fixes.version, number of deleted rows).
+    """
+
+    _WRITERS = {'csv': to_csv_bytes, 'xlsx': to_xlsx_bytes}
+
+    def __init__(self):
+        # format -> (version, bytes)
+        self._entries: Dict[str, Tuple[Hashable, bytes]] = {}
+
+    def get(self, fmt: str, version: Hashable) -> Optional[bytes]:
+        """Cached export for this version, or None if it needs (re)building."""
+        entry = self._entries.get(fmt)
+        hit = entry is not None and entry[0] == version
+        metrics.record_cache("export", hit)
+        return entry[1] if hit else None
+
+    def build(self, fmt: str, version: Hashable, fixes: FixOverlay,
+              drop_rows: Optional[Iterable[Hashable]] = None) -> bytes:
+        """Return the export for this version, generating it only if not cached."""
+        data = self.get(fmt, version)
+        if data is None:
+            data = self._WRITERS[fmt](fixes, drop_rows)
+            # Only the latest version is useful; older bytes are released
+            self._entries[fmt] = (version, data)
+        return data
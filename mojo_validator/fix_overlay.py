@@ -0,0 +1,222 @@
+"""
+Copy-on-write fix overlay.
+
+Records cell edits (auto-fixes, manual overrides) as a sparse patch set on top
+of the untouched uploaded DataFrame instead of copying the whole frame. The
+merged frame is only built when it is actually needed (export, preview), and
+the patch set doubles as a cheap "what changed" diff.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, Hashable, Iterable, Mapping, Optional, Set
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+class FixOverlay:
+    """Sparse (row, column) -> new value patches over a read-only base DataFrame."""
+
+    def __init__(self, base: pd.DataFrame):
+        self.base = base
+        # column -> {row label: new value}; grouped by column so exports and
+        # bulk fixes can work one column at a time
+        self.patches: Dict[Hashable, Dict[Hashable, Any]] = {}
+        # Bumped on every edit, so derived data (exports) can be cached per version
+        self.version = 0
+
+    def __len__(self) -> int:
+        """Number of patched cells."""
+        return sum(len(rows) for rows in self.patches.values())
+
+    def __contains__(self, cell) -> bool:
+        row_idx, column = cell
+        return row_idx in self.patches.get(column, {})
+
+    def copy(self) -> "FixOverlay":
+        """Independent overlay over the same base with the same patches."""
+        clone = FixOverlay(self.base)
+        clone.patches = {column: dict(rows) for column, rows in self.patches.items()}
+        clone.version = self.version
+        return clone
+
+    def set(self, row_idx: Hashable, column: Hashable, value: Any):
+        """Record a new value for a single cell."""
+        self.patches.setdefault(column, {})[row_idx] = value
+        self.version += 1
+
+    def set_many(self, column: Hashable, values: Mapping[Hashable, Any]):
+        """Record new values for several rows of one column."""
+        if values:
+            self.patches.setdefault(column, {}).update(values)
+            self.version += 1
+
+    def get(self, row_idx: Hashable, column: Hashable) -> Any:
+        """Current value of a cell (patched value if any, else the original)."""
+        rows = self.patches.get(column)
+        if rows is not None and row_idx in rows:
+            return rows[row_idx]
+        if column not in self.base.columns:
+            return None
+        return self.base.at[row_idx, column]
+
+    def current(self, column: Hashable, rows: Iterable[Hashable]) -> pd.Series:
+        """Current values of one column for the given rows, as an object Series."""
+        import pandas as pd
+        rows = list(rows)
+        if column in self.base.columns:
+            values = self.base[column].reindex(rows).astype(object)
+        else:
+            values = pd.Series(None, index=rows, dtype=object)
+        patched = self.patches.get(column)
+        if patched:
+            overrides = [r for r in rows if r in patched]
+            if overrides:
+                values.loc[overrides] = [patched[r] for r in overrides]
+        return values
+
+    def row(self, row_idx: Hashable) -> Dict[Hashable, Any]:
+        """Current values of a whole row as a dict."""
+        data = self.base.loc[row_idx].to_dict()
+        for column, rows in self.patches.items():
+            if row_idx in rows:
+                data[column] = rows[row_idx]
+        return data
+
+    def changed_rows(self) -> Set[Hashable]:
+        """Row labels that have at least one patched cell."""
+        rows: Set[Hashable] = set()
+        for patched in self.patches.values():
+            rows.update(patched)
+        return rows
+
+    def changed_mask(self) -> pd.DataFrame:
+        """Boolean frame shaped like the base, True where a cell was patched."""
+        import pandas as pd
+        mask = pd.DataFrame(False, index=self.base.index, columns=self.base.columns)
+        for column, rows in self.patches.items():
+            if column in mask.columns and rows:
+                mask.loc[list(rows), column] = True
+        return mask
+
+    def diff(self) -> pd.DataFrame:
+        """
+        List the cells whose value actually changed.
+
+        Returns:
+            DataFrame with columns row_idx, column, original_value, new_value
+        """
+        import pandas as pd
+        records = []
+        for column, rows in self.patches.items():
+            for row_idx, new_value in rows.items():
+                original = self.base.at[row_idx, column] if column in self.base.columns else None
+                if _same_value(original, new_value):
+                    continue
+                records.append({
+                    'row_idx': row_idx,
+                    'column': column,
+                    'original_value': original,
+                    'new_value': new_value,
+                })
+        diff = pd.DataFrame(records, columns=['row_idx', 'column', 'original_value', 'new_value'])
+        return diff.sort_values(['row_idx'], kind='stable').reset_index(drop=True)
+
+    def keep_mask(self, drop_rows: Optional[Iterable[Hashable]] = None,
+                  only_rows: Optional[Iterable[Hashable]] = None):
+        """
+        Boolean array over the base rows, without copying any data.
+
+        Args:
+            drop_rows: Row labels to exclude (e.g. deleted rows)
+            only_rows: If given, keep only these row labels
+        """
+        import numpy as np
+        index = self.base.index
+        if only_rows is not None:
+            keep = index.isin(list(only_rows))
+        else:
+            keep = np.ones(len(index), dtype=bool)
+        if drop_rows:
+            keep &= ~index.isin(list(drop_rows))
+        return keep
+
+    def window(self, rows: Iterable[Hashable]) -> pd.DataFrame:
+        """
+        Merged values (base + patches) for just the given rows, e.g. one
+        preview page; only that slice of the base is copied.
+        """
+        return self._patch_window(self.base.loc[list(rows)])
+
+    def window_at(self, positions) -> pd.DataFrame:
+        """Like window(), for the base rows at these integer positions."""
+        return self._patch_window(self.base.iloc[positions])
+
+    def columns(self) -> list:
+        """Columns of the merged frame: the base's, then patched-in new ones."""
+        return list(self.base.columns) + [c for c in self.patches if c not in self.base.columns]
+
+    def _patch_window(self, frame: pd.DataFrame) -> pd.DataFrame:
+        import pandas as pd
+        for column, patched in self.patches.items():
+            # Look up the window's rows (few) rather than every patch (many)
+            hits = {r: patched[r] for r in frame.index if r in patched}
+            if column in frame.columns:
+                frame[column] = _patch_series(frame[column], hits)
+            else:
+                frame[column] = pd.Series(hits, dtype=object).reindex(frame.index)
+        return frame
+
+    def to_frame(self, drop_rows: Optional[Iterable[Hashable]] = None) -> pd.DataFrame:
+        """
+        Build the merged DataFrame (base + patches).
+
+        Unpatched columns are shared with the base rather than copied.
+
+        Args:
+            drop_rows: Optional row labels to leave out (e.g. deleted rows)
+        """
+        import pandas as pd
+        frame = self.base
+        if drop_rows:
+            frame = frame.drop(list(drop_rows))
+        else:
+            frame = frame.copy(deep=False)
+
+        for column, rows in self.patches.items():
+            rows = {r: v for r, v in rows.items() if r in frame.index}
+            if column in frame.columns:
+                frame[column] = _patch_series(frame[column], rows)
+            else:
+                frame[column] = pd.Series(rows, dtype=object).reindex(frame.index)
+        return frame
+
+
+def _patch_series(series: pd.Series, rows: Dict[Hashable, Any]) -> pd.Series:
+    """Return a copy of series with the given rows replaced, upcasting if the dtype can't hold them."""
+    if not rows:
+        return series
+    patched = series.copy()
+    labels = list(rows)
+    values = list(rows.values())
+    try:
+        patched.loc[labels] = values
+    except (TypeError, ValueError):
+        patched = series.astype(object)
+        patched.loc[labels] = values
+    return patched
+
+
+def _same_value(a: Any, b: Any) -> bool:
+    """Equality that treats two missing values as equal."""
+    import pandas as pd
+    try:
+        if pd.isna(a) and pd.isna(b):
+            return True
+    except (TypeError, ValueError):
+        pass
+    try:
+        return bool(a == b)
+    except (TypeError, ValueError):
+        return False
@@ -0,0 +1,155 @@
+"""
+Stage and progress hooks for ValidatorEngine.
+
+A validation runs in stages: reading, detecting_platform, validating_rows,
+applying_fixes (auto_fix only), detecting_patterns, detecting_duplicates
+(both deep tier only, see pipeline.py) and summarizing. Hooks
+registered on the engine (ValidatorEngine.add_hook) or passed to a single
+validate_* call receive a start and end event for each stage, with its wall
+time, plus a rows-processed event every ``row_interval`` rows of the row loop.
+
+With no hooks registered the engine never builds a HookRunner, so the only
+cost is a None check per stage and per row.
+"""
+
+import math
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+from .models import Issue, ValidationProgress
+
+# Stage names, in the order they run
+STAGES = (
+    "reading",
+    "detecting_platform",
+    "validating_rows",
+    "applying_fixes",
+    "detecting_patterns",
+    "detecting_duplicates",
+    "summarizing",
+)
+
+
+class ValidationHook:
+    """
+    Base class for hooks; override the events you need.
+
+    ``issues`` is the engine's list of issues found so far. It is shared, so
+    hooks must not modify it; copy what they want to keep.
+    """
+
+    # Rows of the row loop between on_rows calls (the last row always
+    # reports); 0 for hooks that only want stage events
+    row_interval: int = 1000
+
+    def on_stage_start(self, stage: str, total_rows: int, issues: List[Issue]):
+        pass
+
+    def on_stage_end(self, stage: str, seconds: float, total_rows: int, issues: List[Issue]):
+        pass
+
+    def on_rows(self, rows_processed: int, total_rows: int, issues: List[Issue]):
+        pass
+
+
+class StageTimings(ValidationHook):
+    """Collects the wall time of each stage, e.g. for latency reporting."""
+
+    row_interval = 0
+
+    def __init__(self):
+        self.seconds: Dict[str, float] = {}
+
+    def on_stage_end(self, stage: str, seconds: float, total_rows: int, issues: List[Issue]):
+        self.seconds[stage] = self.seconds.get(stage, 0.0) + seconds
+
+    @property
+    def total(self) -> float:
+        return sum(self.seconds.values())
+
+
+class ProgressHook(ValidationHook):
+    """
+    Adapts a progress_callback to the hook events.
+
+    The callback gets a ValidationProgress at each stage start, every
+    row_interval rows, and a final "done" update. Each update carries the
+    issues found since the previous one, so the callback can stream them.
+    """
+
+    def __init__(self, callback: Callable[[ValidationProgress], None], row_interval: int = 250):
+        self.callback = callback
+        self.row_interval = row_interval
+        self._rows = 0
+        self._reported = 0
+
+    def _send(self, stage: str, total_rows: int, issues: List[Issue]):
+        new_issues = issues[self._reported:]
+        self._reported = len(issues)
+        self.callback(ValidationProgress(
+            stage=stage,
+            rows_processed=self._rows,
+            total_rows=total_rows,
+            issues_found=len(issues),
+            new_issues=new_issues,
+        ))
+
+    def on_stage_start(self, stage: str, total_rows: int, issues: List[Issue]):
+        self._send(stage, total_rows, issues)
+
+    def on_rows(self, rows_processed: int, total_rows: int, issues: List[Issue]):
+        self._rows = rows_processed
+        self._send("validating_rows", total_rows, issues)
+
+    def on_stage_end(self, stage: str, seconds: float, total_rows: int, issues: List[Issue]):
+        if stage == "validating_rows":
+            self._rows = total_rows
+        elif stage == "summarizing":
+            self._send("done", total_rows, issues)
+
+
+class HookRunner:
+    """Dispatches one validation's events to its hooks."""
+
+    def __init__(self, hooks: Iterable[ValidationHook]):
+        self.hooks = list(hooks)
+        self._row_hooks = [hook for hook in self.hooks if hook.row_interval > 0]
+        # Rows between checks in the row loop (0 = no row events); each hook
+        # still only sees its own interval
+        self.row_interval = 0
+        for hook in self._row_hooks:
+            self.row_interval = math.gcd(self.row_interval, hook.row_interval)
+
+    @contextmanager
+    def stage(self, name: str, total_rows: int, issues: List[Issue]) -> Iterator[None]:
+        """Emit start/end events (with wall time) around a stage that completes."""
+        for hook in self.hooks:
+            hook.on_stage_start(name, total_rows, issues)
+        started = time.perf_counter()
+        yield
+        seconds = time.perf_counter() - started
+        for hook in self.hooks:
+            hook.on_stage_end(name, seconds, total_rows, issues)
+
+    def rows(self, rows_processed: int, total_rows: int, issues: List[Issue],
+             since: Optional[int] = None):
+        """
+        Report row-loop progress to every hook whose interval is due.
+
+        Args:
+            since: Rows done at the previous report, for callers that report
+                in batches (default: rows_processed - 1). A hook is due if one
+                of its interval boundaries falls after since
+        """
+        previous = rows_processed - 1 if since is None else since
+        for hook in self._row_hooks:
+            interval = hook.row_interval
+            if rows_processed // interval > previous // interval or rows_processed == total_rows:
+                hook.on_rows(rows_processed, total_rows, issues)
+
+
+def make_runner(hooks: Iterable[ValidationHook]) -> Optional[HookRunner]:
+    """HookRunner for hooks, or None when there are none (the fast path)."""
+    hooks = list(hooks)
+    return HookRunner(hooks) if hooks else None
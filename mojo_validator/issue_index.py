@@ -0,0 +1,111 @@
+"""
+Incrementally maintained index over a validation's issues.
+
+The dashboard needs, on every rerun, severity counts, the rows that still
+have pending issues (optionally for one severity) and the pending issues of
+the rows on the current page. IssueIndex builds those buckets once per
+upload and keeps them up to date as issues are fixed, ignored or their rows
+removed, so each query costs O(answer) and each action O(issues touched).
+"""
+
+from collections import Counter
+from itertools import islice
+from typing import Dict, Hashable, Iterable, List, Optional, Set
+
+from .models import Issue
+
+
+class IssueIndex:
+    """
+    Issues grouped by row and severity, with pending/handled state.
+
+    An issue is pending until it is marked (fixed, ignored, overridden,
+    removed). Severity arguments take "BLOCKER"/"WARNING", or None for all.
+    """
+
+    def __init__(self, issues: Iterable[Issue]):
+        self.issues: List[Issue] = list(issues)
+        self.severity_counts: Counter = Counter(issue.severity for issue in self.issues)
+        # issue_id -> status ("fixed", "ignored", "overridden", "removed")
+        self.status: Dict[str, str] = {}
+        self.deleted_rows: Set[Hashable] = set()
+
+        self._by_id: Dict[str, List[Issue]] = {}
+        rows: Dict[Hashable, List[Issue]] = {}
+        for issue in self.issues:
+            self._by_id.setdefault(issue.issue_id, []).append(issue)
+            rows.setdefault(issue.row_idx, []).append(issue)
+        # Row buckets in row order
+        self.rows: Dict[Hashable, List[Issue]] = dict(sorted(rows.items()))
+
+        # severity (None = any) -> {row: pending issue count}; built in row
+        # order and only ever shrunk, so iteration stays sorted
+        self._pending_rows: Dict[Optional[str], Dict[Hashable, int]] = {None: {}}
+        self._pending_counts: Counter = Counter()
+        for row_issues in self.rows.values():
+            for issue in row_issues:
+                self._add_pending(issue)
+
+    def __len__(self) -> int:
+        return len(self.issues)
+
+    @property
+    def handled_count(self) -> int:
+        """Number of issue ids that have been handled."""
+        return len(self.status)
+
+    def is_pending(self, issue_id: str) -> bool:
+        return issue_id in self._by_id and issue_id not in self.status
+
+    def pending_count(self, severity: Optional[str] = None) -> int:
+        """Pending issues, optionally of one severity."""
+        if severity is None:
+            return sum(self._pending_counts.values())
+        return self._pending_counts[severity]
+
+    def pending_rows(self, severity: Optional[str] = None, start: int = 0,
+                     stop: Optional[int] = None) -> List[Hashable]:
+        """
+        Rows with at least one pending issue (of severity), in row order.
+
+        Args:
+            start, stop: Optional positional slice, e.g. one page of rows
+        """
+        return list(islice(self._pending_rows.get(severity, {}), start, stop))
+
+    def pending_row_count(self, severity: Optional[str] = None) -> int:
+        return len(self._pending_rows.get(severity, {}))
+
+    def pending_in_row(self, row_idx: Hashable, severity: Optional[str] = None) -> List[Issue]:
+        """Pending issues of one row, optionally of one severity."""
+        return [
+            issue for issue in self.rows.get(row_idx, [])
+            if issue.issue_id not in self.status and severity in (None, issue.severity)
+        ]
+
+    def mark(self, issue_id: str, status: str):
+        """Record how an issue was handled; re-marking only updates the status."""
+        if issue_id not in self.status:
+            for issue in self._by_id.get(issue_id, []):
+                self._drop_pending(issue)
+        self.status[issue_id] = status
+
+    def remove_row(self, row_idx: Hashable):
+        """Delete a row: every issue on it is marked "removed"."""
+        self.deleted_rows.add(row_idx)
+        for issue in self.rows.get(row_idx, []):
+            self.mark(issue.issue_id, "removed")
+
+    def _add_pending(self, issue: Issue):
+        for key in (None, issue.severity):
+            bucket = self._pending_rows.setdefault(key, {})
+            bucket[issue.row_idx] = bucket.get(issue.row_idx, 0) + 1
+        self._pending_counts[issue.severity] += 1
+
+    def _drop_pending(self, issue: Issue):
+        for key in (None, issue.severity):
+            bucket = self._pending_rows[key]
+            bucket[issue.row_idx] -= 1
+            if not bucket[issue.row_idx]:
+                del bucket[issue.row_idx]
+        self._pending_counts[issue.severity] -= 1
@@ -0,0 +1,103 @@
+"""
+Background validation jobs with live progress.
+
+A ValidationJob runs one of the engine's validate_* calls on a worker thread
+and records the ValidationProgress updates it reports, so a UI can poll the
+job (rows processed, current stage, issues found so far) and show partial
+results while validation is still running.
+"""
+
+import threading
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import Any, Callable, List, Optional
+
+from .models import Issue, ValidationProgress
+
+# Validations running at once in the shared background executor
+MAX_BACKGROUND_JOBS = 2
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def background_executor() -> ThreadPoolExecutor:
+    """Shared thread pool for background validations, created on first use."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=MAX_BACKGROUND_JOBS,
+                                           thread_name_prefix="mojo-validate")
+        return _executor
+
+
+class ValidationJob:
+    """
+    A validation call running in the background.
+
+    Example:
+        job = ValidationJob(engine.validate_bytes, data, "ads.csv").start()
+        while not job.done:
+            show(job.rows_processed, job.total_rows, job.issues)
+        result, fixes, raw_df = job.result()
+    """
+
+    def __init__(self, fn: Callable[..., Any], *args, **kwargs):
+        """
+        Args:
+            fn: A validate_* method (or anything accepting progress_callback=)
+            *args, **kwargs: Passed through to fn
+        """
+        self._fn = fn
+        self._args = args
+        self._kwargs = kwargs
+        self._lock = threading.Lock()
+        self._future: Optional[Future] = None
+
+        self.stage: str = "queued"
+        self.rows_processed: int = 0
+        self.total_rows: int = 0
+        # Issues reported so far (grows as updates arrive)
+        self.issues: List[Issue] = []
+
+    def start(self, executor: Optional[Executor] = None) -> "ValidationJob":
+        """Submit the job to executor (default: the shared background pool)."""
+        executor = executor or background_executor()
+        self._future = executor.submit(self._fn, *self._args, progress_callback=self._on_progress, **self._kwargs)
+        return self
+
+    def _on_progress(self, progress: ValidationProgress):
+        with self._lock:
+            self.stage = progress.stage
+            self.rows_processed = progress.rows_processed
+            if progress.total_rows:
+                self.total_rows = progress.total_rows
+            self.issues.extend(progress.new_issues)
+
+    @property
+    def fraction(self) -> float:
+        """Share of rows processed, 0.0 - 1.0."""
+        if self.done:
+            return 1.0
+        return self.rows_processed / self.total_rows if self.total_rows else 0.0
+
+    @property
+    def done(self) -> bool:
+        return self._future is not None and self._future.done()
+
+    @property
+    def error(self) -> Optional[BaseException]:
+        """Exception raised by the validation, once it has finished."""
+        if not self.done:
+            return None
+        return self._future.exception()
+
+    def snapshot(self) -> List[Issue]:
+        """Copy of the issues reported so far, safe to use while the job runs."""
+        with self._lock:
+            return list(self.issues)
+
+    def result(self, timeout: Optional[float] = None) -> Any:
+        """Return value of the validation call, waiting for it if needed."""
+        if self._future is None:
+            raise RuntimeError("Job has not been started")
+        return self._future.result(timeout)
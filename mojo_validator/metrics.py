@@ -0,0 +1,311 @@
+"""
+Throughput, latency and cache metrics, exported as OpenMetrics text.
+
+The engine, config loader and caches report into one process-wide
+MetricsRegistry (REGISTRY). Recording is off until metrics.enable() is
+called or MOJO_VALIDATOR_METRICS is set, so an uninstrumented process only
+pays an attribute check per validation or cache lookup.
+
+Export either by writing a file (REGISTRY.write(path), the CLI's
+--metrics-file) or by serving it for scraping from long-running processes
+(serve(port), or MOJO_METRICS_PORT for the dashboard):
+
+    # TYPE mojo_rows_validated counter
+    mojo_rows_validated_total{platform="Google Ads"} 50
+    ...
+    # EOF
+
+Counters and histograms only go up; rates (rows/sec, cache hit rate) are
+derived by the scraper, and per-validation throughput is also kept as a
+histogram for alerting on slow files.
+"""
+
+import os
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .hooks import ValidationHook
+from .models import Issue
+
+METRICS_ENV = "MOJO_VALIDATOR_METRICS"
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+# Histogram bucket bounds
+SECONDS_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 300.0)
+RATE_BUCKETS = (10, 50, 100, 500, 1000, 5000, 10000, 50000, 100000)
+BYTES_BUCKETS = (1 << 10, 1 << 14, 1 << 17, 1 << 20, 1 << 23, 1 << 26, 1 << 29)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def _labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _number(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) and not value.is_integer() else str(int(value))
+
+
+class _Metric:
+    type = ""
+
+    def __init__(self, registry: "MetricsRegistry", name: str, help: str, labelnames: Sequence[str]):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._lock = registry._lock
+        # label values -> sample state
+        self._values: Dict[Tuple[str, ...], Any] = {}
+
+    def _key(self, labels: Dict[str, Any]) -> Tuple[str, ...]:
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+
+class Counter(_Metric):
+    type = "counter"
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def _merge(self, key, value):
+        self._values[key] = self._values.get(key, 0) + value
+
+    def _render(self, lines: List[str]):
+        for key, value in self._values.items():
+            lines.append(f"{self.name}_total{_labels(self.labelnames, key)} {_number(value)}")
+
+
+class Gauge(_Metric):
+    """Gauge of high-water marks: merging keeps the larger value."""
+
+    type = "gauge"
+
+    def set_max(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            if value > self._values.get(key, float("-inf")):
+                self._values[key] = value
+
+    def _merge(self, key, value):
+        if value > self._values.get(key, float("-inf")):
+            self._values[key] = value
+
+    def _render(self, lines: List[str]):
+        for key, value in self._values.items():
+            lines.append(f"{self.name}{_labels(self.labelnames, key)} {_number(value)}")
+
+
+class Histogram(_Metric):
+    type = "histogram"
+
+    def __init__(self, registry: "MetricsRegistry", name: str, help: str, labelnames: Sequence[str],
+                 buckets: Sequence[float]):
+        super().__init__(registry, name, help, labelnames)
+        self.buckets = tuple(buckets)
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                # [per-bucket counts (non-cumulative, last = +Inf), sum, count]
+                state = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    break
+            else:
+                i = len(self.buckets)
+            state[0][i] += 1
+            state[1] += value
+            state[2] += 1
+
+    def _merge(self, key, value):
+        state = self._values.get(key)
+        if state is None:
+            self._values[key] = [list(value[0]), value[1], value[2]]
+            return
+        state[0] = [a + b for a, b in zip(state[0], value[0])]
+        state[1] += value[1]
+        state[2] += value[2]
+
+    def _render(self, lines: List[str]):
+        for key, (counts, total, count) in self._values.items():
+            cumulative = 0
+            for bound, n in zip((*self.buckets, "+Inf"), counts):
+                cumulative += n
+                le = 'le="{}"'.format(bound if bound == "+Inf" else _number(bound))
+                lines.append(f"{self.name}_bucket{_labels(self.labelnames, key, le)} {cumulative}")
+            lines.append(f"{self.name}_count{_labels(self.labelnames, key)} {count}")
+            lines.append(f"{self.name}_sum{_labels(self.labelnames, key)} {_number(total)}")
+
+
+class MetricsRegistry:
+    """Named metrics of one process, renderable as OpenMetrics text."""
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._metrics: Dict[str, _Metric] = {}
+
+    def _add(self, metric: _Metric) -> _Metric:
+        return self._metrics.setdefault(metric.name, metric)
+
+    def counter(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._add(Counter(self, name, help, labelnames))
+
+    def gauge(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._add(Gauge(self, name, help, labelnames))
+
+    def histogram(self, name: str, help: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = SECONDS_BUCKETS) -> Histogram:
+        return self._add(Histogram(self, name, help, labelnames, buckets))
+
+    def render(self) -> str:
+        """All metrics in the OpenMetrics text exposition format."""
+        lines: List[str] = []
+        with self._lock:
+            for metric in self._metrics.values():
+                lines.append(f"# TYPE {metric.name} {metric.type}")
+                lines.append(f"# HELP {metric.name} {metric.help}")
+                metric._render(lines)
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: str):
+        """Write render() to path (e.g. for a node-exporter textfile collector)."""
+        tmp = f"{path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(self.render())
+        os.replace(tmp, path)
+
+    def drain(self) -> Dict[str, Dict[Tuple[str, ...], Any]]:
+        """Take and reset every metric's samples, e.g. to ship them to a parent process."""
+        with self._lock:
+            state = {}
+            for name, metric in self._metrics.items():
+                if metric._values:
+                    state[name] = metric._values
+                    metric._values = {}
+            return state
+
+    def merge(self, state: Dict[str, Dict[Tuple[str, ...], Any]]):
+        """Fold in samples from drain() of another registry with the same metrics."""
+        with self._lock:
+            for name, values in state.items():
+                metric = self._metrics[name]
+                for key, value in values.items():
+                    metric._merge(tuple(key), value)
+
+
+REGISTRY = MetricsRegistry(enabled=bool(os.environ.get(METRICS_ENV)))
+
+VALIDATIONS = REGISTRY.counter("mojo_validations", "Validations completed.", ("platform",))
+ROWS = REGISTRY.counter("mojo_rows_validated", "Rows validated.", ("platform",))
+ISSUES = REGISTRY.counter("mojo_issues_found", "Issues found.", ("platform", "severity"))
+VALIDATION_SECONDS = REGISTRY.histogram(
+    "mojo_validation_seconds", "Wall time per validation, excluding file parsing.", ("platform",))
+ROWS_PER_SECOND = REGISTRY.histogram(
+    "mojo_validation_rows_per_second", "Throughput of each validation in rows/sec.", buckets=RATE_BUCKETS)
+ISSUES_PER_SECOND = REGISTRY.histogram(
+    "mojo_validation_issues_per_second", "Issues found per second of each validation.", buckets=RATE_BUCKETS)
+STAGE_SECONDS = REGISTRY.histogram("mojo_stage_seconds", "Wall time per pipeline stage.", ("stage",))
+FILE_BYTES = REGISTRY.histogram("mojo_input_file_bytes", "Size of validated input files.", buckets=BYTES_BUCKETS)
+CACHE_REQUESTS = REGISTRY.counter("mojo_cache_requests", "Cache lookups by cache and outcome.", ("cache", "result"))
+PEAK_RSS = REGISTRY.gauge("mojo_peak_rss_bytes", "Peak resident memory of the process.")
+
+
+def enable():
+    """Start recording metrics in this process."""
+    REGISTRY.enabled = True
+
+
+def peak_rss_bytes() -> Optional[int]:
+    """Peak resident set size of this process, where the platform reports it."""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    import sys
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def record_validation(platform: str, rows: int, issues: Iterable[Issue], seconds: float):
+    if not REGISTRY.enabled:
+        return
+    VALIDATIONS.inc(platform=platform)
+    ROWS.inc(rows, platform=platform)
+    count = 0
+    severities: Dict[str, int] = {}
+    for issue in issues:
+        severities[issue.severity] = severities.get(issue.severity, 0) + 1
+        count += 1
+    for severity, n in severities.items():
+        ISSUES.inc(n, platform=platform, severity=severity)
+    VALIDATION_SECONDS.observe(seconds, platform=platform)
+    if seconds > 0:
+        ROWS_PER_SECOND.observe(rows / seconds)
+        ISSUES_PER_SECOND.observe(count / seconds)
+    peak = peak_rss_bytes()
+    if peak is not None:
+        PEAK_RSS.set_max(peak)
+
+
+def record_file_size(nbytes: int):
+    if REGISTRY.enabled:
+        FILE_BYTES.observe(nbytes)
+
+
+def record_cache(cache: str, hit: bool):
+    if REGISTRY.enabled:
+        CACHE_REQUESTS.inc(cache=cache, result="hit" if hit else "miss")
+
+
+class StageMetrics(ValidationHook):
+    """Feeds stage latencies into STAGE_SECONDS; no row events."""
+
+    row_interval = 0
+
+    def on_stage_end(self, stage: str, seconds: float, total_rows: int, issues: List[Issue]):
+        STAGE_SECONDS.observe(seconds, stage=stage)
+
+
+STAGE_HOOK = StageMetrics()
+
+
+def serve(port: int = 0, host: str = "127.0.0.1", registry: MetricsRegistry = REGISTRY):
+    """
+    Serve registry.render() at http://host:port/metrics on a daemon thread.
+
+    Enables recording. Returns the HTTPServer; its server_address holds the
+    bound port (useful with port=0) and shutdown() stops it.
+    """
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = registry.render().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    registry.enabled = True
+    server = ThreadingHTTPServer((host, port), Handler)
+    threading.Thread(target=server.serve_forever, name="mojo-metrics", daemon=True).start()
+    return server
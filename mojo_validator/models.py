@@ -1,4 +1,3 @@
-import pandas as pd
 from typing import List, Optional, Dict, Any
 from pydantic import BaseModel, Field
 
@@ -11,6 +10,12 @@ class Issue(BaseModel):
     suggested_fix: Optional[str] = None
     original_value: Any = None
 
+    @property
+    def kind(self) -> str:
+        """The check that raised it, from issue_id "<row>_<column>_<kind>" (e.g. "len", "url")."""
+        prefix = f"{self.row_idx}_{self.column}_"
+        return self.issue_id[len(prefix):] if self.issue_id.startswith(prefix) else self.issue_id
+
 class SummaryStats(BaseModel):
     total_rows: int
     clean_rows: int
@@ -18,9 +23,77 @@ class SummaryStats(BaseModel):
     total_issues: int
     severity_counts: Dict[str, int]
 
+class RuleStats(BaseModel):
+    """Cost and yield of one rule on one column (column is None for dataset-wide pattern checks)."""
+    rule: str
+    column: Optional[str] = None
+    calls: int
+    seconds: float
+    hits: int
+
+class ValidationProfile(BaseModel):
+    """Per-rule instrumentation, recorded when validation runs with profile_rules=True."""
+    rules: List[RuleStats]
+
+    @property
+    def total_seconds(self) -> float:
+        return sum(stat.seconds for stat in self.rules)
+
+    def slowest(self, n: Optional[int] = 10) -> List[RuleStats]:
+        """Rules by descending wall time; n=None returns all of them."""
+        return sorted(self.rules, key=lambda stat: stat.seconds, reverse=True)[:n]
+
 class ValidationResult(BaseModel):
     platform: str
     issues: List[Issue]
     summary: SummaryStats
+    tier: Optional[str] = None  # fast, standard or deep
+    # Set when max_issues, stop_on_first_blocker or a deadline ended the run
+    # early (stop_reason: max_issues, first_blocker or deadline)
+    partial: bool = False
+    rows_validated: Optional[int] = None
+    stop_reason: Optional[str] = None
+    # Rows the row rules ran on when validating with a delta_key (the rest
+    # carried their issues over from the file's previous upload)
+    rows_revalidated: Optional[int] = None
+    profile: Optional[ValidationProfile] = None
     # The dataframes are handled outside pydantic for performance
     # But we define the contract for the engine output here
+
+class RateEstimate(BaseModel):
+    """Estimated share of rows, with its confidence interval."""
+    rate: float
+    low: float
+    high: float
+
+class RuleEstimate(BaseModel):
+    """Estimated hit rate of one rule on one column, from a quick scan's sample."""
+    rule: str  # issue kind, e.g. "len", "url", "caps"
+    column: str
+    severity: str
+    sample_hits: int  # sampled rows with this issue
+    estimate: RateEstimate
+    estimated_rows: int  # estimate.rate scaled to the whole file
+    examples: List[Issue]
+
+class QuickScanResult(BaseModel):
+    """Estimated issue rates for a file, from validating a stratified sample of its rows."""
+    platform: str
+    tier: str
+    total_rows: int
+    sample_rows: int
+    strata: List[str]  # columns the sample was stratified by
+    confidence: float
+    summary: SummaryStats  # counts over the sampled rows
+    row_issue_rate: RateEstimate  # rows with any issue
+    row_blocker_rate: RateEstimate  # rows with a blocker
+    rules: List[RuleEstimate]  # by descending estimated rate
+
+class ValidationProgress(BaseModel):
+    """Progress update passed to a validation's progress_callback."""
+    stage: str  # reading, detecting_platform, validating_rows, applying_fixes, detecting_patterns, detecting_duplicates, summarizing, done
+    rows_processed: int
+    total_rows: int
+    issues_found: int
+    # Issues found since the previous update, so listeners can stream them
+    new_issues: List[Issue] = Field(default_factory=list)
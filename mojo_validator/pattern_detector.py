@@ -13,25 +13,145 @@ Examples of detectable mismatches:
 - Numbers/IDs in text fields
 """
 
+import math
 import re
-from typing import List, Dict, Tuple, Optional
+from typing import Callable, List, Dict, Tuple, Optional
 from collections import Counter
 import pandas as pd
 
 
+def _headline_columns(columns) -> List[str]:
+    return [col for col in columns if 'headline' in col.lower()]
+
+
+def _description_columns(columns) -> List[str]:
+    return [col for col in columns if 'description' in col.lower() or 'intro' in col.lower()]
+
+
+def _text_columns(columns) -> List[str]:
+    text_keywords = ['headline', 'description', 'text', 'intro', 'primary', 'body', 'copy']
+    return [col for col in columns if any(kw in col.lower() for kw in text_keywords)]
+
+
+def _campaign_name_column(columns) -> Optional[str]:
+    campaign_col = None
+    for col in columns:
+        col_lower = col.lower()
+        if 'campaign' in col_lower and 'name' in col_lower:
+            campaign_col = col
+    return campaign_col
+
+
+def _digit_ratio(value: str) -> float:
+    return sum(c.isdigit() for c in value) / max(len(value), 1)
+
+
+class PatternStats:
+    """
+    Column aggregates that the dataset-level checks compare each row against.
+
+    Computed once per frame instead of once per row, and kept as sums so they
+    can be updated in place when rows are added or removed (delta validation
+    refreshes them from just the rows that changed).
+    """
+
+    def __init__(self, columns):
+        columns = list(columns)
+        self.columns = columns
+        self.text_columns = list(dict.fromkeys(
+            _headline_columns(columns) + _description_columns(columns) + _text_columns(columns)))
+        self.name_column = _campaign_name_column(columns)
+        # column -> [non-null values, length sum, squared length sum, digit ratio sum]
+        self._text: Dict[str, list] = {col: [0, 0, 0, 0.0] for col in self.text_columns}
+        self._names: Counter = Counter()
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> "PatternStats":
+        stats = cls(df.columns)
+        stats.add(df)
+        return stats
+
+    def add(self, df: pd.DataFrame):
+        """Count the rows of df (same columns) in."""
+        self._update(df, 1)
+
+    def remove(self, df: pd.DataFrame):
+        """Take previously added rows of df back out."""
+        self._update(df, -1)
+
+    def _update(self, df: pd.DataFrame, sign: int):
+        for col in self.text_columns:
+            values = df[col].dropna().astype(str)
+            lengths = values.str.len()
+            stat = self._text[col]
+            stat[0] += sign * len(values)
+            stat[1] += sign * int(lengths.sum())
+            stat[2] += sign * int((lengths ** 2).sum())
+            stat[3] += sign * float(values.map(_digit_ratio).sum())
+        if self.name_column is not None:
+            for name, count in df[self.name_column].dropna().value_counts().items():
+                self._names[name] += sign * count
+                if not self._names[name]:
+                    del self._names[name]
+
+    def count(self, col: str) -> int:
+        return self._text[col][0]
+
+    def mean_length(self, col: str) -> float:
+        count, total = self._text[col][:2]
+        return total / count if count else float('nan')
+
+    def length_std(self, col: str) -> float:
+        """Sample standard deviation of the value lengths (NaN below two values)."""
+        count, total, squares = self._text[col][:3]
+        if count < 2:
+            return float('nan')
+        return math.sqrt(max(count * squares - total * total, 0) / (count * (count - 1)))
+
+    def mean_digit_ratio(self, col: str) -> float:
+        count, digits = self._text[col][0], self._text[col][3]
+        return digits / count if count else float('nan')
+
+    def copy(self) -> "PatternStats":
+        clone = PatternStats(self.columns)
+        clone._text = {col: list(stat) for col, stat in self._text.items()}
+        clone._names = Counter(self._names)
+        return clone
+
+    def has_name(self, name) -> bool:
+        """Whether any row has name in the campaign name column."""
+        return self._names.get(name, 0) > 0
+
+
 class PatternMismatchDetector:
     """Detects likely data entry errors by analyzing column patterns."""
     
     def __init__(self):
         self.confidence_threshold = 0.90  # 90% confidence required
         
-    def detect_mismatches(self, df: pd.DataFrame, platform: str) -> List[Dict]:
+    def detect_mismatches(self, df: pd.DataFrame, platform: str, profiler=None,
+                          should_stop: Optional[Callable[[], bool]] = None,
+                          stats: Optional[PatternStats] = None,
+                          row_local: Optional[Dict] = None) -> List[Dict]:
         """
         Detect pattern mismatches across all rows.
         
+        Args:
+            profiler: Optional RuleProfiler; each detector method reports a
+                "pattern.<check>" lap to it
+            should_stop: Optional check run before each row; when it returns
+                True the scan ends and the issues found so far are returned
+            stats: PatternStats of df, if already known (e.g. kept up to date
+                across uploads); computed here otherwise
+            row_local: Optional {row_idx: (url/text checks, intra-row check)}
+                issues of the checks that only look at the row itself. Rows
+                already in it are not re-checked; the others are added
+        
         Returns list of issues with high confidence of being errors.
         """
         issues = []
+        if stats is None:
+            stats = PatternStats.from_frame(df)
         
         # Analyze patterns for each column type
         url_columns = self._find_url_columns(df)
@@ -40,35 +160,63 @@ class PatternMismatchDetector:
         
         # Check each row for mismatches
         for idx, row in df.iterrows():
-            # Check for URLs in text fields
-            url_in_text = self._detect_url_in_text_field(row, text_columns, idx)
-            if url_in_text:
-                issues.extend(url_in_text)
-            
-            # Check for text in URL fields
-            text_in_url = self._detect_text_in_url_field(row, url_columns, idx)
-            if text_in_url:
-                issues.extend(text_in_url)
+            if should_stop is not None and should_stop():
+                break
+            if profiler is not None:
+                profiler.start(None, issues)
+            known = row_local.get(idx) if row_local is not None else None
+            if known is not None:
+                issues.extend(known[0])
+            else:
+                row_start = len(issues)
+                # Check for URLs in text fields
+                url_in_text = self._detect_url_in_text_field(row, text_columns, idx)
+                if url_in_text:
+                    issues.extend(url_in_text)
+                if profiler is not None:
+                    profiler.lap("pattern.url_in_text", issues)
+                
+                # Check for text in URL fields
+                text_in_url = self._detect_text_in_url_field(row, url_columns, idx)
+                if text_in_url:
+                    issues.extend(text_in_url)
+                if profiler is not None:
+                    profiler.lap("pattern.text_in_url", issues)
+                head = issues[row_start:]
             
             # Check for swapped headline/description
-            swapped = self._detect_swapped_text_fields(row, df, idx, platform)
+            swapped = self._detect_swapped_text_fields(row, df, idx, platform, stats)
             if swapped:
                 issues.extend(swapped)
+            if profiler is not None:
+                profiler.lap("pattern.swapped_text", issues)
             
             # Check for campaign/ad name confusion
-            name_confusion = self._detect_name_confusion(row, df, idx)
+            name_confusion = self._detect_name_confusion(row, df, idx, stats)
             if name_confusion:
                 issues.extend(name_confusion)
+            if profiler is not None:
+                profiler.lap("pattern.name_confusion", issues)
             
             # Check for pattern outliers
-            outliers = self._detect_pattern_outliers(row, df, idx)
+            outliers = self._detect_pattern_outliers(row, df, idx, stats)
             if outliers:
                 issues.extend(outliers)
+            if profiler is not None:
+                profiler.lap("pattern.outliers", issues)
+            
+            if known is not None:
+                issues.extend(known[1])
+                continue
             
             # NEW: Check for intra-row consistency (values within same row that don't match)
             intra_row = self._detect_intra_row_inconsistency(row, df, idx)
             if intra_row:
                 issues.extend(intra_row)
+            if profiler is not None:
+                profiler.lap("pattern.intra_row", issues)
+            if row_local is not None:
+                row_local[idx] = (head, intra_row)
         
         return issues
     
@@ -79,8 +227,7 @@ class PatternMismatchDetector:
     
     def _find_text_columns(self, df: pd.DataFrame) -> List[str]:
         """Identify columns that should contain marketing text."""
-        text_keywords = ['headline', 'description', 'text', 'intro', 'primary', 'body', 'copy']
-        return [col for col in df.columns if any(kw in col.lower() for kw in text_keywords)]
+        return _text_columns(df.columns)
     
     def _find_name_columns(self, df: pd.DataFrame) -> List[str]:
         """Identify columns for names (campaign, ad, etc)."""
@@ -160,13 +307,14 @@ class PatternMismatchDetector:
         
         return issues
     
-    def _detect_swapped_text_fields(self, row: pd.Series, df: pd.DataFrame, idx: int, platform: str) -> List[Dict]:
+    def _detect_swapped_text_fields(self, row: pd.Series, df: pd.DataFrame, idx: int, platform: str,
+                                    stats: PatternStats) -> List[Dict]:
         """Detect when headline and description might be swapped."""
         issues = []
         
         # Find headline and description columns
-        headline_cols = [col for col in df.columns if 'headline' in col.lower()]
-        desc_cols = [col for col in df.columns if 'description' in col.lower() or 'intro' in col.lower()]
+        headline_cols = _headline_columns(df.columns)
+        desc_cols = _description_columns(df.columns)
         
         for h_col in headline_cols:
             for d_col in desc_cols:
@@ -179,15 +327,11 @@ class PatternMismatchDetector:
                 if not headline or not desc:
                     continue
                 
-                # Calculate typical lengths in the dataset
-                h_lengths = df[h_col].dropna().astype(str).str.len()
-                d_lengths = df[d_col].dropna().astype(str).str.len()
-                
-                if len(h_lengths) < 3 or len(d_lengths) < 3:
+                # Typical lengths in the dataset
+                if stats.count(h_col) < 3 or stats.count(d_col) < 3:
                     continue
                 
-                avg_h_len = h_lengths.mean()
-                avg_d_len = d_lengths.mean()
+                avg_h_len = stats.mean_length(h_col)
                 
                 # Check if this row's values are backwards
                 # Headline should typically be shorter than description
@@ -209,7 +353,7 @@ class PatternMismatchDetector:
         
         return issues
     
-    def _detect_name_confusion(self, row: pd.Series, df: pd.DataFrame, idx: int) -> List[Dict]:
+    def _detect_name_confusion(self, row: pd.Series, df: pd.DataFrame, idx: int, stats: PatternStats) -> List[Dict]:
         """Detect when campaign/ad group/ad names might be confused."""
         issues = []
         
@@ -238,8 +382,7 @@ class PatternMismatchDetector:
                 ad_has_campaign_words = sum(1 for word in campaign_keywords if word.lower() in ad_name.lower()) >= 2
                 
                 # Also check if it matches other campaign names
-                campaign_names = df[campaign_col].dropna().unique()
-                matches_other_campaign = any(ad_name == c for c in campaign_names if c != campaign)
+                matches_other_campaign = ad_name != campaign and stats.has_name(ad_name)
                 
                 if ad_has_campaign_words or matches_other_campaign:
                     issues.append({
@@ -255,7 +398,7 @@ class PatternMismatchDetector:
         
         return issues
     
-    def _detect_pattern_outliers(self, row: pd.Series, df: pd.DataFrame, idx: int) -> List[Dict]:
+    def _detect_pattern_outliers(self, row: pd.Series, df: pd.DataFrame, idx: int, stats: PatternStats) -> List[Dict]:
         """Detect values that don't match the pattern of other values in the same column."""
         issues = []
         
@@ -267,15 +410,12 @@ class PatternMismatchDetector:
             
             value = str(row[col])
             
-            # Get all values in this column
-            col_values = df[col].dropna().astype(str)
-            
-            if len(col_values) < 5:  # Need enough data to detect patterns
+            if stats.count(col) < 5:  # Need enough data to detect patterns
                 continue
             
             # Check for numeric-heavy outliers in text fields
-            digit_ratio = sum(c.isdigit() for c in value) / max(len(value), 1)
-            avg_digit_ratio = col_values.apply(lambda x: sum(c.isdigit() for c in x) / max(len(x), 1)).mean()
+            digit_ratio = _digit_ratio(value)
+            avg_digit_ratio = stats.mean_digit_ratio(col)
             
             if digit_ratio > 0.5 and avg_digit_ratio < 0.1:
                 # This value is mostly numbers but others aren't
@@ -291,9 +431,8 @@ class PatternMismatchDetector:
                 })
             
             # Check for very short values when others are long
-            lengths = col_values.str.len()
-            avg_length = lengths.mean()
-            std_length = lengths.std()
+            avg_length = stats.mean_length(col)
+            std_length = stats.length_std(col)
             
             if len(value) < avg_length - (2.5 * std_length) and avg_length > 30:
                 # This value is abnormally short
@@ -619,16 +758,24 @@ class PatternMismatchDetector:
         return False
 
 
-def detect_pattern_mismatches(df: pd.DataFrame, platform: str) -> List[Dict]:
+def detect_pattern_mismatches(df: pd.DataFrame, platform: str, profiler=None,
+                              should_stop: Optional[Callable[[], bool]] = None,
+                              stats: Optional[PatternStats] = None,
+                              row_local: Optional[Dict] = None) -> List[Dict]:
     """
     Main function to detect pattern mismatches in a dataframe.
     
     Args:
         df: DataFrame to analyze
         platform: Platform name (for context)
+        profiler: Optional RuleProfiler collecting per-check timings
+        should_stop: Optional check run before each row to end the scan early
+        stats: Optional precomputed PatternStats of df
+        row_local: Optional cache of the row-only checks' issues (see
+            PatternMismatchDetector.detect_mismatches)
     
     Returns:
         List of mismatch issues with high confidence
     """
     detector = PatternMismatchDetector()
-    return detector.detect_mismatches(df, platform)
+    return detector.detect_mismatches(df, platform, profiler, should_stop, stats, row_local)
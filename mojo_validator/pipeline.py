@@ -0,0 +1,438 @@
+"""
+Composable validation pipeline.
+
+A validation is a Pipeline of Stages sharing one ValidationContext:
+
+    reading → detecting_platform → validating_rows → applying_fixes →
+    detecting_patterns → detecting_duplicates → summarizing
+
+Each stage declares where it runs (inline, on a thread, or in a separate
+process) and is timed on its own; hook events (see hooks.py) are emitted
+around every stage that runs. Pipelines are immutable, and replace(),
+without() and insert() return new ones, so a run can swap in a faster
+implementation or skip a stage without touching the engine:
+
+    pipeline = engine.pipeline.replace("validating_rows", MyVectorizedRows())
+    result, fixes, df = engine.validate_dataframe(df, pipeline=pipeline)
+
+Stages that may run in another process split their work in three:
+inputs(ctx) picks picklable arguments, compute(*inputs) does the work in
+the executor and apply(ctx, output) stores the output in the context.
+Inline and thread stages may simply override run(ctx).
+
+Runs are tiered, so latency is only paid for the depth requested:
+
+- fast: blockers only (required, length, allowed values, URL, number
+  range and regex checks)
+- standard: adds the per-cell text warnings (capitalization, encoding,
+  emoji, recommended lengths, media formats)
+- deep (default): adds dataset-level pattern and duplicate detection
+
+The tier comes from the validate_* call, else the platform config's
+``tier`` key, else DEFAULT_TIER. Each stage names the lowest tier it
+runs in.
+
+Runs can also stop early, for gatekeeping: max_issues, stop_on_first_blocker
+and a deadline (seconds) are checked after every row and between stages.
+Once one is hit, only required stages (reading, platform detection and the
+summary) run, and the result is marked partial with the rows covered and
+the stop_reason.
+
+With a delta_key, the row and pattern stages only recheck rows whose content
+changed since the same file was last validated (see delta.py).
+"""
+
+import io
+import os
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import nullcontext
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from . import metrics
+from .models import Issue, ValidationResult
+
+EXECUTORS = ("inline", "thread", "process")
+
+# ValidationResult.stop_reason values
+STOP_REASONS = ("max_issues", "first_blocker", "deadline")
+
+# Validation depths, shallowest first
+TIERS = ("fast", "standard", "deep")
+DEFAULT_TIER = "deep"
+
+
+def check_tier(tier: str) -> str:
+    """Return tier, or raise ValueError if it isn't one of TIERS."""
+    if tier not in TIERS:
+        raise ValueError(f"Unknown validation tier {tier!r}; expected one of {list(TIERS)}")
+    return tier
+
+
+class ValidationContext:
+    """
+    State shared by the stages of one validation run.
+
+    Stages read what earlier stages produced (df, platform, config, issues)
+    and fill in their own part; ``extras`` is free for custom stages.
+    """
+
+    def __init__(self, engine, df=None, source: Any = None, filename: Optional[str] = None,
+                 platform_override: Optional[str] = None, auto_fix: bool = False,
+                 run=None, profiler=None, tier: Optional[str] = None,
+                 max_issues: Optional[int] = None, stop_on_first_blocker: bool = False,
+                 deadline: Optional[float] = None, delta=None):
+        """
+        Args:
+            engine: The ValidatorEngine whose configs and validators are used
+            df: Already parsed frame (skips reading), or None
+            source: Path, bytes or binary file-like object to read df from
+            filename: Name used to pick the parser (CSV/Excel)
+            platform_override: Optional platform name to skip detection
+            auto_fix: Whether the fix stage runs
+            run: Optional HookRunner receiving stage/progress events
+            profiler: Optional RuleProfiler for per-rule instrumentation
+            tier: "fast", "standard" or "deep"; None defers to the platform
+                config (resolved by the platform stage)
+            max_issues: Stop once this many issues are found (and keep that many)
+            stop_on_first_blocker: Stop after the row or stage that finds a blocker
+            deadline: Stop once this many seconds have passed since the context
+                was created
+            delta: Optional DeltaRun; the row and pattern stages then only
+                recheck rows changed since the file's last upload (see delta.py)
+        """
+        self.engine = engine
+        self.df = df
+        self.source = source
+        self.filename = filename
+        self.platform_override = platform_override
+        self.auto_fix = auto_fix
+        self.run = run
+        self.profiler = profiler
+        self.tier = check_tier(tier) if tier is not None else None
+        if max_issues is not None and max_issues < 1:
+            raise ValueError(f"max_issues must be at least 1, got {max_issues}")
+        self.max_issues = max_issues
+        self.stop_on_first_blocker = stop_on_first_blocker
+        # Absolute time.perf_counter() value
+        self.deadline = time.perf_counter() + deadline if deadline is not None else None
+        self.has_limits = max_issues is not None or stop_on_first_blocker or deadline is not None
+        self.delta = delta
+
+        self.platform: Optional[str] = None
+        self.config: Optional[Dict[str, Any]] = None
+        self.issues: List[Issue] = []
+        self.fixes = None
+        self.result: Optional[ValidationResult] = None
+        # Stage name -> wall seconds, for every stage that ran
+        self.timings: Dict[str, float] = {}
+        self.extras: Dict[str, Any] = {}
+        # Set when a limit ends the run early; rows_validated is how far the
+        # row stage got (None = it finished, or never ran)
+        self.stop_reason: Optional[str] = None
+        self.rows_validated: Optional[int] = None
+        self._blockers_checked = 0
+
+    @property
+    def total_rows(self) -> int:
+        return len(self.df) if self.df is not None else 0
+
+    def runs_tier(self, tier: str) -> bool:
+        """Whether this run goes at least as deep as tier."""
+        return TIERS.index(self.tier or DEFAULT_TIER) >= TIERS.index(tier)
+
+    def past_deadline(self) -> bool:
+        """Whether the deadline has passed (recorded as the stop_reason)."""
+        if self.deadline is None or time.perf_counter() < self.deadline:
+            return False
+        self.stop_reason = self.stop_reason or "deadline"
+        return True
+
+    def limit_reached(self, rows: Optional[int] = None) -> bool:
+        """
+        Check ctx.issues against the limits, recording the first one hit.
+
+        Args:
+            rows: Rows of the row stage done so far, kept as rows_validated
+                if a limit is hit
+        """
+        if self.stop_reason is None:
+            issues = self.issues
+            if self.max_issues is not None and len(issues) >= self.max_issues:
+                self.stop_reason = "max_issues"
+            elif self.stop_on_first_blocker and any(
+                    issue.severity == "BLOCKER" for issue in issues[self._blockers_checked:]):
+                self.stop_reason = "first_blocker"
+            else:
+                self._blockers_checked = len(issues)
+                if not self.past_deadline():
+                    return False
+        if rows is not None and self.rows_validated is None:
+            self.rows_validated = rows
+        return True
+
+
+class Stage:
+    """One step of a validation pipeline."""
+
+    # Hook/timing name; stages replacing a built-in one keep its name
+    name: str = ""
+    # "inline", "thread" or "process"
+    executor: str = "inline"
+    # Lowest tier that runs this stage
+    tier: str = "fast"
+    # Required stages still run after a limit stops the validation early
+    required: bool = False
+
+    def should_run(self, ctx: ValidationContext) -> bool:
+        return True
+
+    def run(self, ctx: ValidationContext):
+        """Do the stage's work in this process (inline and thread executors)."""
+        self.apply(ctx, self.compute(*self.inputs(ctx)))
+
+    def inputs(self, ctx: ValidationContext) -> Tuple:
+        raise NotImplementedError(f"{type(self).__name__} must implement run() or inputs/compute/apply")
+
+    def compute(self, *inputs) -> Any:
+        raise NotImplementedError(f"{type(self).__name__} must implement run() or inputs/compute/apply")
+
+    def apply(self, ctx: ValidationContext, output: Any):
+        raise NotImplementedError(f"{type(self).__name__} must implement run() or inputs/compute/apply")
+
+
+class ReadStage(Stage):
+    """Parse ctx.source into ctx.df; skipped when a frame was passed in."""
+
+    name = "reading"
+    required = True
+
+    def should_run(self, ctx):
+        return ctx.df is None
+
+    def run(self, ctx):
+        source = ctx.source
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            metrics.record_file_size(len(source))
+            source = io.BytesIO(source)
+        elif isinstance(source, str) and metrics.REGISTRY.enabled:
+            metrics.record_file_size(os.path.getsize(source))
+        ctx.df = ctx.engine._read_frame(source, ctx.filename)
+
+
+class DetectPlatformStage(Stage):
+    name = "detecting_platform"
+    required = True
+
+    def run(self, ctx):
+        # Detect platform if not overridden
+        ctx.platform = ctx.platform_override or ctx.engine._detect_platform(ctx.df)
+        ctx.config = ctx.engine.config_loader.get_config(ctx.platform)
+        if ctx.tier is None:
+            ctx.tier = check_tier(ctx.config.get('tier', DEFAULT_TIER))
+
+
+class RowValidationStage(Stage):
+    """Per-row validators over every row (ValidatorEngine._validate_rows)."""
+
+    name = "validating_rows"
+
+    def run(self, ctx):
+        stop = ctx.limit_reached if ctx.has_limits else None
+        if ctx.delta is not None:
+            ctx.delta.validate_rows(ctx, stop)
+            return
+        # Appends to ctx.issues, so hooks and limits see the same list
+        ctx.engine._validate_rows(ctx.df, ctx.config, ctx.run, ctx.profiler,
+                                  warnings=ctx.runs_tier("standard"), issues=ctx.issues, stop=stop)
+
+
+class FixStage(Stage):
+    """Record auto-fixes for the row issues in ctx.fixes (auto_fix only)."""
+
+    name = "applying_fixes"
+
+    def should_run(self, ctx):
+        return ctx.auto_fix
+
+    def run(self, ctx):
+        if ctx.fixes is None:
+            from .fix_overlay import FixOverlay
+            ctx.fixes = FixOverlay(ctx.df)
+        ctx.engine._apply_fixes(ctx.fixes, ctx.issues, ctx.config)
+
+
+class PatternStage(Stage):
+    """Dataset-level pattern mismatch detection; can run in a separate process."""
+
+    name = "detecting_patterns"
+    tier = "deep"
+
+    def run(self, ctx):
+        should_stop = ctx.past_deadline if ctx.deadline is not None else None
+        if ctx.delta is not None:
+            self.apply(ctx, ctx.delta.detect_patterns(ctx, should_stop))
+            return
+        self.apply(ctx, self.compute(ctx.df, ctx.platform, ctx.profiler, should_stop))
+
+    def inputs(self, ctx):
+        # Rule profiling, the deadline and delta state don't cross process
+        # boundaries (a process run recomputes every row)
+        return ctx.df, ctx.platform
+
+    def compute(self, df, platform, profiler=None, should_stop=None):
+        from .pattern_detector import detect_pattern_mismatches
+        return detect_pattern_mismatches(df, platform, profiler, should_stop)
+
+    def apply(self, ctx, output):
+        ctx.issues.extend(ctx.engine._pattern_issues(output))
+
+
+class DuplicateStage(Stage):
+    """Flag rows repeating an earlier row's validated values."""
+
+    name = "detecting_duplicates"
+    tier = "deep"
+
+    def run(self, ctx):
+        if ctx.profiler is not None:
+            ctx.profiler.start(None, ctx.issues)
+        ctx.issues.extend(ctx.engine._duplicate_issues(ctx.df, ctx.config))
+        if ctx.profiler is not None:
+            ctx.profiler.lap("duplicates", ctx.issues)
+
+
+class SummaryStage(Stage):
+    name = "summarizing"
+    required = True
+
+    def run(self, ctx):
+        if ctx.max_issues is not None and len(ctx.issues) > ctx.max_issues:
+            del ctx.issues[ctx.max_issues:]
+            ctx.stop_reason = ctx.stop_reason or "max_issues"
+        rows_validated = ctx.rows_validated
+        if rows_validated is None:
+            # The row stage finished, or a limit stopped the run before it
+            finished = ctx.stop_reason is None or "validating_rows" in ctx.timings
+            rows_validated = ctx.total_rows if finished else 0
+        summary = ctx.engine._generate_summary(ctx.df, ctx.issues, rows_validated)
+        ctx.result = ValidationResult(
+            platform=ctx.platform,
+            issues=ctx.issues,
+            summary=summary,
+            tier=ctx.tier,
+            partial=ctx.stop_reason is not None,
+            rows_validated=rows_validated,
+            stop_reason=ctx.stop_reason,
+            rows_revalidated=ctx.delta.rows_revalidated if ctx.delta is not None else None,
+            profile=ctx.profiler.to_profile() if ctx.profiler is not None else None
+        )
+
+
+_thread_pool: Optional[ThreadPoolExecutor] = None
+_process_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def _shared_executor(kind: str) -> Executor:
+    """Lazily created executors for "thread" and "process" stages."""
+    global _thread_pool, _process_pool
+    with _pool_lock:
+        if kind == "thread":
+            if _thread_pool is None:
+                _thread_pool = ThreadPoolExecutor(thread_name_prefix="mojo-stage")
+            return _thread_pool
+        if _process_pool is None:
+            from .worker_pool import _default_context
+            _process_pool = ProcessPoolExecutor(mp_context=_default_context())
+        return _process_pool
+
+
+class Pipeline:
+    """
+    Ordered, immutable list of stages.
+
+    Args:
+        stages: Stages in run order (names must be unique)
+        executors: Optional {"thread": Executor, "process": Executor} to use
+            instead of the shared pools, e.g. a ValidatorPool for "process"
+    """
+
+    def __init__(self, stages: Iterable[Stage], executors: Optional[Dict[str, Executor]] = None):
+        self.stages: Tuple[Stage, ...] = tuple(stages)
+        self.executors = dict(executors or {})
+        names = [stage.name for stage in self.stages]
+        if len(set(names)) != len(names):
+            raise ValueError(f"Duplicate stage names: {names}")
+        for stage in self.stages:
+            if stage.executor not in EXECUTORS:
+                raise ValueError(f"Stage {stage.name!r} has unknown executor {stage.executor!r}")
+
+    @property
+    def names(self) -> List[str]:
+        return [stage.name for stage in self.stages]
+
+    def _index(self, name: str) -> int:
+        try:
+            return self.names.index(name)
+        except ValueError:
+            raise KeyError(f"No stage named {name!r}; stages are {self.names}") from None
+
+    def replace(self, name: str, stage: Stage) -> "Pipeline":
+        """Copy with the stage called name swapped for stage."""
+        stages = list(self.stages)
+        stages[self._index(name)] = stage
+        return Pipeline(stages, self.executors)
+
+    def without(self, *names: str) -> "Pipeline":
+        """Copy with the named stages skipped."""
+        for name in names:
+            self._index(name)
+        return Pipeline([stage for stage in self.stages if stage.name not in names], self.executors)
+
+    def insert(self, stage: Stage, after: str) -> "Pipeline":
+        """Copy with stage added right after the stage called after."""
+        stages = list(self.stages)
+        stages.insert(self._index(after) + 1, stage)
+        return Pipeline(stages, self.executors)
+
+    def run(self, ctx: ValidationContext) -> ValidationContext:
+        """Run every applicable stage in order, timing each one."""
+        for stage in self.stages:
+            if not stage.required and ctx.has_limits and ctx.limit_reached():
+                continue
+            if not ctx.runs_tier(stage.tier) or not stage.should_run(ctx):
+                continue
+            events = ctx.run.stage(stage.name, ctx.total_rows, ctx.issues) if ctx.run is not None else nullcontext()
+            started = time.perf_counter()
+            with events:
+                self._execute(stage, ctx)
+            ctx.timings[stage.name] = time.perf_counter() - started
+        return ctx
+
+    def _execute(self, stage: Stage, ctx: ValidationContext):
+        if stage.executor == "inline":
+            stage.run(ctx)
+            return
+        executor = self.executors.get(stage.executor) or _shared_executor(stage.executor)
+        if stage.executor == "thread":
+            executor.submit(stage.run, ctx).result()
+        else:
+            stage.apply(ctx, executor.submit(stage.compute, *stage.inputs(ctx)).result())
+
+
+DEFAULT_STAGES = (
+    ReadStage(),
+    DetectPlatformStage(),
+    RowValidationStage(),
+    FixStage(),
+    PatternStage(),
+    DuplicateStage(),
+    SummaryStage(),
+)
+
+
+def default_pipeline() -> Pipeline:
+    """The standard stage order used by ValidatorEngine."""
+    return Pipeline(DEFAULT_STAGES)
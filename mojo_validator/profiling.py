@@ -0,0 +1,149 @@
+"""
+Built-in profiler switch for validation runs.
+
+A validation run with a profile path (profile_path= on the validate_*
+methods, ``--profile`` on the CLI, or the MOJO_VALIDATOR_PROFILE
+environment variable) runs under cProfile with tracemalloc tracing, and
+writes two files:
+
+- ``<path>.prof``: cProfile stats, readable with ``python -m pstats`` or
+  tools such as snakeviz
+- ``<path>.memory.json``: a tracemalloc snapshot per pipeline stage
+  (allocated and peak bytes, top allocation sites)
+
+MOJO_VALIDATOR_PROFILE names a directory; profiles are written there as
+``<input file stem>.prof`` etc. The CLI writes them next to its outputs.
+"""
+
+import json
+import os
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+from .hooks import ValidationHook
+from .models import Issue
+
+PROFILE_ENV = "MOJO_VALIDATOR_PROFILE"
+
+# Allocation sites kept per stage snapshot
+TOP_ALLOCATIONS = 10
+
+# Allocation sites that are profiling or import machinery, not validation
+_IGNORED_FILES = {tracemalloc.__file__, "<frozen importlib._bootstrap>", "<frozen importlib._bootstrap_external>"}
+
+
+def env_profile_path(filename: str) -> Optional[str]:
+    """Profile path for filename under $MOJO_VALIDATOR_PROFILE, or None if unset."""
+    directory = os.environ.get(PROFILE_ENV)
+    if not directory:
+        return None
+    stem = os.path.splitext(os.path.basename(filename))[0] or "validation"
+    return os.path.join(directory, stem)
+
+
+class MemorySnapshots(ValidationHook):
+    """
+    Takes a tracemalloc snapshot at the end of every stage.
+
+    Snapshotting walks every live allocation, so the CPU profiler (if given)
+    is paused meanwhile to keep it out of the CPU profile.
+    """
+
+    row_interval = 0
+
+    def __init__(self, profiler=None):
+        self.profiler = profiler
+        self.stages: List[Dict[str, Any]] = []
+
+    def on_stage_start(self, stage: str, total_rows: int, issues: List[Issue]):
+        # Peak is reported per stage
+        tracemalloc.reset_peak()
+
+    def on_stage_end(self, stage: str, seconds: float, total_rows: int, issues: List[Issue]):
+        current, peak = tracemalloc.get_traced_memory()
+        if self.profiler is not None:
+            self.profiler.disable()
+        try:
+            self._snapshot(stage, seconds, total_rows, current, peak)
+        finally:
+            if self.profiler is not None:
+                self.profiler.enable()
+
+    def _snapshot(self, stage: str, seconds: float, total_rows: int, current: int, peak: int):
+        # Filtering the grouped statistics is much cheaper than filter_traces()
+        top = [
+            stat for stat in tracemalloc.take_snapshot().statistics("lineno")
+            if stat.traceback[0].filename not in _IGNORED_FILES
+        ][:TOP_ALLOCATIONS]
+        self.stages.append({
+            'stage': stage,
+            'seconds': round(seconds, 6),
+            'rows': total_rows,
+            'current_bytes': current,
+            'peak_bytes': peak,
+            'top_allocations': [
+                {
+                    'site': f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+                    'size_bytes': stat.size,
+                    'count': stat.count,
+                }
+                for stat in top
+            ],
+        })
+
+
+class ProfileSession:
+    """One profiled run: the memory hook to register, and where output goes."""
+
+    def __init__(self, path: str, profiler=None):
+        self.path = path
+        self.profiler = profiler
+        self.memory = MemorySnapshots(profiler)
+        self.stats_file = f"{path}.prof"
+        self.memory_file = f"{path}.memory.json"
+
+
+@contextmanager
+def profile_run(path: str) -> Iterator[ProfileSession]:
+    """
+    Run the enclosed code under cProfile and tracemalloc, then write the profile.
+
+    Register ``session.memory`` as a hook on the validation to get the
+    per-stage snapshots. tracemalloc is left running if it already was.
+
+    Args:
+        path: Output path without extension, e.g. "validation_output/ads"
+    """
+    import cProfile
+    # Import the heavy dependencies before tracing starts, so their import-time
+    # allocations don't swamp the stage snapshots
+    import pandas  # noqa: F401
+    from . import pattern_detector  # noqa: F401
+
+    profiler = cProfile.Profile()
+    session = ProfileSession(path, profiler)
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    started = time.perf_counter()
+    profiler.enable()
+    try:
+        yield session
+    finally:
+        profiler.disable()
+        seconds = time.perf_counter() - started
+        _, peak = tracemalloc.get_traced_memory()
+        if not was_tracing:
+            tracemalloc.stop()
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        profiler.dump_stats(session.stats_file)
+        with open(session.memory_file, 'w', encoding='utf-8') as f:
+            json.dump({
+                'seconds': round(seconds, 6),
+                # Peaks are reset per stage; the run's peak is the largest of them
+                'peak_bytes': max([peak, *(stage['peak_bytes'] for stage in session.memory.stages)]),
+                'stages': session.memory.stages,
+            }, f, indent=2)
@@ -0,0 +1,128 @@
+"""
+Memory-capped cache of validation results, shared across sessions.
+
+The Streamlit app validates uploads through this cache so that re-uploading
+the same file, switching the platform override back and forth, or several
+users opening the same export never re-run the engine. Entries are keyed by
+the upload's content hash, the platform override and the config generation,
+and the least recently used entries are evicted once the total estimated
+size goes over the byte budget.
+"""
+
+import hashlib
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+from . import metrics
+from .fix_overlay import FixOverlay
+
+# Default budget for all cached results together
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+# Rough per-issue footprint (pydantic model + strings) used for sizing
+_ISSUE_BYTES = 600
+
+
+def content_key(content: bytes, platform_override: Optional[str] = None, generation: int = 0) -> Tuple:
+    """
+    Cache key for one upload.
+
+    Args:
+        content: Raw file bytes
+        platform_override: Platform chosen in the UI (None = auto-detect)
+        generation: Config version, e.g. ConfigRegistry.generation, so config
+            edits invalidate cached results
+    """
+    return hashlib.sha256(content).hexdigest(), platform_override, generation
+
+
+def estimate_size(result, raw_df) -> int:
+    """Approximate memory held by a (result, raw_df) pair, in bytes."""
+    frame_bytes = int(raw_df.memory_usage(index=True, deep=True).sum()) if raw_df is not None else 0
+    return frame_bytes + len(result.issues) * _ISSUE_BYTES + sys.getsizeof(result)
+
+
+class ResultCache:
+    """
+    Thread-safe LRU of validation results with a total byte budget.
+
+    Cached results and frames are shared between sessions and must be treated
+    as read-only; each caller gets its own FixOverlay to edit.
+
+    Args:
+        max_bytes: Evict least recently used entries beyond this estimated size
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        # key -> (result, pristine fixes overlay, estimated bytes)
+        self._entries: "OrderedDict[Hashable, Tuple[Any, FixOverlay, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def get(self, key: Hashable) -> Optional[Tuple[Any, FixOverlay, Any]]:
+        """Return (result, fixes, raw_df) for key, or None. fixes is a fresh copy."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                metrics.record_cache("result", False)
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        metrics.record_cache("result", True)
+        result, fixes, _ = entry
+        return result, fixes.copy(), fixes.base
+
+    def put(self, key: Hashable, result, fixes: FixOverlay, nbytes: Optional[int] = None):
+        """Store a result, evicting older entries to stay within max_bytes."""
+        nbytes = estimate_size(result, fixes.base) if nbytes is None else nbytes
+        fixes = fixes.copy()
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.total_bytes -= old[2]
+            if nbytes > self.max_bytes:
+                # Too large to keep at all; don't flush everything else for it
+                return
+            self._entries[key] = (result, fixes, nbytes)
+            self.total_bytes += nbytes
+            while self.total_bytes > self.max_bytes:
+                _, (_, _, evicted) = self._entries.popitem(last=False)
+                self.total_bytes -= evicted
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.total_bytes = 0
+
+    def validate(self, key: Hashable, compute: Callable[[], Tuple[Any, FixOverlay, Any]]) -> Tuple[Any, FixOverlay, Any]:
+        """
+        Return a cached validation, or run compute() and cache its output.
+
+        Args:
+            key: From content_key()
+            compute: Runs the validation, returning (result, fixes, raw_df)
+                like ValidatorEngine.validate_bytes
+
+        Returns:
+            Tuple of (result, fixes, raw_df); fixes is always an overlay owned
+            by the caller, so edits never leak into the cache
+        """
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+
+        result, fixes, raw_df = compute()
+        self.put(key, result, fixes)
+        return result, fixes, raw_df
@@ -0,0 +1,54 @@
+"""
+Opt-in per-rule instrumentation.
+
+When a validation runs with profile_rules=True, the row validators and the
+pattern detector report each rule they run to a RuleProfiler, which keeps
+wall time, call count and issue-hit count per (rule, column). The totals are
+attached to ValidationResult.profile.
+
+Timing works in laps: start() marks the beginning of one column's checks
+and every lap() charges the time (and new issues) since the previous mark to
+the named rule. Code paths only call these when a profiler is present, so
+unprofiled validations pay a None check per rule.
+"""
+
+import time
+from typing import Dict, List, Optional, Tuple
+
+from .models import RuleStats, ValidationProfile
+
+
+class RuleProfiler:
+    """Accumulates timings and hit counts for one validation."""
+
+    def __init__(self):
+        # (rule, column) -> [calls, seconds, hits]
+        self._stats: Dict[Tuple[str, Optional[str]], list] = {}
+        self._column: Optional[str] = None
+        self._mark = 0.0
+        self._issue_count = 0
+
+    def start(self, column: Optional[str], issues: list):
+        """Begin a run of checks on column; issues is the list they append to."""
+        self._column = column
+        self._issue_count = len(issues)
+        self._mark = time.perf_counter()
+
+    def lap(self, rule: str, issues: list):
+        """Charge the time and issues since the last mark to rule."""
+        now = time.perf_counter()
+        stat = self._stats.get((rule, self._column))
+        if stat is None:
+            stat = self._stats[(rule, self._column)] = [0, 0.0, 0]
+        stat[0] += 1
+        stat[1] += now - self._mark
+        stat[2] += len(issues) - self._issue_count
+        self._issue_count = len(issues)
+        self._mark = now
+
+    def to_profile(self) -> ValidationProfile:
+        rules: List[RuleStats] = [
+            RuleStats(rule=rule, column=column, calls=calls, seconds=seconds, hits=hits)
+            for (rule, column), (calls, seconds, hits) in self._stats.items()
+        ]
+        return ValidationProfile(rules=rules)
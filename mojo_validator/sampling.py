@@ -0,0 +1,191 @@
+"""
+Statistical quick scan: estimate a file's issue rates from a sample.
+
+Validating every row of a multi-million-row file takes minutes; a verdict on
+whether it is worth doing takes a sample. quick_scan() validates a stratified
+random sample of rows with the normal row rules and reports, per rule and
+column, the estimated share of rows affected with a Wilson confidence
+interval, plus a few concrete example issues.
+
+The sample is stratified by campaign and ad group when those columns exist:
+each stratum gets a share of the sample proportional to its size, so a few
+huge campaigns can't crowd out the rest. Rows are weighted by how many rows
+of their stratum they stand for, and intervals use the weights' effective
+sample size.
+
+Only row rules are sampled; the dataset-level pattern and duplicate checks
+of the deep tier need the whole file.
+"""
+
+import math
+from statistics import NormalDist
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .delta import _moved_issue
+from .models import QuickScanResult, RateEstimate, RuleEstimate
+from .pipeline import DEFAULT_TIER, check_tier
+
+DEFAULT_SAMPLE_ROWS = 1000
+EXAMPLES_PER_RULE = 3
+
+# Stratification levels, each with its column name per platform
+STRATA_COLUMNS = (
+    ("Campaign", "Campaign Name"),
+    ("Ad Group", "Ad Set Name", "Ad Group Name"),
+)
+
+
+def strata_columns(df: pd.DataFrame) -> List[str]:
+    """The campaign and ad group columns present in df."""
+    columns = []
+    for candidates in STRATA_COLUMNS:
+        column = next((c for c in candidates if c in df.columns), None)
+        if column is not None:
+            columns.append(column)
+    return columns
+
+
+def stratified_sample(df: pd.DataFrame, rows: int, strata: List[str],
+                      seed: int = 0) -> Tuple[pd.DataFrame, np.ndarray]:
+    """
+    Draw rows rows of df, allocated to strata in proportion to their size.
+
+    Args:
+        df: Frame to sample
+        rows: Sample size (all of df if it has no more rows than this)
+        strata: Columns whose value combinations form the strata (may be empty)
+        seed: Random seed, so repeated scans of a file agree
+
+    Returns:
+        Tuple of (sample, weights): the sampled rows in file order, and for
+        each the number of rows of df it stands for
+    """
+    total = len(df)
+    if rows >= total:
+        return df, np.ones(total)
+
+    if strata:
+        codes = df.groupby(strata, dropna=False, sort=False).ngroup().to_numpy()
+    else:
+        codes = np.zeros(total, dtype=np.int64)
+    sizes = np.bincount(codes)
+
+    # Largest-remainder allocation, so the quotas add up to exactly rows
+    quota = sizes * (rows / total)
+    take = np.floor(quota).astype(np.int64)
+    short = rows - take.sum()
+    if short:
+        take[np.argsort(take - quota, kind="stable")[:short]] += 1
+
+    # Shuffle, group by stratum (keeping the shuffled order within each),
+    # then keep the first take[h] positions of stratum h
+    rng = np.random.default_rng(seed)
+    shuffled = rng.permutation(total)
+    shuffled = shuffled[np.argsort(codes[shuffled], kind="stable")]
+    shuffled_codes = codes[shuffled]
+    starts = np.concatenate(([0], np.cumsum(sizes)[:-1]))
+    rank = np.arange(total) - starts[shuffled_codes]
+    positions = np.sort(shuffled[rank < take[shuffled_codes]])
+
+    sampled_codes = codes[positions]
+    return df.iloc[positions], sizes[sampled_codes] / take[sampled_codes]
+
+
+def wilson_interval(rate: float, n: float, z: float) -> Tuple[float, float]:
+    """Wilson score interval for a proportion observed over n trials."""
+    if n <= 0:
+        return 0.0, 1.0
+    z2 = z * z
+    denominator = 1 + z2 / n
+    centre = (rate + z2 / (2 * n)) / denominator
+    half = z * math.sqrt(rate * (1 - rate) / n + z2 / (4 * n * n)) / denominator
+    return max(0.0, centre - half), min(1.0, centre + half)
+
+
+def quick_scan(engine, df: pd.DataFrame, sample_rows: Optional[int] = None,
+               platform_override: Optional[str] = None, tier: Optional[str] = None,
+               confidence: float = 0.95, seed: int = 0,
+               examples: int = EXAMPLES_PER_RULE) -> QuickScanResult:
+    """
+    Estimate df's issue rates from a stratified sample of its rows.
+
+    Args:
+        engine: ValidatorEngine providing the configs and row rules
+        df: Parsed bulk sheet (left unmodified)
+        sample_rows: Rows to validate (default: DEFAULT_SAMPLE_ROWS)
+        platform_override: Optional platform name to skip detection
+        tier: "fast" (blockers only) or "standard"; "deep" samples the same
+            rules as standard. Default from the platform config, else deep
+        confidence: Confidence level of the intervals
+        seed: Random seed for the sample
+        examples: Example issues kept per rule and column
+
+    Returns:
+        QuickScanResult; its summary holds the plain counts over the sample
+    """
+    if sample_rows is None:
+        sample_rows = DEFAULT_SAMPLE_ROWS
+    if sample_rows < 1:
+        raise ValueError(f"sample_rows must be at least 1, got {sample_rows}")
+    if not 0 < confidence < 1:
+        raise ValueError(f"confidence must be between 0 and 1, got {confidence}")
+    platform = platform_override or engine._detect_platform(df)
+    config = engine.config_loader.get_config(platform)
+    tier = check_tier(tier or config.get('tier', DEFAULT_TIER))
+
+    strata = strata_columns(df)
+    sample, weights = stratified_sample(df, sample_rows, strata, seed)
+    # Validate by sample position, so repeated index labels stay distinct rows;
+    # only the example issues are mapped back to their labels in df
+    labels = sample.index.tolist()
+    sample = sample.reset_index(drop=True)
+    issues = engine._validate_rows(sample, config, warnings=tier != "fast")
+
+    exact = len(sample) == len(df)
+    total_weight = float(weights.sum())
+    # Kish effective sample size of the weighted sample
+    n_eff = total_weight ** 2 / float((weights ** 2).sum()) if len(weights) else 0.0
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+
+    def estimate(rows: Set) -> RateEstimate:
+        rate = float(weights[list(rows)].sum()) / total_weight if rows and total_weight else 0.0
+        low, high = (rate, rate) if exact else wilson_interval(rate, n_eff, z)
+        return RateEstimate(rate=rate, low=low, high=high)
+
+    by_rule: Dict[Tuple[str, str], Dict] = {}
+    for issue in issues:
+        entry = by_rule.setdefault((issue.kind, issue.column),
+                                   {'severity': issue.severity, 'rows': set(), 'examples': []})
+        entry['rows'].add(issue.row_idx)
+        if len(entry['examples']) < examples:
+            entry['examples'].append(_moved_issue(issue, labels[issue.row_idx]))
+
+    rules = []
+    for (kind, column), entry in by_rule.items():
+        rule_estimate = estimate(entry['rows'])
+        rules.append(RuleEstimate(
+            rule=kind,
+            column=column,
+            severity=entry['severity'],
+            sample_hits=len(entry['rows']),
+            estimate=rule_estimate,
+            estimated_rows=round(rule_estimate.rate * len(df)),
+            examples=entry['examples'],
+        ))
+    rules.sort(key=lambda r: r.estimate.rate, reverse=True)
+
+    return QuickScanResult(
+        platform=platform,
+        tier="fast" if tier == "fast" else "standard",
+        total_rows=len(df),
+        sample_rows=len(sample),
+        strata=strata,
+        confidence=confidence,
+        summary=engine._generate_summary(sample, issues),
+        row_issue_rate=estimate({issue.row_idx for issue in issues}),
+        row_blocker_rate=estimate({issue.row_idx for issue in issues if issue.severity == "BLOCKER"}),
+        rules=rules,
+    )
@@ -0,0 +1,209 @@
+"""
+Shared-memory DataFrame hand-off for worker processes.
+
+Instead of pickling a DataFrame shard for every task, the parent lays the
+frame's column buffers out once in a multiprocessing shared memory block and
+sends workers only a small descriptor. Workers map the block and rebuild just
+the rows they were given:
+
+- numeric / bool / datetime columns are numpy views onto the shared buffer
+  (zero-copy)
+- text columns are stored Arrow-style as one UTF-8 data buffer plus int64
+  offsets and a null mask, so a worker decodes only its own row range
+- anything else (mixed-type object columns, a non-range index) falls back
+  to pickles of fixed-size row chunks, so a worker only unpickles the chunks
+  covering its rows
+
+pyarrow is not a dependency of this project, hence the small built-in layout.
+"""
+
+import gc
+import pickle
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+
+# Buffers are 8-byte aligned so numpy views of int64/float64 data are aligned
+_ALIGN = 8
+# Rows per pickled chunk of a fallback column or index
+PICKLE_CHUNK_ROWS = 1024
+
+
+def _aligned(size: int) -> int:
+    return (size + _ALIGN - 1) // _ALIGN * _ALIGN
+
+
+def _pickle_chunks(values, chunk_rows: int) -> List[np.ndarray]:
+    """
+    Pickle values (an array or Index) in chunks of chunk_rows rows.
+
+    Returns [offsets, data]: the chunks' pickles concatenated, and int64 byte
+    offsets of each chunk in it. There is always at least one (maybe empty)
+    chunk, so an empty slice keeps the original type.
+    """
+    count = max(1, -(-len(values) // chunk_rows))
+    blobs = [pickle.dumps(values[i * chunk_rows:(i + 1) * chunk_rows], protocol=pickle.HIGHEST_PROTOCOL)
+             for i in range(count)]
+    offsets = np.zeros(count + 1, dtype=np.int64)
+    np.cumsum([len(blob) for blob in blobs], out=offsets[1:])
+    return [offsets, np.frombuffer(b''.join(blobs), dtype=np.uint8)]
+
+
+def _unpickle_rows(offsets: np.ndarray, data: np.ndarray, chunk_rows: int, start: int,
+                   stop: int) -> Tuple[list, int]:
+    """
+    Unpickle only the chunks covering rows [start, stop).
+
+    Returns:
+        The chunks' values, and the position of row start in the first one
+    """
+    last_chunk = len(offsets) - 2
+    first = min(start // chunk_rows, last_chunk)
+    last = min(max(first, (stop - 1) // chunk_rows), last_chunk)
+    pieces = [pickle.loads(data[offsets[i]:offsets[i + 1]].tobytes()) for i in range(first, last + 1)]
+    return pieces, start - first * chunk_rows
+
+
+def _encode_column(series: pd.Series) -> Tuple[Dict[str, Any], List[np.ndarray]]:
+    """Pick a layout for one column and return (layout, buffers)."""
+    dtype = series.dtype
+    if isinstance(dtype, np.dtype) and dtype.kind in 'biufcmM':
+        values = np.ascontiguousarray(series.to_numpy())
+        return {'kind': 'numpy', 'dtype': values.dtype.str}, [values]
+
+    values = series.to_numpy(dtype=object)
+    nulls = pd.isna(series).to_numpy()
+    present = values[~nulls]
+    if all(isinstance(v, str) for v in present):
+        encoded = [b'' if null else v.encode('utf-8', 'surrogatepass') for v, null in zip(values, nulls)]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(b) for b in encoded], out=offsets[1:])
+        data = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+        return {'kind': 'utf8'}, [offsets, nulls.astype(np.uint8), data]
+
+    return {'kind': 'pickle', 'chunk_rows': PICKLE_CHUNK_ROWS}, _pickle_chunks(values, PICKLE_CHUNK_ROWS)
+
+
+class SharedFrame:
+    """
+    A DataFrame's column buffers laid out in one shared memory block.
+
+    Create it in the parent with SharedFrame.create(df), pass .descriptor to
+    workers, and rebuild row ranges there with SharedFrame.attach(d).to_frame().
+    The creating side owns the block and unlinks it on exit.
+    """
+
+    def __init__(self, shm: shared_memory.SharedMemory, layout: Dict[str, Any], owner: bool):
+        self.shm = shm
+        self.layout = layout
+        self._owner = owner
+
+    @classmethod
+    def create(cls, df: pd.DataFrame) -> "SharedFrame":
+        columns = []
+        buffers: List[np.ndarray] = []
+        for i in range(df.shape[1]):
+            layout, column_buffers = _encode_column(df.iloc[:, i])
+            layout['name'] = df.columns[i]
+            layout['buffers'] = len(column_buffers)
+            columns.append(layout)
+            buffers.extend(column_buffers)
+
+        if isinstance(df.index, pd.RangeIndex):
+            index = {'kind': 'range', 'start': df.index.start, 'step': df.index.step}
+        else:
+            index = {'kind': 'pickle', 'chunk_rows': PICKLE_CHUNK_ROWS}
+            buffers.extend(_pickle_chunks(df.index, PICKLE_CHUNK_ROWS))
+
+        size = sum(_aligned(b.nbytes) for b in buffers)
+        shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        spans = []
+        offset = 0
+        for b in buffers:
+            raw = b.reshape(-1).view(np.uint8)
+            shm.buf[offset:offset + raw.nbytes] = raw
+            spans.append((offset, b.dtype.str, b.size))
+            offset += _aligned(b.nbytes)
+
+        layout = {'nrows': len(df), 'columns': columns, 'index': index, 'spans': spans}
+        return cls(shm, layout, owner=True)
+
+    @classmethod
+    def attach(cls, descriptor: Dict[str, Any]) -> "SharedFrame":
+        """Map a block created in another process (without taking ownership)."""
+        try:
+            shm = shared_memory.SharedMemory(name=descriptor['name'], track=False)
+        except TypeError:
+            # Python < 3.13 always registers the segment with the resource
+            # tracker. Pool workers share the parent's tracker, so this is a
+            # duplicate of the owner's registration, cleared when it unlinks.
+            shm = shared_memory.SharedMemory(name=descriptor['name'])
+        return cls(shm, descriptor['layout'], owner=False)
+
+    @property
+    def descriptor(self) -> Dict[str, Any]:
+        """Small picklable handle to send to workers."""
+        return {'name': self.shm.name, 'layout': self.layout}
+
+    def _buffer(self, i: int) -> np.ndarray:
+        offset, dtype, count = self.layout['spans'][i]
+        return np.ndarray((count,), dtype=np.dtype(dtype), buffer=self.shm.buf, offset=offset)
+
+    def to_frame(self, start: int = 0, stop: Optional[int] = None) -> pd.DataFrame:
+        """Rebuild rows [start, stop) as a DataFrame with the original labels."""
+        nrows = self.layout['nrows']
+        stop = nrows if stop is None else min(stop, nrows)
+
+        arrays = []
+        b = 0
+        for column in self.layout['columns']:
+            if column['kind'] == 'numpy':
+                arrays.append(self._buffer(b)[start:stop])
+            elif column['kind'] == 'utf8':
+                offsets, nulls, data = self._buffer(b), self._buffer(b + 1), self._buffer(b + 2)
+                values = np.empty(stop - start, dtype=object)
+                for i in range(start, stop):
+                    if nulls[i]:
+                        values[i - start] = np.nan
+                    else:
+                        values[i - start] = bytes(data[offsets[i]:offsets[i + 1]]).decode('utf-8', 'surrogatepass')
+                arrays.append(values)
+            else:
+                pieces, skip = _unpickle_rows(self._buffer(b), self._buffer(b + 1), column['chunk_rows'],
+                                              start, stop)
+                arrays.append(np.concatenate(pieces)[skip:skip + stop - start])
+            b += column['buffers']
+
+        index_layout = self.layout['index']
+        if index_layout['kind'] == 'range':
+            step = index_layout['step']
+            first = index_layout['start'] + start * step
+            index = pd.RangeIndex(first, first + (stop - start) * step, step)
+        else:
+            pieces, skip = _unpickle_rows(self._buffer(b), self._buffer(b + 1), index_layout['chunk_rows'],
+                                          start, stop)
+            index = pieces[0].append(pieces[1:])[skip:skip + stop - start]
+
+        frame = pd.DataFrame(dict(enumerate(arrays)), index=index, copy=False)
+        frame.columns = [column['name'] for column in self.layout['columns']]
+        return frame
+
+    def close(self):
+        """Release this process's mapping (views into the block must be gone)."""
+        try:
+            self.shm.close()
+        except BufferError:
+            gc.collect()
+            self.shm.close()
+
+    def unlink(self):
+        if self._owner:
+            self.shm.unlink()
+
+    def __enter__(self) -> "SharedFrame":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+        self.unlink()
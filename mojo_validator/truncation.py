@@ -0,0 +1,73 @@
+"""
+Smart truncation helpers.
+
+Implements the word-boundary + ellipsis algorithm described in
+docs/SMART_TRUNCATION.md. Results are memoized on (text, max_length) so the
+same long headline repeated across ad groups is only truncated once, and
+whole columns can be truncated in one batch.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+@lru_cache(maxsize=16384)
+def smart_truncate(text: str, max_length: int) -> str:
+    """
+    Intelligently truncate text to max_length, trying to preserve whole words.
+    Adds ellipsis (...) if truncated.
+
+    Args:
+        text: Original text
+        max_length: Maximum character length
+
+    Returns:
+        Truncated text with ellipsis if needed
+    """
+    if len(text) <= max_length:
+        return text
+
+    # Reserve 3 characters for ellipsis
+    target_length = max_length - 3
+
+    if target_length < 10:
+        # If too short for smart truncation, just hard truncate
+        return text[:max_length]
+
+    # Truncate to target length
+    truncated = text[:target_length]
+
+    # Try to truncate at last complete word
+    last_space = truncated.rfind(' ')
+    if last_space > target_length * 0.7:  # Only if we don't lose more than 30%
+        truncated = truncated[:last_space]
+
+    # Add ellipsis
+    return truncated.rstrip() + "..."
+
+
+def smart_truncate_many(values: pd.Series, max_length: int) -> pd.Series:
+    """
+    Truncate every overlength string in a Series at once.
+
+    Each distinct value is truncated a single time and the result is mapped
+    back onto all rows holding it.
+
+    Args:
+        values: Series of strings
+        max_length: Maximum character length
+
+    Returns:
+        Series (same index) containing only the rows that needed truncation
+    """
+    import pandas as pd
+    over = values[values.str.len() > max_length]
+    if over.empty:
+        return over
+    lookup = {text: smart_truncate(text, max_length) for text in pd.unique(over)}
+    return over.map(lookup)
@@ -0,0 +1,284 @@
+"""
+Pre-warmed validation worker pool.
+
+Each worker process builds one ValidatorEngine and loads every platform config
+(through the on-disk compiled config cache) when it starts (via the pool
+initializer), then keeps it for the lifetime of the pool. On platforms that support it the pool uses a fork server that has
+already imported pandas and the engine, so new workers start without paying
+the import cost either. Per-task overhead for small sheets is then just the
+validation itself.
+"""
+
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Optional
+
+from .pipeline import Stage
+
+# Modules imported once in the fork server and inherited by every worker
+PRELOAD_MODULES = ['pandas', 'mojo_validator.engine']
+
+# Seconds ValidatorPool.start() waits for every worker to come up
+START_TIMEOUT = 120
+
+# Per-process engine, set by _init_worker (or lazily by get_worker_engine)
+_WORKER_ENGINE = None
+
+
+def _init_worker(config_dir: str):
+    global _WORKER_ENGINE
+    from .config_loader import ConfigLoader
+    from .engine import ValidatorEngine
+    # Workers (and the CLI, which validates through them) reuse compiled configs
+    _WORKER_ENGINE = ValidatorEngine(config_dir, config_loader=ConfigLoader(config_dir, use_cache=True))
+    _WORKER_ENGINE.warm_up()
+
+
+def _worker_pid(barrier=None) -> int:
+    # Holding each worker at the barrier until all have arrived keeps one
+    # worker from answering several pings
+    if barrier is not None:
+        barrier.wait(START_TIMEOUT)
+    return os.getpid()
+
+
+def get_worker_engine(config_dir: str):
+    """
+    Return this process's engine, creating and warming it if the process
+    wasn't started by a ValidatorPool (or was started for another config dir).
+    """
+    if _WORKER_ENGINE is None or _WORKER_ENGINE.config_loader.config_dir != config_dir:
+        _init_worker(config_dir)
+    return _WORKER_ENGINE
+
+
+def _pack_issues(issues) -> Dict[str, Any]:
+    """
+    Turn row issues into compact columnar arrays for the trip back to the parent.
+
+    Strings (columns, kinds, severities, messages, fixes) are interned into one
+    table and referenced by code; original values are dropped because the parent
+    already holds the frame they came from.
+    """
+    table: Dict[str, int] = {}
+
+    def code(value: Optional[str]) -> int:
+        if value is None:
+            return -1
+        return table.setdefault(value, len(table))
+
+    rows, columns, kinds, severities, messages, fixes = [], [], [], [], [], []
+    for issue in issues:
+        prefix = f"{issue.row_idx}_{issue.column}_"
+        rows.append(issue.row_idx)
+        columns.append(code(issue.column))
+        kinds.append(code(issue.issue_id[len(prefix):]))
+        severities.append(code(issue.severity))
+        messages.append(code(issue.message))
+        fixes.append(code(issue.suggested_fix))
+    return {
+        'strings': list(table), 'rows': rows, 'columns': columns, 'kinds': kinds,
+        'severities': severities, 'messages': messages, 'fixes': fixes,
+    }
+
+
+def _unpack_issues(packed: Dict[str, Any], df) -> list:
+    """Rebuild Issue models from _pack_issues output, taking original values from df."""
+    from .models import Issue
+    strings = packed['strings']
+    issues = []
+    for row_idx, column, kind, severity, message, fix in zip(
+            packed['rows'], packed['columns'], packed['kinds'],
+            packed['severities'], packed['messages'], packed['fixes']):
+        column = strings[column]
+        issues.append(Issue.model_construct(
+            issue_id=f"{row_idx}_{column}_{strings[kind]}",
+            row_idx=row_idx,
+            column=column,
+            severity=strings[severity],
+            message=strings[message],
+            suggested_fix=strings[fix] if fix >= 0 else None,
+            original_value=df.at[row_idx, column] if column in df.columns else None,
+        ))
+    return issues
+
+
+def _validate_shard(descriptor: Dict[str, Any], start: int, stop: int, platform: str, config_dir: str,
+                    warnings: bool = True) -> Dict[str, Any]:
+    """Validate rows [start, stop) of a SharedFrame. Runs inside a worker process."""
+    from .shared_frame import SharedFrame
+    engine = get_worker_engine(config_dir)
+    config = engine.config_loader.get_config(platform)
+    shared = SharedFrame.attach(descriptor)
+    try:
+        shard = shared.to_frame(start, stop)
+        issues = engine._validate_rows(shard, config, warnings=warnings)
+        del shard
+    finally:
+        shared.close()
+    return _pack_issues(issues)
+
+
+class ShardedRowStage(Stage):
+    """
+    Row validation split across a ValidatorPool's workers.
+
+    Drop-in for the "validating_rows" stage. The frame is shared once; each
+    worker validates a row shard and sends back compact issue arrays, which
+    are rebuilt here in row order. Row progress events and limits
+    (max_issues etc.) are checked per shard; shards not yet started are
+    cancelled once a limit is hit.
+    """
+
+    name = "validating_rows"
+
+    def __init__(self, pool: "ValidatorPool", shard_rows: Optional[int] = None):
+        self.pool = pool
+        self.shard_rows = shard_rows
+
+    def run(self, ctx):
+        from .shared_frame import SharedFrame
+        df = ctx.df
+        total = len(df)
+        shard_rows = self.shard_rows or max(1, -(-total // self.pool.workers))
+        starts = range(0, total, shard_rows)
+        with SharedFrame.create(df) as shared:
+            futures = [
+                self.pool.submit(_validate_shard, shared.descriptor, start, min(start + shard_rows, total),
+                                 ctx.platform, self.pool.config_dir, ctx.runs_tier("standard"))
+                for start in starts
+            ]
+            row_run = ctx.run if ctx.run is not None and ctx.run.row_interval else None
+            done = 0
+            for i, future in enumerate(futures):
+                ctx.issues.extend(_unpack_issues(future.result(), df))
+                done, previous = min(starts[i] + shard_rows, total), done
+                if row_run is not None:
+                    row_run.rows(done, total, ctx.issues, since=previous)
+                if ctx.has_limits and ctx.limit_reached(done):
+                    for pending in futures[i + 1:]:
+                        pending.cancel()
+                    # Shards already running must finish before the shared frame goes away
+                    wait(futures[i + 1:])
+                    break
+
+
+def _default_context():
+    if 'forkserver' in multiprocessing.get_all_start_methods():
+        ctx = multiprocessing.get_context('forkserver')
+        ctx.set_forkserver_preload(PRELOAD_MODULES)
+        return ctx
+    return multiprocessing.get_context('spawn')
+
+
+class ValidatorPool:
+    """
+    Long-lived process pool of warmed-up validator workers.
+
+    Reusable across files and batches; use as a context manager or call
+    shutdown() when done.
+
+    Args:
+        config_dir: Directory holding the platform YAML configs
+        workers: Number of worker processes (default: CPU count)
+        mp_context: Optional multiprocessing context (default: forkserver, else spawn)
+    """
+
+    def __init__(self, config_dir: str, workers: Optional[int] = None, mp_context=None):
+        self.config_dir = os.path.abspath(config_dir)
+        self.workers = workers or os.cpu_count() or 1
+        self._mp_context = mp_context or _default_context()
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=self._mp_context,
+            initializer=_init_worker,
+            initargs=(self.config_dir,),
+        )
+        # Parent-side engine for validate_dataframe (built on first use)
+        self._engine = None
+        self._engine_lock = threading.Lock()
+        # PIDs found by start(), and whether any work was submitted
+        self._started: Optional[List[int]] = None
+        self._used = False
+        self._start_lock = threading.Lock()
+
+    def __enter__(self) -> "ValidatorPool":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
+
+    def submit(self, fn: Callable, *args: Any, **kwargs: Any) -> Future:
+        """Run fn(*args, **kwargs) on a worker; fn can call get_worker_engine()."""
+        self._used = True
+        return self._executor.submit(fn, *args, **kwargs)
+
+    def start(self) -> List[int]:
+        """
+        Start all workers now instead of on first use, so the startup cost is
+        paid before the first file arrives.
+
+        Every worker answers exactly one warm-up ping: the pings wait on a
+        shared barrier, so none returns until all workers hold one. That
+        needs every worker idle, so only a fresh pool can be started; later
+        calls return the PIDs found the first time.
+
+        Returns:
+            PIDs of all the workers
+
+        Raises:
+            RuntimeError: If work was submitted before the first start()
+        """
+        with self._start_lock:
+            if self._started is None:
+                if self._used:
+                    raise RuntimeError("ValidatorPool.start() must be called before any work is submitted")
+                with self._mp_context.Manager() as manager:
+                    barrier = manager.Barrier(self.workers)
+                    futures = [self._executor.submit(_worker_pid, barrier) for _ in range(self.workers)]
+                    self._started = sorted(f.result() for f in futures)
+            return list(self._started)
+
+    def validate_dataframe(self, df, platform_override: Optional[str] = None, auto_fix: bool = False,
+                           shard_rows: Optional[int] = None, **options: Any):
+        """
+        Validate one (large) frame with its rows split across the workers.
+
+        Runs the engine's pipeline with "validating_rows" swapped for a
+        ShardedRowStage: the frame is placed in shared memory once; each worker
+        rebuilds only its row shard and sends back compact issue arrays. Platform
+        detection, fixes, the dataset-level pattern pass and the summary run here
+        in the parent, so the result is identical to ValidatorEngine.validate_dataframe.
+
+        Args:
+            df: Parsed bulk sheet
+            platform_override: Optional platform name to skip detection
+            auto_fix: If True, automatically apply fixes
+            shard_rows: Rows per task (default: split evenly across workers)
+            **options: Other ValidatorEngine.validate_dataframe options (tier,
+                max_issues, stop_on_first_blocker, deadline, ...). A pipeline
+                given here gets its "validating_rows" stage sharded
+
+        Returns:
+            Tuple of (result, fixes, raw_df), as ValidatorEngine.validate_dataframe
+        """
+        engine = self.engine
+        pipeline = options.pop('pipeline', None) or engine.pipeline
+        pipeline = pipeline.replace("validating_rows", ShardedRowStage(self, shard_rows))
+        return engine.validate_dataframe(df, platform_override, auto_fix, pipeline=pipeline, **options)
+
+    @property
+    def engine(self):
+        """The parent process's engine, which runs everything but the row shards."""
+        with self._engine_lock:
+            if self._engine is None:
+                from .config_loader import ConfigLoader
+                from .engine import ValidatorEngine
+                self._engine = ValidatorEngine(self.config_dir,
+                                               config_loader=ConfigLoader(self.config_dir, use_cache=True))
+            return self._engine
+
+    def shutdown(self, wait: bool = True):
+        self._executor.shutdown(wait=wait)
@@ -0,0 +1,18 @@
+"""
+Shared test fixtures.
+"""
+
+import os
+import pytest
+
+
+@pytest.fixture(autouse=True, scope="session")
+def config_cache_dir(tmp_path_factory):
+    """Keep compiled configs from the CLI and worker pool out of the real home directory."""
+    previous = os.environ.get("MOJO_VALIDATOR_CACHE_DIR")
+    os.environ["MOJO_VALIDATOR_CACHE_DIR"] = str(tmp_path_factory.mktemp("config_cache"))
+    yield os.environ["MOJO_VALIDATOR_CACHE_DIR"]
+    if previous is None:
+        del os.environ["MOJO_VALIDATOR_CACHE_DIR"]
+    else:
+        os.environ["MOJO_VALIDATOR_CACHE_DIR"] = previous
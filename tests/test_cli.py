@@ -0,0 +1,133 @@
+"""
+Tests for the mojo-validate command-line batch validator.
+"""
+
+import json
+import os
+import pytest
+import pandas as pd
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+from mojo_validator import cli
+from mojo_validator.worker_pool import ValidatorPool
+
+
+class _CrashingPool:
+    """Runs tasks inline, except that a file named *crash* breaks the pool."""
+
+    workers = 2
+
+    def submit(self, fn, path, *args):
+        future = Future()
+        if "crash" in path:
+            future.set_exception(BrokenProcessPool("a worker process died"))
+        else:
+            future.set_result(fn(path, *args))
+        return future
+
+    def shutdown(self, wait=True):
+        pass
+
+
+@pytest.fixture
+def bulk_files(tmp_path):
+    """Write one clean and one broken LinkedIn file."""
+    clean = pd.DataFrame({
+        "Campaign Name": ["Test"],
+        "Status": ["ACTIVE"],
+        "Headline": ["Valid"],
+        "Introduction": ["Some intro"],
+        "Landing Page URL": ["https://example.com"],
+    })
+    broken = clean.assign(**{"Landing Page URL": ["not a url"]})
+    clean.to_csv(tmp_path / "clean.csv", index=False)
+    broken.to_csv(tmp_path / "broken.csv", index=False)
+    (tmp_path / "notes.txt").write_text("ignored")
+    return tmp_path
+
+
+class TestPathExpansion:
+    """Test file, directory and glob expansion."""
+    
+    def test_expand_directory_and_glob(self, bulk_files):
+        """Test directories and globs expand to supported files only, without duplicates."""
+        paths = cli.expand_paths([str(bulk_files), str(bulk_files / "*.csv")])
+        assert sorted(os.path.basename(p) for p in paths) == ["broken.csv", "clean.csv"]
+    
+    def test_output_stems_are_unique(self):
+        """Test files with the same name in different folders get distinct outputs."""
+        stems = cli.output_stems(["a/ads.csv", "b/ads.csv"])
+        assert stems == {"a/ads.csv": "ads", "b/ads.csv": "ads_2"}
+
+
+class TestBatchRun:
+    """Test end-to-end batch validation."""
+    
+    def test_blockers_give_non_zero_exit(self, bulk_files, tmp_path):
+        """Test outputs are written and blockers fail the run."""
+        out = tmp_path / "out"
+        code = cli.main([str(bulk_files / "*.csv"), "-o", str(out), "-j", "1", "-q",
+                         "-p", "LinkedIn Ads"])
+        
+        assert code == cli.EXIT_BLOCKERS
+        summary = json.loads((out / "summary.json").read_text())
+        assert summary["totals"]["files"] == 2
+        assert summary["totals"]["files_with_blockers"] == 1
+        
+        lines = (out / "broken.issues.jsonl").read_text().splitlines()
+        records = [json.loads(line) for line in lines]
+        assert any(r["column"] == "Landing Page URL" and r["severity"] == "BLOCKER" for r in records)
+    
+    def test_clean_file_passes(self, bulk_files, tmp_path):
+        """Test a file without blockers exits zero."""
+        code = cli.main([str(bulk_files / "clean.csv"), "-o", str(tmp_path / "out"), "-j", "1", "-q",
+                         "-p", "LinkedIn Ads", "--fail-on", "blocker"])
+        assert code == cli.EXIT_OK
+    
+    def test_profile_rules(self, bulk_files, tmp_path):
+        """Test --profile-rules records per-rule stats in summary.json."""
+        out = tmp_path / "out"
+        cli.main([str(bulk_files / "broken.csv"), "-o", str(out), "-j", "1", "-q",
+                  "-p", "LinkedIn Ads", "--profile-rules"])
+        
+        profile = json.loads((out / "summary.json").read_text())["files"][0]["rule_profile"]
+        url = next(s for s in profile if s["rule"] == "url" and s["column"] == "Landing Page URL")
+        assert url["calls"] == 1 and url["hits"] == 1
+    
+    def test_stop_on_first_blocker(self, bulk_files, tmp_path):
+        """Test a file cut short by a limit is reported as partial but still fails."""
+        out = tmp_path / "out"
+        code = cli.main([str(bulk_files / "broken.csv"), "-o", str(out), "-j", "1", "-q",
+                         "-p", "LinkedIn Ads", "--tier", "fast", "--stop-on-first-blocker"])
+        
+        assert code == cli.EXIT_BLOCKERS
+        entry = json.loads((out / "summary.json").read_text())["files"][0]
+        assert entry["partial"] and entry["stop_reason"] == "first_blocker"
+        assert entry["tier"] == "fast" and entry["rows_validated"] == 1
+    
+    def test_unreadable_file_is_reported(self, tmp_path):
+        """Test a missing input is recorded as a failed file."""
+        code = cli.main([str(tmp_path / "missing.csv"), "-o", str(tmp_path / "out"), "-j", "1", "-q"])
+        assert code == cli.EXIT_ERROR
+    
+    def test_broken_pool_is_reported_and_replaced(self, bulk_files, tmp_path, monkeypatch):
+        """Test a worker crash fails only its file and the rest run on a fresh pool."""
+        clean = pd.read_csv(bulk_files / "clean.csv")
+        for name in ("a_crash", "b", "c", "d"):
+            clean.to_csv(bulk_files / f"{name}.csv", index=False)
+        pools = []
+
+        def make_pool(config_dir, workers):
+            pools.append(_CrashingPool() if not pools else ValidatorPool(config_dir, workers=workers))
+            return pools[-1]
+
+        monkeypatch.setattr(cli, "ValidatorPool", make_pool)
+        out = tmp_path / "out"
+        code = cli.main([str(bulk_files / "*.csv"), "-o", str(out), "-j", "2", "-q", "-p", "LinkedIn Ads"])
+
+        assert code == cli.EXIT_ERROR
+        summary = json.loads((out / "summary.json").read_text())
+        errors = {os.path.basename(r["file"]): r["error"] for r in summary["files"] if r["error"]}
+        assert list(errors) == ["a_crash.csv"] and errors["a_crash.csv"].startswith("BrokenProcessPool")
+        assert summary["totals"]["files"] == 6 and summary["totals"]["files_with_blockers"] == 1
+        assert len(pools) == 2
@@ -0,0 +1,131 @@
+"""
+Tests for config loading and the compiled config cache.
+"""
+
+import os
+import shutil
+import pytest
+from mojo_validator import config_loader
+from mojo_validator.config_loader import ConfigLoader, ConfigRegistry, get_registry
+
+
+@pytest.fixture
+def config_dir(tmp_path):
+    target = tmp_path / "configs"
+    shutil.copytree("configs", target)
+    return str(target)
+
+
+class TestConfigCache:
+    """Test compiled configs are reused and invalidated correctly."""
+
+    def test_cached_config_matches_yaml(self, config_dir, tmp_path):
+        """Test a config served from the cache equals the parsed YAML."""
+        cache_dir = str(tmp_path / "cache")
+        ConfigLoader(config_dir, cache_dir=cache_dir).get_config("Google Ads")
+
+        cached = ConfigLoader(config_dir, cache_dir=cache_dir).get_config("Google Ads")
+        fresh = ConfigLoader(config_dir, use_cache=False).get_config("Google Ads")
+
+        assert cached == fresh
+        assert any(name.endswith(".pickle") and name != "manifest.pickle" for name in os.listdir(cache_dir))
+
+    def test_edited_yaml_invalidates_cache(self, config_dir, tmp_path):
+        """Test changing a YAML is picked up on the next load."""
+        cache_dir = str(tmp_path / "cache")
+        path = os.path.join(config_dir, "generic.yaml")
+        ConfigLoader(config_dir, cache_dir=cache_dir).get_config("Generic")
+
+        with open(path, "a") as f:
+            f.write("\ndescription: \"edited\"\n")
+
+        config = ConfigLoader(config_dir, cache_dir=cache_dir).get_config("Generic")
+        assert config["description"] == "edited"
+
+    def test_engine_version_invalidates_cache(self, config_dir, tmp_path, monkeypatch):
+        """Test configs compiled by another engine version are not reused."""
+        cache_dir = str(tmp_path / "cache")
+        ConfigLoader(config_dir, cache_dir=cache_dir).get_config("Generic")
+        before = set(os.listdir(cache_dir))
+
+        monkeypatch.setattr(config_loader, "ENGINE_VERSION", "0.0.0-test")
+        ConfigLoader(config_dir, cache_dir=cache_dir).get_config("Generic")
+
+        assert len(set(os.listdir(cache_dir)) - before) == 1
+
+
+    def test_cache_is_opt_in(self, config_dir, config_cache_dir):
+        """Test a plain loader never touches the cache directory."""
+        loader = ConfigLoader(config_dir)
+        loader.get_config("Generic")
+        assert loader.cache_dir is None
+        assert ConfigLoader(config_dir, use_cache=True).cache_dir == config_cache_dir
+
+    @pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX permissions")
+    def test_shared_cache_dir_ignored(self, config_dir, tmp_path):
+        """Test a cache directory others can write to is never read."""
+        cache_dir = tmp_path / "shared"
+        cache_dir.mkdir()
+        cache_dir.chmod(0o777)
+        assert ConfigLoader(config_dir, cache_dir=str(cache_dir)).cache_dir is None
+
+
+class TestPreloadAll:
+    """Test eager loading and the platform index."""
+
+    def test_platform_index(self, config_dir, tmp_path):
+        """Test every YAML is indexed by its platform key, preferring the snake_case file."""
+        loader = ConfigLoader(config_dir, cache_dir=str(tmp_path / "cache"))
+        index = loader.preload_all()
+
+        assert os.path.basename(index["Google Video Ads"]) == "google_video_ads.yaml"
+        assert os.path.basename(index["LinkedIn Ads"]) == "linkedin.yaml"
+        assert set(index) <= set(loader.configs)
+
+    def test_platform_key_fallback(self, config_dir, tmp_path):
+        """Test a platform whose filename doesn't follow its name still resolves."""
+        loader = ConfigLoader(config_dir, cache_dir=str(tmp_path / "cache"))
+        config = loader.get_config("Meta Stories & Reels Ads")
+
+        assert config["platform"] == "Meta Stories & Reels Ads"
+
+    def test_unknown_platform(self, config_dir, tmp_path):
+        """Test unknown platforms still raise FileNotFoundError."""
+        loader = ConfigLoader(config_dir, cache_dir=str(tmp_path / "cache"))
+        with pytest.raises(FileNotFoundError):
+            loader.get_config("MySpace Ads")
+
+
+class TestConfigRegistry:
+    """Test hot reloading of edited configs."""
+
+    def test_edit_is_swapped_in(self, config_dir, tmp_path):
+        """Test an edited YAML replaces only its own platform's config."""
+        registry = ConfigRegistry(config_dir, poll_interval=0, cache_dir=str(tmp_path / "cache"))
+        google = registry.get_config("Google Ads")
+        generic = registry.get_config("Generic")
+
+        with open(os.path.join(config_dir, "generic.yaml"), "a") as f:
+            f.write("\ndescription: \"edited\"\n")
+
+        assert registry.get_config("Generic")["description"] == "edited"
+        assert registry.get_config("Google Ads") is google
+        assert registry.generation == 1
+        # A validation that already held the old config is unaffected
+        assert generic.get("description") != "edited"
+
+    def test_no_poll_within_interval(self, config_dir, tmp_path):
+        """Test edits are only noticed once the poll interval has elapsed."""
+        registry = ConfigRegistry(config_dir, poll_interval=3600, cache_dir=str(tmp_path / "cache"))
+        registry.get_config("Generic")
+
+        with open(os.path.join(config_dir, "generic.yaml"), "a") as f:
+            f.write("\ndescription: \"edited\"\n")
+
+        assert registry.get_config("Generic").get("description") != "edited"
+        assert registry.refresh(force=True)
+        assert registry.get_config("Generic")["description"] == "edited"
+
+    def test_get_registry_is_shared(self):
+        """Test one registry is shared per config dir."""
+        assert get_registry("configs") is get_registry(os.path.abspath("configs"))
@@ -0,0 +1,111 @@
+"""
+Tests for delta validation of re-uploaded files.
+"""
+
+import pandas as pd
+import pytest
+from mojo_validator.delta import DeltaIndex
+from mojo_validator.engine import ValidatorEngine
+from mojo_validator.pattern_detector import PatternStats
+
+SAMPLE = "samples/google_ads_demo_50_realistic.csv"
+
+
+def _issues(result):
+    return [(i.issue_id, i.row_idx, i.severity, i.message, i.suggested_fix) for i in result.issues]
+
+
+@pytest.fixture
+def engine():
+    return ValidatorEngine("configs")
+
+
+@pytest.fixture(scope="module")
+def df():
+    return pd.read_csv(SAMPLE)
+
+
+def _edited(df):
+    """df with two cells changed, a row inserted and the order reversed."""
+    edited = df.copy()
+    column = edited.columns[3]
+    edited.loc[[4, 20], column] = "Fixed value"
+    edited = pd.concat([edited.iloc[:10], edited.iloc[[7]], edited.iloc[10:]])
+    return edited.iloc[::-1].reset_index(drop=True)
+
+
+class TestDelta:
+    """Test re-uploads revalidate only changed rows and match a full run."""
+
+    def test_first_upload_validates_everything(self, engine, df):
+        """Test a key without a snapshot validates every row and keeps one."""
+        result, _, _ = engine.validate_dataframe(df, delta_key="ads.csv")
+        assert result.rows_revalidated == len(df)
+        assert "ads.csv" in engine.deltas
+        assert engine.validate_dataframe(df)[0].rows_revalidated is None
+
+    @pytest.mark.parametrize("tier", ["fast", "deep"])
+    def test_reupload_matches_full_validation(self, engine, df, tier):
+        """Test carried-over issues equal a fresh validation of the new upload."""
+        engine.validate_dataframe(df, tier=tier, delta_key="ads.csv")
+        edited = _edited(df)
+        delta, _, _ = engine.validate_dataframe(edited, tier=tier, delta_key="ads.csv")
+        full, _, _ = engine.validate_dataframe(edited, tier=tier)
+
+        assert delta.rows_revalidated == 2
+        assert _issues(delta) == _issues(full)
+        assert delta.summary == full.summary
+
+    def test_snapshot_ignored_on_platform_change(self, engine, df):
+        """Test a different platform or tier revalidates every row."""
+        engine.validate_dataframe(df, tier="fast", delta_key="ads.csv")
+        assert engine.validate_dataframe(df, tier="deep", delta_key="ads.csv")[0].rows_revalidated == len(df)
+        result, _, _ = engine.validate_dataframe(df, platform_override="Meta Ads", delta_key="ads.csv")
+        assert result.rows_revalidated == len(df)
+
+    def test_partial_run_keeps_previous_snapshot(self, engine, df):
+        """Test a run cut short by a limit doesn't replace the snapshot."""
+        engine.validate_dataframe(df, delta_key="ads.csv")
+        snapshot = engine.deltas.get("ads.csv")
+        result, _, _ = engine.validate_dataframe(_edited(df), max_issues=1, delta_key="ads.csv")
+        assert result.partial
+        assert engine.deltas.get("ads.csv") is snapshot
+
+    def test_index_evicts_least_recent(self):
+        """Test the index drops least recently used snapshots beyond its byte budget."""
+        index = DeltaIndex(max_bytes=250)
+        index.put("a", object(), nbytes=100)
+        index.put("b", object(), nbytes=100)
+        index.get("a")
+        index.put("c", object(), nbytes=100)
+        assert "a" in index and "c" in index and "b" not in index
+        assert index.total_bytes == 200
+
+        index.put("huge", object(), nbytes=251)
+        assert "huge" not in index and len(index) == 2
+
+    def test_snapshot_counted_against_budget(self, engine, df):
+        """Test saved snapshots are sized, and skipped when over the budget."""
+        engine.validate_dataframe(df, delta_key="ads.csv")
+        assert engine.deltas.total_bytes >= df.memory_usage(deep=True).sum()
+
+        engine.deltas = DeltaIndex(max_bytes=1024)
+        result, _, _ = engine.validate_dataframe(df, delta_key="ads.csv")
+        assert "ads.csv" not in engine.deltas
+        assert engine.validate_dataframe(df, delta_key="ads.csv")[0].rows_revalidated == len(df)
+
+
+class TestPatternStats:
+    """Test incremental pattern statistics."""
+
+    def test_add_remove_match_from_frame(self, df):
+        """Test removing and adding rows gives the statistics of the new frame."""
+        stats = PatternStats.from_frame(df)
+        stats.remove(df.iloc[:15])
+        stats.add(df.iloc[:5])
+        expected = PatternStats.from_frame(pd.concat([df.iloc[:5], df.iloc[15:]]))
+        for col in ("Headline 1", "Description 1"):
+            assert stats.count(col) == expected.count(col)
+            assert stats.mean_length(col) == pytest.approx(expected.mean_length(col))
+            assert stats.length_std(col) == pytest.approx(expected.length_std(col))
+            assert stats.mean_digit_ratio(col) == pytest.approx(expected.mean_digit_ratio(col))
@@ -2,6 +2,7 @@
 Comprehensive tests for the validation engine.
 """
 
+import copy
 import pytest
 import pandas as pd
 import os
@@ -354,6 +355,99 @@ class TestSummaryStats:
         assert result.summary.severity_counts["BLOCKER"] > 0
 
 
+class TestInMemoryValidation:
+    """Test validating uploads without temp files."""
+    
+    def test_validate_dataframe_returns_raw_frame(self, engine):
+        """Test the raw frame is returned unmodified alongside the result."""
+        df = pd.DataFrame({
+            "Campaign Name": ["Test"],
+            "Status": ["ACTIVE"],
+            "Headline": ["Valid"],
+            "Landing Page URL": ["https://example.com"],
+        })
+        
+        result, fixes, raw_df = engine.validate_dataframe(df, platform_override="LinkedIn Ads")
+        
+        assert raw_df is df
+        assert fixes.base is df
+        assert len(fixes) == 0
+        assert result.summary.total_rows == 1
+    
+    def test_validate_bytes_matches_validate_file(self, engine):
+        """Test in-memory CSV validation gives the same issues as the file path."""
+        df = pd.DataFrame({
+            "Campaign Name": ["Test", ""],
+            "Status": ["ACTIVE", "invalid"],
+            "Headline": ["Valid", "x" * 250],
+            "Landing Page URL": ["https://example.com", "invalid.com"],
+        })
+        
+        tmp_path = ".tmp/test_in_memory.csv"
+        os.makedirs(".tmp", exist_ok=True)
+        df.to_csv(tmp_path, index=False)
+        with open(tmp_path, "rb") as f:
+            data = f.read()
+        
+        file_result, _ = engine.validate_file(tmp_path, platform_override="LinkedIn Ads")
+        bytes_result, _, raw_df = engine.validate_bytes(data, "upload.csv", platform_override="LinkedIn Ads")
+        
+        assert len(raw_df) == 2
+        assert [i.issue_id for i in bytes_result.issues] == [i.issue_id for i in file_result.issues]
+    
+    def test_validate_bytes_rejects_unknown_extension(self, engine):
+        """Test unsupported uploads are rejected before parsing."""
+        with pytest.raises(ValueError):
+            engine.validate_bytes(b"a,b\n1,2\n", "upload.txt")
+
+
+class TestAutoFix:
+    """Test bulk auto-fix application."""
+    
+    def _enable_auto_apply(self, engine, platform):
+        config = copy.deepcopy(engine.config_loader.get_config(platform))
+        for fix in config.get('fixes', []):
+            fix['auto_apply'] = True
+        engine.config_loader.configs[platform] = config
+    
+    def test_auto_fix_maps_values_and_truncates(self, engine):
+        """Test map_values and truncation fixes land in the overlay."""
+        self._enable_auto_apply(engine, "Google Ads")
+        df = pd.DataFrame({
+            "Campaign": ["C1", "C1", "C1"],
+            "Ad Group": ["G1", "G1", "G1"],
+            "Status": ["pause", "Enabled", "active"],
+            "Headline 1": ["Short", "This headline is far too long for Google", "Short"],
+            "Headline 2": ["Two", "Two", "Two"],
+            "Description 1": ["Desc", "Desc", "Desc"],
+            "Final URL": ["https://example.com"] * 3,
+        })
+        
+        result, fixes, raw_df = engine.validate_dataframe(df, platform_override="Google Ads", auto_fix=True)
+        fixed = fixes.to_frame()
+        
+        assert fixed["Status"].tolist() == ["Paused", "Enabled", "Enabled"]
+        assert fixed.at[1, "Headline 1"].endswith("...")
+        assert len(fixed.at[1, "Headline 1"]) <= 30
+        assert raw_df.at[0, "Status"] == "pause"
+    
+    def test_auto_fix_respects_auto_apply_flag(self, engine):
+        """Test nothing is changed when fixes are not marked auto_apply."""
+        df = pd.DataFrame({
+            "Campaign": ["C1"],
+            "Ad Group": ["G1"],
+            "Status": ["paused"],
+            "Headline 1": ["Short"],
+            "Headline 2": ["Two"],
+            "Description 1": ["Desc"],
+            "Final URL": ["https://example.com"],
+        })
+        
+        result, fixes, _ = engine.validate_dataframe(df, platform_override="Google Ads", auto_fix=True)
+        
+        assert len(fixes) == 0
+
+
 # Run tests
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,88 @@
+"""
+Tests for on-demand, cached exports.
+"""
+
+import io
+import numpy as np
+import pandas as pd
+import pytest
+from mojo_validator import export
+from mojo_validator.export import ExportCache, to_csv_bytes, to_xlsx_bytes
+from mojo_validator.fix_overlay import FixOverlay
+
+
+@pytest.fixture
+def fixes():
+    base = pd.DataFrame({
+        'Headline': ["One", "Two", None],
+        'Max CPC': [1.5, np.nan, 2.0],
+        'Clicks': [1, 2, 3],
+    })
+    overlay = FixOverlay(base)
+    overlay.set(0, 'Headline', "Fixed")
+    return overlay
+
+
+class TestExportWriters:
+    """Test exported files hold the merged data."""
+
+    def test_csv(self, fixes):
+        """Test CSV export matches the merged frame without deleted rows."""
+        data = to_csv_bytes(fixes, drop_rows={1})
+        assert data.decode('utf-8') == fixes.to_frame(drop_rows={1}).to_csv(index=False)
+
+    def test_xlsx_round_trip(self, fixes):
+        """Test the streamed workbook reads back as the merged frame."""
+        data = to_xlsx_bytes(fixes, drop_rows={1})
+        frame = pd.read_excel(io.BytesIO(data), sheet_name='Validated Ads')
+
+        expected = fixes.to_frame(drop_rows={1}).reset_index(drop=True)
+        pd.testing.assert_frame_equal(frame, expected, check_dtype=False)
+
+    def test_xlsx_written_in_chunks(self, fixes, monkeypatch):
+        """Test chunked writing gives the same cells as the merged frame."""
+        from openpyxl import load_workbook
+
+        monkeypatch.setattr(export, 'XLSX_CHUNK_ROWS', 1)
+        fixes.set(2, 'Clicks', "n/a")
+        fixes.set(2, 'Notes', "new column")
+        sheet = load_workbook(io.BytesIO(to_xlsx_bytes(fixes, drop_rows={1}))).active
+        rows = [list(row) for row in sheet.iter_rows(values_only=True)]
+
+        expected = fixes.to_frame(drop_rows={1})
+        assert rows[0] == list(expected.columns)
+        assert rows[1:] == [[export._cell(v) for v in row] for row in expected.itertuples(index=False)]
+
+
+class TestExportCache:
+    """Test exports are only rebuilt when the data version changes."""
+
+    def test_reused_until_version_changes(self, fixes, monkeypatch):
+        """Test repeated requests for one version build the file once."""
+        calls = []
+        original = export.to_csv_bytes
+
+        def counting(*args):
+            calls.append(1)
+            return original(*args)
+
+        monkeypatch.setitem(ExportCache._WRITERS, 'csv', counting)
+        cache = ExportCache()
+
+        first = cache.build('csv', (fixes.version, 0), fixes)
+        assert cache.build('csv', (fixes.version, 0), fixes) is first
+        assert len(calls) == 1
+
+        fixes.set(1, 'Headline', "Edited")
+        assert cache.get('csv', (fixes.version, 0)) is None
+        assert b"Edited" in cache.build('csv', (fixes.version, 0), fixes)
+        assert len(calls) == 2
+
+    def test_overlay_version(self, fixes):
+        """Test the overlay version moves on every edit and survives copy()."""
+        before = fixes.version
+        fixes.set_many('Clicks', {0: 10, 1: 20})
+        fixes.set_many('Clicks', {})
+
+        assert fixes.version == before + 1
+        assert fixes.copy().version == fixes.version
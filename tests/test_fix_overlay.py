@@ -0,0 +1,107 @@
+"""
+Tests for the copy-on-write fix overlay.
+"""
+
+import pytest
+import pandas as pd
+from mojo_validator.fix_overlay import FixOverlay
+
+
+@pytest.fixture
+def base():
+    return pd.DataFrame({
+        "Status": ["active", "PAUSED", "paused"],
+        "Headline": ["One", "Two", "Three"],
+        "Budget": [10, 20, 30],
+    })
+
+
+class TestFixOverlay:
+    """Test sparse patch recording and merging."""
+    
+    def test_base_is_never_modified(self, base):
+        """Test patches don't write through to the base frame."""
+        overlay = FixOverlay(base)
+        overlay.set(0, "Status", "ACTIVE")
+        merged = overlay.to_frame()
+        
+        assert base.at[0, "Status"] == "active"
+        assert merged.at[0, "Status"] == "ACTIVE"
+        assert overlay.get(0, "Status") == "ACTIVE"
+        assert overlay.get(1, "Status") == "PAUSED"
+    
+    def test_to_frame_drops_rows(self, base):
+        """Test deleted rows are left out of the merged frame."""
+        overlay = FixOverlay(base)
+        overlay.set(2, "Status", "PAUSED")
+        merged = overlay.to_frame(drop_rows={2})
+        
+        assert list(merged.index) == [0, 1]
+    
+    def test_incompatible_dtype_is_upcast(self, base):
+        """Test a text override in a numeric column doesn't fail on export."""
+        overlay = FixOverlay(base)
+        overlay.set(1, "Budget", "twenty")
+        merged = overlay.to_frame()
+        
+        assert merged.at[1, "Budget"] == "twenty"
+        assert merged.at[0, "Budget"] == 10
+    
+    def test_changed_mask_and_rows(self, base):
+        """Test the cell-level change mask."""
+        overlay = FixOverlay(base)
+        overlay.set_many("Status", {0: "ACTIVE", 2: "PAUSED"})
+        mask = overlay.changed_mask()
+        
+        assert len(overlay) == 2
+        assert (0, "Status") in overlay
+        assert overlay.changed_rows() == {0, 2}
+        assert mask["Status"].tolist() == [True, False, True]
+        assert not mask["Headline"].any()
+    
+    def test_diff_skips_unchanged_values(self, base):
+        """Test the diff only lists cells whose value changed."""
+        overlay = FixOverlay(base)
+        overlay.set(0, "Status", "ACTIVE")
+        overlay.set(1, "Status", "PAUSED")  # same as original
+        diff = overlay.diff()
+        
+        assert len(diff) == 1
+        assert diff.iloc[0].to_dict() == {
+            "row_idx": 0, "column": "Status", "original_value": "active", "new_value": "ACTIVE"
+        }
+    
+    def test_row_reflects_patches(self, base):
+        """Test row() merges patches into the row dict."""
+        overlay = FixOverlay(base)
+        overlay.set(1, "Headline", "Deux")
+        
+        assert overlay.row(1)["Headline"] == "Deux"
+        assert overlay.row(1)["Status"] == "PAUSED"
+    
+    def test_current_prefers_patched_values(self, base):
+        """Test current() returns patched values where present."""
+        overlay = FixOverlay(base)
+        overlay.set(2, "Status", "PAUSED")
+        
+        assert overlay.current("Status", [0, 2]).tolist() == ["active", "PAUSED"]
+    
+    def test_keep_mask(self, base):
+        """Test the keep mask drops and selects rows without copying the frame."""
+        overlay = FixOverlay(base)
+        
+        assert overlay.keep_mask().tolist() == [True, True, True]
+        assert overlay.keep_mask(drop_rows={1}).tolist() == [True, False, True]
+        assert overlay.keep_mask(drop_rows={1}, only_rows=[1, 2]).tolist() == [False, False, True]
+    
+    def test_window_merges_patches(self, base):
+        """Test a row window carries patches, including new columns."""
+        overlay = FixOverlay(base)
+        overlay.set(2, "Status", "PAUSED")
+        overlay.set(0, "Status", "ACTIVE")
+        overlay.set(2, "Notes", "checked")
+        
+        window = overlay.window([1, 2])
+        assert window["Status"].tolist() == ["PAUSED", "PAUSED"]
+        assert window["Notes"].isna().tolist() == [True, False]
+        assert base.at[2, "Status"] != "PAUSED"
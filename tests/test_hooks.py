@@ -0,0 +1,82 @@
+"""
+Tests for stage and progress hooks.
+"""
+
+import pytest
+from mojo_validator.engine import ValidatorEngine
+from mojo_validator.hooks import STAGES, StageTimings, ValidationHook
+
+SAMPLE = "samples/google_ads_demo_50_realistic.csv"
+
+
+class RecordingHook(ValidationHook):
+    row_interval = 20
+
+    def __init__(self):
+        self.events = []
+
+    def on_stage_start(self, stage, total_rows, issues):
+        self.events.append(("start", stage))
+
+    def on_stage_end(self, stage, seconds, total_rows, issues):
+        assert seconds >= 0
+        self.events.append(("end", stage))
+
+    def on_rows(self, rows_processed, total_rows, issues):
+        self.events.append(("rows", rows_processed))
+
+
+@pytest.fixture
+def engine():
+    return ValidatorEngine("configs")
+
+
+class TestHooks:
+    """Test hook events and registration."""
+
+    def test_stage_events(self, engine):
+        """Test every stage starts and ends in order, with rows at the hook's interval."""
+        hook = RecordingHook()
+        engine.validate_file(SAMPLE, auto_fix=True, hooks=[hook])
+
+        stages = [stage for kind, stage in hook.events if kind == "start"]
+        assert stages == list(STAGES)
+        assert [stage for kind, stage in hook.events if kind == "end"] == stages
+        assert [n for kind, n in hook.events if kind == "rows"] == [20, 40, 50]
+
+    def test_engine_hooks_and_timings(self, engine):
+        """Test hooks registered on the engine see every call until removed."""
+        timings = engine.add_hook(StageTimings())
+        engine.validate_file(SAMPLE)
+        first = dict(timings.seconds)
+        engine.remove_hook(timings)
+        engine.validate_file(SAMPLE)
+
+        assert "applying_fixes" not in first
+        assert set(first) == set(STAGES) - {"applying_fixes"}
+        assert timings.seconds == first
+        assert timings.total > 0
+
+    def test_mixed_intervals(self, engine):
+        """Test each hook only sees its own row interval."""
+        fast, slow = RecordingHook(), RecordingHook()
+        fast.row_interval, slow.row_interval = 15, 25
+        engine.validate_file(SAMPLE, hooks=[fast, slow])
+
+        assert [n for kind, n in fast.events if kind == "rows"] == [15, 30, 45, 50]
+        assert [n for kind, n in slow.events if kind == "rows"] == [25, 50]
+
+    def test_pool_row_events(self):
+        """Test sharded row validation reports progress as each shard finishes."""
+        import pandas as pd
+        from mojo_validator.worker_pool import ValidatorPool
+        hook = RecordingHook()
+        with ValidatorPool("configs", workers=2) as pool:
+            pool.validate_dataframe(pd.read_csv(SAMPLE), shard_rows=15, hooks=[hook])
+
+        # Shards end at rows 15, 30, 45 and 50; boundaries 20 and 40 fall in the 2nd and 3rd
+        assert [n for kind, n in hook.events if kind == "rows"] == [30, 45, 50]
+
+    def test_no_hooks_fast_path(self, engine):
+        """Test no runner is built when nothing is registered."""
+        assert engine._hook_runner((), None) is None
@@ -0,0 +1,70 @@
+"""
+Import-time guard: importing the engine must not pull in heavy dependencies.
+"""
+
+import json
+import subprocess
+import sys
+import pytest
+
+# Cold import budget for mojo_validator.engine, in seconds. Importing pandas
+# eagerly alone costs more than this on a typical machine.
+IMPORT_BUDGET_SECONDS = 0.35
+
+HEAVY_MODULES = ["pandas.core.frame", "numpy", "openpyxl", "yaml", "mojo_validator.pattern_detector"]
+
+PROBE = """
+import json, sys, time
+started = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - started
+loaded = [m for m in {heavy!r} if m in sys.modules]
+print(json.dumps({{"seconds": elapsed, "loaded": loaded}}))
+"""
+
+
+def _probe(module):
+    out = subprocess.run(
+        [sys.executable, "-c", PROBE.format(module=module, heavy=HEAVY_MODULES)],
+        capture_output=True, text=True, check=True,
+    )
+    return json.loads(out.stdout)
+
+
+class TestImportTime:
+    """Test the lightweight import path."""
+
+    @pytest.mark.parametrize("module", ["mojo_validator", "mojo_validator.engine", "mojo_validator.cli"])
+    def test_no_heavy_imports(self, module):
+        """Test heavy modules are deferred until a code path needs them."""
+        assert _probe(module)["loaded"] == []
+
+    def test_engine_import_budget(self):
+        """Test the engine imports within the cold-start budget (best of 3)."""
+        seconds = min(_probe("mojo_validator.engine")["seconds"] for _ in range(3))
+        assert seconds < IMPORT_BUDGET_SECONDS
+
+    def test_pandas_loaded_on_use(self):
+        """Test pandas is imported on the first validation, not before."""
+        out = subprocess.run(
+            [sys.executable, "-c",
+             "import sys; from mojo_validator.engine import ValidatorEngine; "
+             "before = 'pandas' in sys.modules; "
+             "ValidatorEngine('configs').validate_file('samples/google_ads_demo_50_realistic.csv'); "
+             "print(before, 'pandas.core.frame' in sys.modules)"],
+            capture_output=True, text=True, check=True,
+        )
+        assert out.stdout.strip() == "False True"
+
+    def test_job_thread_imports_pandas(self):
+        """Test a background job started from a cold import can load pandas itself."""
+        out = subprocess.run(
+            [sys.executable, "-c",
+             "import sys; from mojo_validator.jobs import ValidationJob; "
+             "from mojo_validator.engine import ValidatorEngine; engine = ValidatorEngine('configs'); "
+             "job = ValidationJob(lambda progress_callback: engine.validate_file("
+             "'samples/google_ads_demo_50_realistic.csv')).start(); "
+             "print(type(job.result()[0]).__name__, type(sys.modules['pandas']).__name__)"],
+            capture_output=True, text=True, check=True,
+        )
+        assert out.stdout.strip() == "ValidationResult module"
@@ -0,0 +1,76 @@
+"""
+Tests for the incrementally maintained issue index.
+"""
+
+import pytest
+from mojo_validator.issue_index import IssueIndex
+from mojo_validator.models import Issue
+
+
+def _issue(row, column, severity, kind="len"):
+    return Issue(issue_id=f"{row}_{column}_{kind}", row_idx=row, column=column,
+                 severity=severity, message="msg")
+
+
+@pytest.fixture
+def index():
+    return IssueIndex([
+        _issue(3, "Headline", "BLOCKER"),
+        _issue(1, "Headline", "WARNING"),
+        _issue(1, "URL", "BLOCKER", "url"),
+        _issue(2, "Status", "WARNING", "value"),
+    ])
+
+
+def _rescan(index, severity=None):
+    """Brute-force pending issues, as the app used to compute them."""
+    return [i for i in index.issues
+            if i.issue_id not in index.status and i.row_idx not in index.deleted_rows
+            and severity in (None, i.severity)]
+
+
+class TestIssueIndex:
+    """Test counts and buckets stay in step with handled actions."""
+
+    def test_initial_buckets(self, index):
+        """Test counts and row order straight after indexing."""
+        assert index.severity_counts == {"BLOCKER": 2, "WARNING": 2}
+        assert index.pending_rows() == [1, 2, 3]
+        assert index.pending_rows("BLOCKER") == [1, 3]
+        assert index.pending_count("WARNING") == 2
+        assert [i.column for i in index.pending_in_row(1)] == ["Headline", "URL"]
+
+    def test_mark_updates_incrementally(self, index):
+        """Test marking an issue removes it from every bucket once."""
+        index.mark("1_URL_url", "fixed")
+        index.mark("1_URL_url", "overridden")
+
+        assert index.pending_rows("BLOCKER") == [3]
+        assert index.pending_rows() == [1, 2, 3]
+        assert index.pending_count() == 3
+        assert index.handled_count == 1
+        assert index.status["1_URL_url"] == "overridden"
+
+    def test_remove_row(self, index):
+        """Test removing a row handles all of its issues."""
+        index.remove_row(1)
+
+        assert 1 in index.deleted_rows
+        assert index.pending_rows() == [2, 3]
+        assert index.pending_in_row(1) == []
+        assert index.handled_count == 2
+
+    def test_pagination(self, index):
+        """Test row slices for paging."""
+        assert index.pending_rows(None, 1, 3) == [2, 3]
+        assert index.pending_rows("WARNING", 0, 1) == [1]
+
+    @pytest.mark.parametrize("severity", [None, "BLOCKER", "WARNING"])
+    def test_matches_full_rescan(self, index, severity):
+        """Test the index agrees with a brute-force rescan after mixed actions."""
+        index.mark("3_Headline_len", "ignored")
+        index.remove_row(2)
+
+        expected = _rescan(index, severity)
+        assert index.pending_count(severity) == len(expected)
+        assert index.pending_rows(severity) == sorted({i.row_idx for i in expected})
@@ -0,0 +1,72 @@
+"""
+Tests for progress reporting and background validation jobs.
+"""
+
+import pytest
+from mojo_validator import engine as engine_module
+from mojo_validator.engine import ValidatorEngine
+from mojo_validator.jobs import ValidationJob
+
+SAMPLE = "samples/google_ads_demo_50_realistic.csv"
+
+
+@pytest.fixture(scope="module")
+def engine():
+    return ValidatorEngine("configs")
+
+
+@pytest.fixture(scope="module")
+def content():
+    with open(SAMPLE, 'rb') as f:
+        return f.read()
+
+
+class TestProgressCallback:
+    """Test the engine's progress updates."""
+
+    def test_updates(self, engine, content, monkeypatch):
+        """Test stages arrive in order, rows only grow and issue deltas add up."""
+        monkeypatch.setattr(engine_module, "PROGRESS_INTERVAL", 10)
+        updates = []
+        result, _, _ = engine.validate_bytes(content, "ads.csv", progress_callback=updates.append)
+
+        stages = [u.stage for u in updates]
+        assert stages[0] == "reading" and stages[-1] == "done"
+        assert stages.index("detecting_patterns") > stages.index("validating_rows")
+
+        rows = [u.rows_processed for u in updates if u.stage == "validating_rows"]
+        assert rows == sorted(rows) and rows[-1] == 50
+        assert len(rows) >= 5
+
+        streamed = [i.issue_id for u in updates for i in u.new_issues]
+        assert streamed == [i.issue_id for i in result.issues]
+        assert updates[-1].issues_found == len(result.issues)
+
+    def test_no_callback_unchanged(self, engine, content):
+        """Test results don't depend on whether progress is reported."""
+        quiet, _, _ = engine.validate_bytes(content, "ads.csv")
+        loud, _, _ = engine.validate_bytes(content, "ads.csv", progress_callback=lambda p: None)
+        assert quiet == loud
+
+
+class TestValidationJob:
+    """Test validations running in the background."""
+
+    def test_job_result(self, engine, content):
+        """Test the job returns the direct call's result and collects its issues."""
+        job = ValidationJob(engine.validate_bytes, content, "ads.csv").start()
+        result, fixes, raw_df = job.result(timeout=60)
+
+        assert job.done and job.error is None
+        assert job.fraction == 1.0
+        assert job.stage == "done"
+        assert [i.issue_id for i in job.snapshot()] == [i.issue_id for i in result.issues]
+        assert result == engine.validate_bytes(content, "ads.csv")[0]
+        assert len(raw_df) == job.total_rows == 50
+
+    def test_job_error(self, engine):
+        """Test a failing validation surfaces its exception."""
+        job = ValidationJob(engine.validate_bytes, b"", "ads.txt").start()
+        with pytest.raises(Exception):
+            job.result(timeout=60)
+        assert job.done and job.error is not None
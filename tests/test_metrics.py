@@ -0,0 +1,103 @@
+"""
+Tests for the metrics registry and its OpenMetrics export.
+"""
+
+import urllib.request
+import pytest
+from mojo_validator import cli, metrics
+from mojo_validator.engine import ValidatorEngine
+from mojo_validator.metrics import MetricsRegistry
+from mojo_validator.result_cache import ResultCache
+
+SAMPLE = "samples/google_ads_demo_50_realistic.csv"
+
+
+@pytest.fixture
+def recording(monkeypatch):
+    """Enable the process registry for one test, starting from empty samples."""
+    monkeypatch.setattr(metrics.REGISTRY, "enabled", True)
+    metrics.REGISTRY.drain()
+    yield metrics.REGISTRY
+    metrics.REGISTRY.drain()
+
+
+class TestRegistry:
+    """Test metric types, exposition format and cross-process merging."""
+
+    def test_render(self):
+        """Test counters, gauges and cumulative histogram buckets render as OpenMetrics."""
+        registry = MetricsRegistry()
+        registry.counter("jobs", "Jobs run.", ("kind",)).inc(2, kind='a "b"')
+        registry.gauge("peak", "Peak.").set_max(7)
+        hist = registry.histogram("latency", "Latency.", buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 5):
+            hist.observe(value)
+
+        text = registry.render()
+        assert 'jobs_total{kind="a \\"b\\""} 2' in text
+        assert "# TYPE peak gauge\n# HELP peak Peak.\npeak 7\n" in text
+        assert 'latency_bucket{le="0.1"} 1\nlatency_bucket{le="1"} 2\nlatency_bucket{le="+Inf"} 3\n' in text
+        assert "latency_count 3\nlatency_sum 5.55\n" in text
+        assert text.endswith("# EOF\n")
+
+    def test_drain_and_merge(self):
+        """Test drained samples merge into another registry (sums, and max for gauges)."""
+        worker, parent = MetricsRegistry(), MetricsRegistry()
+        for registry in (worker, parent):
+            registry.counter("rows", "Rows.").inc(10)
+            registry.gauge("peak", "Peak.").set_max(5 if registry is worker else 3)
+            registry.histogram("secs", "Seconds.", buckets=(1.0,)).observe(0.5)
+
+        parent.merge(worker.drain())
+        assert "rows_total 20" in parent.render()
+        assert "\npeak 5\n" in parent.render()
+        assert "secs_count 2" in parent.render()
+        assert worker.drain() == {}
+
+
+class TestInstrumentation:
+    """Test the engine and caches report into the registry."""
+
+    def test_disabled_by_default(self):
+        """Test nothing is recorded unless metrics are enabled."""
+        if metrics.REGISTRY.enabled:
+            pytest.skip("MOJO_VALIDATOR_METRICS is set")
+        metrics.REGISTRY.drain()
+        ValidatorEngine("configs").validate_file(SAMPLE)
+        assert metrics.REGISTRY.drain() == {}
+
+    def test_validation_and_cache_metrics(self, recording):
+        """Test a validation records rows, issues, stage latency, file size and cache lookups."""
+        engine = ValidatorEngine("configs")
+        cache = ResultCache()
+        key = ("digest", None, 0)
+        cache.validate(key, lambda: engine.validate_bytes(open(SAMPLE, 'rb').read(), SAMPLE))
+        cache.validate(key, lambda: pytest.fail("cached"))
+
+        text = recording.render()
+        assert 'mojo_rows_validated_total{platform="Google Ads"} 50' in text
+        assert 'mojo_stage_seconds_count{stage="validating_rows"} 1' in text
+        assert "mojo_input_file_bytes_count 1" in text
+        assert 'mojo_cache_requests_total{cache="result",result="hit"} 1' in text
+        assert 'mojo_cache_requests_total{cache="result",result="miss"} 1' in text
+
+    def test_http_endpoint(self, recording):
+        """Test the metrics endpoint serves the current registry."""
+        server = metrics.serve(0)
+        try:
+            metrics.record_file_size(123)
+            url = f"http://127.0.0.1:{server.server_address[1]}/metrics"
+            with urllib.request.urlopen(url, timeout=5) as response:
+                body = response.read().decode()
+                assert response.headers["Content-Type"].startswith("application/openmetrics-text")
+        finally:
+            server.shutdown()
+        assert "mojo_input_file_bytes_sum 123" in body
+
+    def test_cli_metrics_file(self, tmp_path, recording):
+        """Test --metrics-file writes the run's metrics and keeps them out of summary.json."""
+        out = tmp_path / "out"
+        cli.main([SAMPLE, "-o", str(out), "-j", "1", "-q", "--metrics-file", str(tmp_path / "metrics.txt")])
+
+        assert 'mojo_validations_total{platform="Google Ads"} 1' in (tmp_path / "metrics.txt").read_text()
+        assert '"metrics"' not in (out / "summary.json").read_text()
@@ -0,0 +1,186 @@
+"""
+Tests for the composable validation pipeline.
+"""
+
+import copy
+
+import pandas as pd
+import pytest
+from mojo_validator.engine import ValidatorEngine
+from mojo_validator.hooks import STAGES
+from mojo_validator.pipeline import PatternStage, Pipeline, Stage
+
+SAMPLE = "samples/google_ads_demo_50_realistic.csv"
+
+
+class CountRows(Stage):
+    """Custom stage that only writes to ctx.extras."""
+
+    name = "counting"
+
+    def run(self, ctx):
+        ctx.extras["rows"] = ctx.total_rows
+
+
+class ThreadedPatterns(PatternStage):
+    executor = "thread"
+
+
+class ProcessPatterns(PatternStage):
+    executor = "process"
+
+
+def _ids(result):
+    return [issue.issue_id for issue in result.issues]
+
+
+@pytest.fixture(scope="module")
+def engine():
+    return ValidatorEngine("configs")
+
+
+@pytest.fixture(scope="module")
+def df():
+    return pd.read_csv(SAMPLE)
+
+
+class TestPipeline:
+    """Test stage composition and executors."""
+
+    def test_default_stages(self, engine):
+        """Test the default pipeline runs the hook stages in order."""
+        assert engine.pipeline.names == list(STAGES)
+
+    def test_replace_without_insert(self, engine):
+        """Test edits return new pipelines and leave the original alone."""
+        pipeline = engine.pipeline
+        assert "detecting_patterns" not in pipeline.without("detecting_patterns").names
+        inserted = pipeline.insert(CountRows(), after="validating_rows")
+        assert inserted.names.index("counting") == inserted.names.index("validating_rows") + 1
+        replaced = pipeline.replace("detecting_patterns", ThreadedPatterns())
+        assert isinstance(replaced.stages[replaced.names.index("detecting_patterns")], ThreadedPatterns)
+        assert pipeline.names == list(STAGES)
+
+        with pytest.raises(KeyError):
+            pipeline.without("missing")
+        with pytest.raises(ValueError):
+            pipeline.insert(PatternStage(), after="summarizing")
+
+    def test_skip_stage(self, engine, df):
+        """Test a pipeline without the pattern pass returns only row issues."""
+        full, _, _ = engine.validate_dataframe(df)
+        rows_only, _, _ = engine.validate_dataframe(df, pipeline=engine.pipeline.without("detecting_patterns"))
+        assert _ids(rows_only) == [i for i in _ids(full) if not i.startswith("pattern_")]
+
+    @pytest.mark.parametrize("stage", [ThreadedPatterns(), ProcessPatterns()], ids=["thread", "process"])
+    def test_executors_match_inline(self, engine, df, stage):
+        """Test a stage gives the same result on a thread or in another process."""
+        inline, _, _ = engine.validate_dataframe(df)
+        result, _, _ = engine.validate_dataframe(df, pipeline=engine.pipeline.replace("detecting_patterns", stage))
+        assert _ids(result) == _ids(inline)
+        assert result.summary == inline.summary
+
+    def test_context_timings_and_extras(self, engine):
+        """Test every stage that ran is timed and custom stages can share state."""
+        from mojo_validator.pipeline import ValidationContext
+        ctx = ValidationContext(engine, source=SAMPLE, filename=SAMPLE, auto_fix=True)
+        engine._validate(ctx, pipeline=engine.pipeline.insert(CountRows(), after="reading"))
+        assert set(ctx.timings) == set(STAGES) | {"counting"}
+        assert all(seconds >= 0 for seconds in ctx.timings.values())
+        assert ctx.extras["rows"] == 50
+        assert ctx.result.summary.total_rows == 50
+
+    def test_unknown_executor(self):
+        """Test stages must name a known executor."""
+        stage = CountRows()
+        stage.executor = "gpu"
+        with pytest.raises(ValueError):
+            Pipeline([stage])
+
+
+class TestTiers:
+    """Test fast/standard/deep validation tiers."""
+
+    def test_tiers_nest(self, engine, df):
+        """Test each tier adds its checks on top of the shallower one."""
+        fast, _, _ = engine.validate_dataframe(df, tier="fast")
+        standard, _, _ = engine.validate_dataframe(df, tier="standard")
+        deep, _, _ = engine.validate_dataframe(df)
+
+        assert deep.tier == "deep" and fast.tier == "fast"
+        assert {i.severity for i in fast.issues} == {"BLOCKER"}
+        assert [i for i in _ids(standard) if i in _ids(fast)] == _ids(fast)
+        assert set(_ids(deep)) - set(_ids(standard)) == {
+            i for i in _ids(deep) if i.startswith("pattern_") or i.endswith("_duplicate")}
+        assert any(i.endswith("_duplicate") for i in _ids(deep))
+
+    def test_fast_skips_deep_stages(self, engine, df):
+        """Test deep-only stages don't run (or emit events) in lower tiers."""
+        from mojo_validator.hooks import StageTimings
+        timings = StageTimings()
+        engine.validate_dataframe(df, tier="fast", hooks=[timings])
+        assert "detecting_patterns" not in timings.seconds
+        assert "detecting_duplicates" not in timings.seconds
+
+    def test_fast_skips_recommended_truncations(self, engine, df):
+        """Test the fast tier only precomputes the blocker (max_length) suggestions."""
+        config = copy.deepcopy(engine.config_loader.get_config("Google Ads"))
+        validators = {v['column']: v for v in config['validators'] if 'max_length' in v}
+        for validator in validators.values():
+            validator['recommended_max'] = validator['max_length'] // 2
+        full = engine._precompute_truncations(df, config)
+        fast = engine._precompute_truncations(df, config, warnings=False)
+
+        expected = {
+            col: {idx: text for idx, text in suggestions.items()
+                  if len(df.at[idx, col].strip()) > validators[col]['max_length']}
+            for col, suggestions in full.items()
+        }
+        assert fast == {col: suggestions for col, suggestions in expected.items() if suggestions}
+        assert sum(map(len, fast.values())) < sum(map(len, full.values()))
+
+    def test_tier_from_config(self, engine, df, monkeypatch):
+        """Test the platform config's tier applies unless the call names one."""
+        config = engine.config_loader.get_config("Google Ads")
+        monkeypatch.setitem(config, "tier", "standard")
+        assert engine.validate_dataframe(df)[0].tier == "standard"
+        assert engine.validate_dataframe(df, tier="deep")[0].tier == "deep"
+
+    def test_unknown_tier(self, engine, df):
+        """Test an unknown tier is rejected."""
+        with pytest.raises(ValueError):
+            engine.validate_dataframe(df, tier="thorough")
+
+
+class TestLimits:
+    """Test early termination on issue budgets, blockers and deadlines."""
+
+    def test_complete_run_is_not_partial(self, engine, df):
+        """Test a run without limits covers every row."""
+        result, _, _ = engine.validate_dataframe(df, tier="fast")
+        assert not result.partial and result.stop_reason is None
+        assert result.rows_validated == len(df)
+
+    def test_max_issues(self, engine, df):
+        """Test the issue budget keeps the first issues of a full run."""
+        full, _, _ = engine.validate_dataframe(df)
+        result, _, _ = engine.validate_dataframe(df, max_issues=5)
+        assert result.partial and result.stop_reason == "max_issues"
+        assert _ids(result) == _ids(full)[:5]
+        assert result.summary.total_issues == 5
+        assert result.rows_validated < len(df)
+
+    def test_stop_on_first_blocker(self, engine, df):
+        """Test the run stops after the first row with a blocker."""
+        result, _, _ = engine.validate_dataframe(df, stop_on_first_blocker=True)
+        blockers = [i for i in result.issues if i.severity == "BLOCKER"]
+        assert result.stop_reason == "first_blocker"
+        assert {i.row_idx for i in blockers} == {result.rows_validated - 1}
+        assert not any(i.issue_id.startswith("pattern_") for i in result.issues)
+
+    def test_deadline(self, engine, df):
+        """Test an expired deadline skips all the checks but still summarizes."""
+        result, _, _ = engine.validate_dataframe(df, deadline=0)
+        assert result.partial and result.stop_reason == "deadline"
+        assert result.rows_validated == 0 and result.issues == []
+        assert result.summary.total_rows == len(df) and result.summary.clean_rows == 0
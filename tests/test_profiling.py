@@ -0,0 +1,61 @@
+"""
+Tests for the built-in profiler switch.
+"""
+
+import json
+import pstats
+import tracemalloc
+import pandas as pd
+import pytest
+from mojo_validator import cli
+from mojo_validator.engine import ValidatorEngine
+from mojo_validator.profiling import PROFILE_ENV
+
+
+@pytest.fixture
+def ads_csv(tmp_path):
+    path = tmp_path / "ads.csv"
+    pd.DataFrame({
+        "Campaign Name": ["Test", "Test"],
+        "Status": ["ACTIVE", "PAUSED"],
+        "Headline": ["Valid", "Also valid"],
+        "Introduction": ["Some intro", "More intro"],
+        "Landing Page URL": ["https://example.com", "not a url"],
+    }).to_csv(path, index=False)
+    return path
+
+
+class TestProfiling:
+    """Test profiled validation runs."""
+
+    def test_profile_path_writes_stats_and_snapshots(self, ads_csv, tmp_path):
+        """Test a profiled run writes cProfile stats and a snapshot per stage."""
+        engine = ValidatorEngine("configs")
+        result, _ = engine.validate_file(str(ads_csv), profile_path=str(tmp_path / "prof" / "ads"))
+
+        stats = pstats.Stats(str(tmp_path / "prof" / "ads.prof"))
+        assert any(func[2] == "_validate_rows" for func in stats.stats)
+
+        memory = json.loads((tmp_path / "prof" / "ads.memory.json").read_text())
+        assert [s["stage"] for s in memory["stages"]] == [
+            "reading", "detecting_platform", "validating_rows", "detecting_patterns", "detecting_duplicates",
+            "summarizing"]
+        assert memory["peak_bytes"] >= max(s["peak_bytes"] for s in memory["stages"]) > 0
+        assert all(s["top_allocations"] for s in memory["stages"])
+
+        assert result == engine.validate_file(str(ads_csv), profile_path="")[0]
+        assert not tracemalloc.is_tracing()
+
+    def test_env_var(self, ads_csv, tmp_path, monkeypatch):
+        """Test $MOJO_VALIDATOR_PROFILE turns profiling on, named after the input."""
+        monkeypatch.setenv(PROFILE_ENV, str(tmp_path / "env"))
+        ValidatorEngine("configs").validate_file(str(ads_csv))
+        assert (tmp_path / "env" / "ads.prof").exists()
+        assert (tmp_path / "env" / "ads.memory.json").exists()
+
+    def test_cli_profile(self, ads_csv, tmp_path):
+        """Test --profile writes profiles next to the file's other outputs."""
+        out = tmp_path / "out"
+        cli.main([str(ads_csv), "-o", str(out), "-j", "1", "-q", "-p", "LinkedIn Ads", "--profile"])
+        assert (out / "ads.issues.jsonl").exists()
+        assert (out / "ads.prof").exists() and (out / "ads.memory.json").exists()
@@ -0,0 +1,76 @@
+"""
+Tests for the shared validation result cache.
+"""
+
+import pytest
+from mojo_validator.engine import ValidatorEngine
+from mojo_validator.result_cache import ResultCache, content_key, estimate_size
+
+
+@pytest.fixture(scope="module")
+def engine():
+    return ValidatorEngine("configs")
+
+
+@pytest.fixture
+def upload():
+    with open("samples/google_sample.csv", "rb") as f:
+        return f.read()
+
+
+class TestResultCache:
+    """Test results are reused and memory stays bounded."""
+
+    def test_same_bytes_validated_once(self, engine, upload):
+        """Test identical uploads hit the cache instead of the engine."""
+        cache = ResultCache()
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return engine.validate_bytes(upload, "upload.csv")
+
+        first = cache.validate(content_key(upload), compute)
+        second = cache.validate(content_key(upload), compute)
+
+        assert len(calls) == 1
+        assert second[0] is first[0]
+        assert cache.hits == 1
+
+    def test_override_and_generation_in_key(self, upload):
+        """Test platform override and config generation give distinct keys."""
+        assert content_key(upload) != content_key(upload, "Google Ads")
+        assert content_key(upload, "Google Ads", 0) != content_key(upload, "Google Ads", 1)
+        assert content_key(upload) == content_key(bytes(upload))
+
+    def test_overlays_are_per_caller(self, engine, upload):
+        """Test edits in one session's overlay never reach the cached entry."""
+        cache = ResultCache()
+        key = content_key(upload)
+        _, fixes, _ = cache.validate(key, lambda: engine.validate_bytes(upload, "upload.csv"))
+        fixes.set(0, "Headline 1", "Edited")
+
+        _, again, _ = cache.validate(key, lambda: pytest.fail("should be cached"))
+        assert len(again) == 0
+
+    def test_memory_cap_evicts_lru(self, engine, upload):
+        """Test least recently used results are evicted past the byte budget."""
+        result, fixes, raw_df = engine.validate_bytes(upload, "upload.csv")
+        size = estimate_size(result, raw_df)
+        cache = ResultCache(max_bytes=size * 2)
+
+        cache.put("a", result, fixes)
+        cache.put("b", result, fixes)
+        cache.get("a")
+        cache.put("c", result, fixes)
+
+        assert "a" in cache and "c" in cache and "b" not in cache
+        assert cache.total_bytes <= cache.max_bytes
+
+    def test_oversized_result_not_cached(self, engine, upload):
+        """Test a result bigger than the whole budget is skipped."""
+        result, fixes, _ = engine.validate_bytes(upload, "upload.csv")
+        cache = ResultCache(max_bytes=1)
+        cache.put("a", result, fixes)
+
+        assert len(cache) == 0 and cache.total_bytes == 0
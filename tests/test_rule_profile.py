@@ -0,0 +1,49 @@
+"""
+Tests for opt-in per-rule instrumentation.
+"""
+
+import pandas as pd
+import pytest
+from mojo_validator.engine import ValidatorEngine
+
+SAMPLE = "samples/google_ads_demo_50_realistic.csv"
+
+
+@pytest.fixture(scope="module")
+def engine():
+    return ValidatorEngine("configs")
+
+
+class TestRuleProfile:
+    """Test the profile attached to ValidationResult."""
+
+    def test_off_by_default(self, engine):
+        """Test no profile is recorded unless asked for."""
+        result, _ = engine.validate_file(SAMPLE)
+        assert result.profile is None
+
+    def test_hits_account_for_every_issue(self, engine):
+        """Test per-rule hits add up to the issues found and results are unchanged."""
+        plain, _ = engine.validate_file(SAMPLE)
+        profiled, _ = engine.validate_file(SAMPLE, profile_rules=True)
+
+        assert profiled.issues == plain.issues
+        assert sum(stat.hits for stat in profiled.profile.rules) == len(profiled.issues)
+        assert all(stat.calls > 0 and stat.seconds >= 0 for stat in profiled.profile.rules)
+
+    def test_rules_columns_and_detectors(self, engine):
+        """Test stats are keyed by rule and column, with pattern checks dataset-wide."""
+        df = pd.DataFrame({
+            "Campaign": ["Spring", "Spring"],
+            "Ad Group": ["Shoes", "Shoes"],
+            "Headline 1": ["Great shoes", "x" * 40],
+            "Final URL": ["https://example.com", "not a url"],
+        })
+        result, _, _ = engine.validate_dataframe(df, platform_override="Google Ads", profile_rules=True)
+        stats = {(stat.rule, stat.column): stat for stat in result.profile.rules}
+
+        assert stats[("url", "Final URL")].calls == 2
+        assert stats[("url", "Final URL")].hits == 1
+        assert stats[("length", "Headline 1")].hits == 1
+        assert stats[("pattern.swapped_text", None)].calls == 2
+        assert result.profile.slowest(1)[0].seconds == max(s.seconds for s in result.profile.rules)
@@ -0,0 +1,94 @@
+"""
+Tests for the statistical quick scan.
+"""
+
+from collections import Counter
+
+import pandas as pd
+import pytest
+from mojo_validator.engine import ValidatorEngine
+from mojo_validator.sampling import strata_columns, stratified_sample, wilson_interval
+
+SAMPLE = "samples/google_ads_demo_50_realistic.csv"
+
+
+@pytest.fixture(scope="module")
+def engine():
+    return ValidatorEngine("configs")
+
+
+@pytest.fixture(scope="module")
+def df():
+    return pd.read_csv(SAMPLE)
+
+
+class TestSampling:
+    """Test stratified sampling and interval maths."""
+
+    def test_stratified_allocation(self, df):
+        """Test the sample has the requested size, in proportion to each campaign's rows."""
+        big = pd.concat([df] * 20, ignore_index=True)
+        strata = strata_columns(big)
+        assert strata == ["Campaign", "Ad Group"]
+
+        sample, weights = stratified_sample(big, 100, strata[:1], seed=1)
+        assert len(sample) == 100 and sample.index.is_monotonic_increasing
+        expected = big["Campaign"].value_counts() / len(big) * 100
+        assert (sample["Campaign"].value_counts() - expected).abs().max() < 1
+        assert weights.sum() == pytest.approx(len(big))
+
+        again, _ = stratified_sample(big, 100, strata[:1], seed=1)
+        assert again.index.equals(sample.index)
+
+    def test_wilson_interval(self):
+        """Test known Wilson bounds, including zero observed hits."""
+        low, high = wilson_interval(0.5, 100, 1.959964)
+        assert low == pytest.approx(0.4038, abs=1e-4) and high == pytest.approx(0.5962, abs=1e-4)
+        low, high = wilson_interval(0.0, 100, 1.959964)
+        assert low == 0.0 and 0 < high < 0.05
+
+
+class TestQuickScan:
+    """Test estimated issue rates against full validation."""
+
+    def test_whole_file_is_exact(self, engine, df):
+        """Test a sample covering every row reports the exact rates."""
+        full, _, _ = engine.validate_dataframe(df, tier="standard")
+        scan = engine.quick_scan(df, sample_rows=len(df))
+
+        assert scan.sample_rows == scan.total_rows == len(df)
+        assert scan.summary == full.summary
+        counts = Counter((i.kind, i.column) for i in full.issues)
+        for rule in scan.rules:
+            assert rule.estimate.rate == rule.estimate.low == rule.estimate.high
+            assert rule.sample_hits == counts[(rule.rule, rule.column)]
+            assert len(rule.examples) <= 3
+
+    def test_intervals_cover_true_rates(self, engine, df):
+        """Test sampled estimates bracket the true rates of a large file."""
+        big = pd.concat([df] * 40, ignore_index=True)
+        full, _, _ = engine.validate_dataframe(df, tier="standard")
+        true_rate = len({i.row_idx for i in full.issues}) / len(df)
+
+        scan = engine.quick_scan(big, sample_rows=400, confidence=0.99)
+        assert scan.sample_rows == 400 and scan.strata == ["Campaign", "Ad Group"]
+        assert scan.row_issue_rate.low <= true_rate <= scan.row_issue_rate.high
+        assert scan.rules == sorted(scan.rules, key=lambda r: r.estimate.rate, reverse=True)
+        for rule in scan.rules:
+            assert all(example.row_idx in big.index for example in rule.examples)
+
+    def test_repeated_index_labels(self, engine, df):
+        """Test rows sharing an index label are weighted as separate rows."""
+        scan = engine.quick_scan(df, sample_rows=len(df))
+        repeated = engine.quick_scan(df.set_axis([0] * len(df)), sample_rows=len(df))
+
+        assert repeated.row_issue_rate == scan.row_issue_rate
+        assert [(r.rule, r.column, r.sample_hits, r.estimate) for r in repeated.rules] == \
+            [(r.rule, r.column, r.sample_hits, r.estimate) for r in scan.rules]
+        assert all(e.row_idx == 0 for rule in repeated.rules for e in rule.examples)
+
+    def test_fast_tier(self, engine, df):
+        """Test the fast tier samples blocker rules only."""
+        scan = engine.quick_scan(df, tier="fast")
+        assert scan.tier == "fast"
+        assert {rule.severity for rule in scan.rules} == {"BLOCKER"}
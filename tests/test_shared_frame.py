@@ -0,0 +1,118 @@
+"""
+Tests for the shared-memory DataFrame hand-off.
+"""
+
+import pickle
+import numpy as np
+import pandas as pd
+import pytest
+from mojo_validator import shared_frame
+from mojo_validator.engine import ValidatorEngine
+from mojo_validator.shared_frame import SharedFrame
+from mojo_validator.worker_pool import ValidatorPool, _pack_issues, _unpack_issues
+
+
+@pytest.fixture
+def mixed_df():
+    return pd.DataFrame({
+        'Headline': ["Buy now", None, "Café ✓", ""],
+        'Max CPC': [1.5, np.nan, 2.0, 0.25],
+        'Clicks': [1, 2, 3, 4],
+        'Mixed': ["a", 1, None, 2.5],
+    }, index=[10, 11, 12, 13])
+
+
+class TestSharedFrame:
+    """Test frames survive the round trip through shared memory."""
+
+    def test_round_trip(self, mixed_df):
+        """Test every column layout and a non-range index come back intact."""
+        with SharedFrame.create(mixed_df) as shared:
+            attached = SharedFrame.attach(shared.descriptor)
+            frame = attached.to_frame()
+
+            pd.testing.assert_frame_equal(frame, mixed_df, check_dtype=False)
+            assert frame['Clicks'].dtype == mixed_df['Clicks'].dtype
+            del frame
+            attached.close()
+
+    def test_row_range(self, mixed_df):
+        """Test a worker can rebuild just a slice of rows with their labels."""
+        df = mixed_df.reset_index(drop=True)
+        with SharedFrame.create(df) as shared:
+            attached = SharedFrame.attach(shared.descriptor)
+            shard = attached.to_frame(1, 3)
+
+            assert list(shard.index) == [1, 2]
+            assert pd.isna(shard.at[1, 'Headline'])
+            assert shard.at[2, 'Headline'] == "Café ✓"
+            del shard
+            attached.close()
+
+    def test_pickled_rows_read_per_chunk(self, mixed_df, monkeypatch):
+        """Test a row range only unpickles the fallback chunks covering it."""
+        monkeypatch.setattr(shared_frame, 'PICKLE_CHUNK_ROWS', 2)
+        df = pd.concat([mixed_df] * 3)
+        with SharedFrame.create(df) as shared:
+            attached = SharedFrame.attach(shared.descriptor)
+            loads = []
+            real_loads = pickle.loads
+            monkeypatch.setattr(pickle, 'loads', lambda data: loads.append(1) or real_loads(data))
+            shard = attached.to_frame(3, 5)
+
+            pd.testing.assert_frame_equal(shard, df.iloc[3:5], check_dtype=False)
+            # Rows 3-4 span chunks 1-2, of the mixed column and of the index
+            assert len(loads) == 4
+            monkeypatch.undo()
+            pd.testing.assert_frame_equal(attached.to_frame(), df, check_dtype=False)
+            assert attached.to_frame(12, 12).empty
+            del shard
+            attached.close()
+
+    def test_issue_packing(self):
+        """Test issues survive the compact hand-back unchanged."""
+        engine = ValidatorEngine("configs")
+        df = pd.read_csv("samples/google_sample.csv")
+        result, _, _ = engine.validate_dataframe(df, platform_override="Google Ads")
+        row_issues = [i for i in result.issues if not i.issue_id.startswith("pattern_")]
+
+        unpacked = _unpack_issues(_pack_issues(row_issues), df)
+
+        assert [i.model_dump() for i in unpacked] == [i.model_dump() for i in row_issues]
+
+
+class TestParallelFrameValidation:
+    """Test splitting one frame across pool workers."""
+
+    def test_matches_serial_validation(self):
+        """Test sharded validation gives the same result as the engine."""
+        engine = ValidatorEngine("configs")
+        df = pd.read_csv("samples/google_sample.csv")
+        serial, serial_fixes, _ = engine.validate_dataframe(df, auto_fix=True)
+
+        with ValidatorPool("configs", workers=2) as pool:
+            result, fixes, _ = pool.validate_dataframe(df, auto_fix=True, shard_rows=2)
+            limited, _, _ = pool.validate_dataframe(df, shard_rows=1, max_issues=1)
+
+        assert result.platform == serial.platform
+        assert result.summary == serial.summary
+        assert [i.model_dump() for i in result.issues] == [i.model_dump() for i in serial.issues]
+        assert fixes.patches == serial_fixes.patches
+        assert limited.partial and limited.rows_validated < len(df)
+        assert [i.issue_id for i in limited.issues] == [serial.issues[0].issue_id]
+
+    def test_custom_pipeline_in_parent(self):
+        """Test a caller's pipeline is sharded, and the parent keeps its own engine."""
+        from mojo_validator import worker_pool
+        engine = ValidatorEngine("configs")
+        df = pd.read_csv("samples/google_sample.csv")
+        rows_only = engine.pipeline.without("detecting_patterns")
+        serial, _, _ = engine.validate_dataframe(df, pipeline=rows_only)
+
+        with ValidatorPool("configs", workers=2) as pool:
+            worker_engine = worker_pool._WORKER_ENGINE
+            result, _, _ = pool.validate_dataframe(df, shard_rows=2, pipeline=rows_only)
+            assert worker_pool._WORKER_ENGINE is worker_engine
+            assert pool.engine is not worker_engine
+
+        assert [i.issue_id for i in result.issues] == [i.issue_id for i in serial.issues]
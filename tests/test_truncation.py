@@ -0,0 +1,55 @@
+"""
+Tests for smart truncation (see docs/SMART_TRUNCATION.md).
+"""
+
+import pytest
+import pandas as pd
+from mojo_validator.truncation import smart_truncate, smart_truncate_many
+
+
+class TestSmartTruncate:
+    """Test the word-boundary truncation algorithm."""
+    
+    def test_truncates_at_word_boundary(self):
+        """Test documented headline example."""
+        text = "This is a very long headline that definitely exceeds the 30 character limit"
+        assert smart_truncate(text, 30) == "This is a very long..."
+    
+    def test_keeps_meaning_in_long_copy(self):
+        """Test documented description example."""
+        text = "Transform your sales process with our intuitive CRM. Trusted by 50,000+ businesses worldwide."
+        result = smart_truncate(text, 90)
+        assert result == "Transform your sales process with our intuitive CRM. Trusted by 50,000+ businesses..."
+        assert len(result) <= 90
+    
+    def test_edge_cases(self):
+        """Test short limits, fitting text and missing word boundaries."""
+        assert smart_truncate("Hello World", 5) == "Hello"
+        assert smart_truncate("Buy Now", 30) == "Buy Now"
+        assert smart_truncate("Supercalifragilisticexpialidocious", 20) == "Supercalifragilis..."
+
+
+class TestSmartTruncateMany:
+    """Test batch truncation of a column."""
+    
+    def test_only_overlength_rows_are_returned(self):
+        """Test the batch result holds just the rows that needed truncation."""
+        long_text = "This is a very long headline that definitely exceeds the 30 character limit"
+        values = pd.Series(["Short", long_text, "Also short", long_text], index=[10, 11, 12, 13])
+        
+        result = smart_truncate_many(values, 30)
+        
+        assert list(result.index) == [11, 13]
+        assert result.tolist() == ["This is a very long..."] * 2
+    
+    def test_matches_scalar_truncation(self):
+        """Test batch and scalar results agree."""
+        values = pd.Series(["word " * 20, "x" * 50, "fits"])
+        result = smart_truncate_many(values, 40)
+        
+        for idx, truncated in result.items():
+            assert truncated == smart_truncate(values[idx], 40)
+    
+    def test_empty_when_nothing_overlength(self):
+        """Test no work is returned when all values fit."""
+        assert smart_truncate_many(pd.Series(["a", "b"]), 30).empty
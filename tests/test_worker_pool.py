@@ -0,0 +1,44 @@
+"""
+Tests for the pre-warmed validation worker pool.
+"""
+
+import os
+import pytest
+from mojo_validator import cli
+from mojo_validator.worker_pool import ValidatorPool, get_worker_engine
+
+
+class TestWorkerPool:
+    """Test worker start-up and reuse."""
+    
+    def test_worker_engine_is_warmed_and_reused(self):
+        """Test the per-process engine has configs loaded and is cached."""
+        engine = get_worker_engine(os.path.abspath("configs"))
+        
+        assert "Google Ads" in engine.config_loader.configs
+        assert get_worker_engine(os.path.abspath("configs")) is engine
+    
+    def test_pool_reused_across_batches(self, tmp_path):
+        """Test one pool serves several batches from the same workers."""
+        with ValidatorPool("configs", workers=2) as pool:
+            pids = pool.start()
+            assert len(set(pids)) == 2 and os.getpid() not in pids
+            
+            options = {
+                'config_dir': pool.config_dir, 'platform': None, 'auto_fix': False,
+                'output_dir': str(tmp_path), 'quiet': True,
+            }
+            first = cli.run_batch(["samples/google_sample.csv"], options, pool=pool)
+            second = cli.run_batch(["samples/meta_sample.csv"], options, pool=pool)
+            
+            assert first[0]['platform'] == "Google Ads"
+            assert second[0]['platform'] == "Meta Ads"
+            assert pool.start() == pids
+            assert {pool.submit(os.getpid).result() for _ in range(8)} <= set(pids)
+    
+    def test_start_requires_fresh_pool(self):
+        """Test start() refuses a pool that already has work, instead of waiting on busy workers."""
+        with ValidatorPool("configs", workers=2) as pool:
+            pool.submit(os.getpid).result()
+            with pytest.raises(RuntimeError):
+                pool.start()